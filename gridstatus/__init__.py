@@ -1,3 +1,5 @@
+import importlib
+
 from gridstatus.version import __version__
 
 from gridstatus.utils import (
@@ -5,8 +7,8 @@ from gridstatus.utils import (
     get_iso,
     make_availability_table,
     get_interconnection_queues,
+    fetch_all,
 )
-from gridstatus import tests
 import gridstatus.base
 import gridstatus.decorators
 
@@ -14,21 +16,50 @@ from gridstatus.base import Markets, NotSupported, NoDataFoundException
 
 import gridstatus.utils
 
-import gridstatus.viz
-
 from gridstatus.utils import load_folder
 
-from gridstatus.nyiso import NYISO
-from gridstatus.caiso import CAISO
-from gridstatus.ercot import Ercot
-from gridstatus.isone import ISONE
-from gridstatus.miso import MISO
-from gridstatus.spp import SPP
-from gridstatus.pjm import PJM
-from gridstatus.eia import EIA
-from gridstatus.ieso import IESO
+# ISO classes, plotting and test helpers are imported on first attribute access
+# (PEP 562) so that `import gridstatus` doesn't pay for every ISO module and
+# heavy optional dependencies like plotly
+_LAZY_ATTRIBUTES = {
+    "NYISO": "gridstatus.nyiso",
+    "CAISO": "gridstatus.caiso",
+    "Ercot": "gridstatus.ercot",
+    "ISONE": "gridstatus.isone",
+    "MISO": "gridstatus.miso",
+    "SPP": "gridstatus.spp",
+    "PJM": "gridstatus.pjm",
+    "EIA": "gridstatus.eia",
+    "IESO": "gridstatus.ieso",
+    "Store": "gridstatus.store",
+    "PrefetchScheduler": "gridstatus.scheduler",
+}
+
+_LAZY_SUBMODULES = {"viz", "tests"}
+
+_ALL_ISOS_ORDER = ["NYISO", "CAISO", "Ercot", "ISONE", "MISO", "SPP", "PJM", "IESO"]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"gridstatus.{name}")
+    elif name == "all_isos":
+        value = [__getattr__(iso) for iso in _ALL_ISOS_ORDER]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache so __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
 
-all_isos = [NYISO, CAISO, Ercot, ISONE, MISO, SPP, PJM, IESO]
+def __dir__():
+    return sorted(
+        set(globals()) | set(_LAZY_ATTRIBUTES) | _LAZY_SUBMODULES | {"all_isos"},
+    )
 
 
 __all__ = [
@@ -45,4 +76,7 @@ __all__ = [
     "list_isos",
     "NotSupported",
     "load_folder",
+    "fetch_all",
+    "Store",
+    "PrefetchScheduler",
 ]
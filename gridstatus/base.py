@@ -1,10 +1,14 @@
+import contextvars
+import threading
 import time
+from collections import OrderedDict
 from enum import Enum
 from typing import BinaryIO
 
 import pandas as pd
 import requests
 
+from gridstatus import single_flight
 from gridstatus.gs_logging import logger
 
 # TODO: this is needed to make SPP request work. restrict only to SPP
@@ -88,6 +92,19 @@ _interconnection_columns = [
 ]
 
 
+# Polling interval used by ISOBase.watch if one can't be inferred from the data
+DEFAULT_WATCH_INTERVAL = pd.Timedelta(minutes=5)
+
+# Number of responses kept per ISO instance for conditional requests
+CONDITIONAL_CACHE_SIZE = 32
+
+# Makes _get_json requests conditional in the current thread, e.g. while
+# ISOBase.watch calls a method, without changing the instance for other threads
+_conditional_requests = contextvars.ContextVar("conditional_requests", default=False)
+
+_conditional_cache_lock = threading.Lock()
+
+
 class ISOBase:
     markets = []
     status_homepage = None
@@ -95,9 +112,38 @@ class ISOBase:
 
     default_timezone = None
 
+    # If True, _get_json sends the ETag/Last-Modified validators of the previous
+    # response for the same request and reuses that response when the server
+    # replies 304 Not Modified. Always enabled for the calls made by watch()
+    conditional_requests = False
+
+    # Identical requests made by _get_json while one is in flight share its
+    # response. Set this to also reuse the response for requests made up to this
+    # many seconds after it is received, e.g. when many threads poll the same url
+    request_memo_seconds = 0
+
     def local_now(self):
         return pd.Timestamp.now(tz=self.default_timezone)
 
+    @classmethod
+    def schema(cls, method: str):
+        """Returns the declared column names and types of a method's output,
+        e.g. to create tables before fetching data.
+
+        Arguments:
+            method (str): name of the method, e.g. "get_spp"
+
+        Returns:
+            gridstatus.schemas.Schema: schema with timestamps in the ISO's
+            default timezone
+
+        Raises:
+            NotSupported: if the method doesn't declare a schema
+        """
+        from gridstatus.schemas import output_schema
+
+        return output_schema.get(cls, method)
+
     def _get_json(
         self,
         url: str,
@@ -125,7 +171,14 @@ class ISOBase:
         while attempt < max_attempts:
             try:
                 logger.info(f"Requesting {url} with {kwargs}")
-                r = requests.get(url, **kwargs)
+                if self.conditional_requests or _conditional_requests.get():
+                    r = self._conditional_get(url, **kwargs)
+                else:
+                    r = single_flight.get(
+                        url,
+                        memo_seconds=self.request_memo_seconds,
+                        **kwargs,
+                    )
                 r.raise_for_status()  # Raise an error for HTTP error codes
                 return r.json()
             except requests.RequestException as e:
@@ -138,6 +191,163 @@ class ISOBase:
                 )
                 time.sleep(wait_time)
 
+    def _conditional_get(self, url: str, **kwargs) -> requests.Response:
+        """Makes a get request, revalidating any previous response for the same
+        request with If-None-Match/If-Modified-Since. Returns the previous
+        response if the server replies 304 Not Modified."""
+        with _conditional_cache_lock:
+            cache = self.__dict__.setdefault("_conditional_cache", OrderedDict())
+            key = (url, repr(kwargs.get("params")))
+            cached = cache.get(key)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        r = requests.get(url, headers=headers, **kwargs)
+
+        if r.status_code == 304 and cached is not None:
+            logger.debug(f"{url} not modified, reusing previous response")
+            with _conditional_cache_lock:
+                if key in cache:
+                    cache.move_to_end(key)
+            return cached[2]
+
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        if r.ok and (etag or last_modified):
+            with _conditional_cache_lock:
+                cache[key] = (etag, last_modified, r)
+                cache.move_to_end(key)
+                while len(cache) > CONDITIONAL_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return r
+
+    def watch(
+        self,
+        method,
+        date="today",
+        interval: pd.Timedelta | str | None = None,
+        max_polls: int | None = None,
+        error: str = "ignore",
+        latest: bool = True,
+        **kwargs,
+    ):
+        """Polls a method and yields only the rows that weren't seen in a previous
+        poll, e.g. to feed a real time dashboard.
+
+        Polls happen at the publish cadence of the data, which is inferred from
+        the interval length of the returned rows unless ``interval`` is given.
+        If a poll has no new rows, it is retried after a quarter of the
+        interval. While watching, JSON requests are made conditionally so an
+        unchanged resource isn't downloaded again.
+
+        Example:
+            for df in iso.watch("get_fuel_mix"):
+                write(df)
+
+        Arguments:
+            method (str, callable): name of the method to poll or the method
+                itself. Must return a DataFrame with an "Interval Start" or
+                "Time" column.
+            date (str): date to request on the first poll, and whenever polls
+                of the latest data leave a gap. Defaults to "today" so that
+                intervals published between polls aren't missed.
+            interval (pd.Timedelta, str, optional): time between polls.
+                Defaults to the interval length of the data.
+            max_polls (int, optional): stop after this many polls. Defaults to
+                polling forever.
+            error (str, optional): "ignore" to log failed polls and keep
+                polling, or "raise". Defaults to "ignore".
+            latest (bool, optional): after the first poll, request
+                date="latest", which most methods serve without downloading
+                the whole day. Methods that raise NotSupported,
+                NotImplementedError or ValueError for "latest" are polled with
+                date. Other errors are failed polls. Defaults to True.
+            **kwargs: additional arguments passed to the method
+
+        Yields:
+            pandas.DataFrame: rows newer than any previously yielded row
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+
+        if interval is not None:
+            interval = pd.Timedelta(interval)
+
+        last_seen = None
+        polls = 0
+        poll_date = date
+        latest_supported = False
+
+        while max_polls is None or polls < max_polls:
+            polls += 1
+
+            try:
+                df = None
+                if poll_date == "latest" and not latest_supported:
+                    # whether the method supports it is only known once it works
+                    df = _poll_latest(method, **kwargs)
+                    latest_supported = df is not None
+                    if not latest_supported:
+                        logger.info(f"Watching {method.__name__} with date={date}")
+                        latest = False
+                        poll_date = date
+                if df is None:
+                    df = _call_conditionally(method, date=poll_date, **kwargs)
+            except Exception as e:
+                if error == "raise":
+                    raise
+                logger.warning(f"Polling {method.__name__} failed with {e}")
+                df = None
+
+            time_col = None
+            if df is not None:
+                if not isinstance(df, pd.DataFrame):
+                    raise NotSupported(
+                        f"Cannot watch {method.__name__}, "
+                        "it does not return a DataFrame",
+                    )
+                time_col = _get_time_column(df)
+
+            if poll_date == "latest" and _has_gap(df, time_col, last_seen, interval):
+                # rows were published between polls, so request all of date
+                poll_date = date
+                polls -= 1
+                continue
+
+            new_rows = None
+            if df is not None:
+                if last_seen is not None:
+                    df = df[df[time_col] > last_seen]
+
+                if len(df) > 0:
+                    new_rows = df.reset_index(drop=True)
+                    last_seen = new_rows[time_col].max()
+
+                    if interval is None:
+                        interval = _infer_interval(new_rows, time_col)
+
+                if latest:
+                    poll_date = "latest"
+
+            if new_rows is not None:
+                yield new_rows
+
+            if max_polls is not None and polls >= max_polls:
+                break
+
+            wait = interval if interval is not None else DEFAULT_WATCH_INTERVAL
+            if new_rows is None:
+                wait = wait / 4
+
+            time.sleep(wait.total_seconds())
+
     def get_status(self, date, end=None, verbose=False):
         raise NotImplementedError()
 
@@ -182,6 +392,64 @@ class ISOBase:
         return latest.to_dict()
 
 
+def _call_conditionally(method, **kwargs):
+    token = _conditional_requests.set(True)
+    try:
+        return method(**kwargs)
+    finally:
+        _conditional_requests.reset(token)
+
+
+# Exceptions methods raise when they don't support an argument, e.g. "latest"
+UNSUPPORTED_ARGUMENT_ERRORS = (NotSupported, NotImplementedError, ValueError)
+
+
+def _poll_latest(method, **kwargs):
+    """Latest data of method, or None if it doesn't support date="latest".
+    Other errors are raised."""
+    try:
+        df = _call_conditionally(method, date="latest", **kwargs)
+    except UNSUPPORTED_ARGUMENT_ERRORS as e:
+        logger.info(f"{method.__name__} does not support date='latest': {e!r}")
+        return None
+
+    if not isinstance(df, pd.DataFrame):
+        return None
+    try:
+        _get_time_column(df)
+    except NotSupported:
+        return None
+    return df
+
+
+def _has_gap(df, time_col, last_seen, interval):
+    """Whether the rows of df don't continue from last_seen"""
+    if df is None or last_seen is None or interval is None or len(df) == 0:
+        return False
+    return df[time_col].min() > last_seen + interval
+
+
+def _get_time_column(df):
+    for col in ["Interval Start", "Time"]:
+        if col in df.columns:
+            return col
+
+    raise NotSupported("DataFrame has no 'Interval Start' or 'Time' column")
+
+
+def _infer_interval(df, time_col):
+    """Infers the publish cadence of data from its interval length"""
+    if "Interval End" in df.columns and time_col == "Interval Start":
+        lengths = df["Interval End"] - df["Interval Start"]
+    else:
+        lengths = df[time_col].drop_duplicates().sort_values().diff().dropna()
+
+    if len(lengths) == 0:
+        return None
+
+    return lengths.median()
+
+
 class GridStatus:
     def __init__(self, time, status, reserves, iso, notes=None, unit="MW") -> None:
         self.iso = iso
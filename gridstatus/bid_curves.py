@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+
+
+class GroupedCurves:
+    """Rows of a DataFrame grouped into curves (e.g. the MW/price steps of an
+    offer curve for each hour) without a Python call per group.
+
+    Rows are sorted by group once and each group is a contiguous slice of
+    values, delimited by offsets, so curves can be turned into list columns or
+    summarized with NumPy reductions.
+
+    Groups and the order of rows within them match
+    df.groupby(by, sort=True, dropna=dropna).
+
+    Arguments:
+        df (pandas.DataFrame): one row per point of a curve
+        by (list[str]): columns identifying a curve
+        columns (list[str]): columns holding the values of each point
+        dropna (bool): if False, missing keys form their own groups.
+            Defaults to True.
+
+    Example:
+        curves = GroupedCurves(
+            df,
+            by=["Delivery Date", "Hour Ending"],
+            columns=["MW Offered", "REGUP Offer Price"],
+        )
+        curves.to_frame("Bid Curve - REGUP")
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        by: list[str],
+        columns: list[str],
+        dropna: bool = True,
+    ):
+        self.by = list(by)
+        self.columns = list(columns)
+
+        groups = df.groupby(self.by, sort=True, dropna=dropna)
+        codes = groups.ngroup().to_numpy()
+        # dropped groups have a code of -1
+        order = np.argsort(codes, kind="stable")
+        order = order[codes[order] >= 0]
+        codes = codes[order]
+
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        self.offsets = np.append(starts, len(codes))
+        # kept per column so each keeps its own dtype
+        self._values = {c: df[c].to_numpy()[order] for c in self.columns}
+        # keys as groupby returns them, e.g. with None as NaN
+        self.keys = groups.size().index.to_frame(index=False)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of points in each curve"""
+        return np.diff(self.offsets)
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of a column for every point, in curve order"""
+        return self._values[name]
+
+    def to_lists(self, columns: list[str] | None = None) -> list[list]:
+        """Returns each curve as a list of points. Points are tuples of the
+        values in columns, or the values themselves for a single column."""
+        if columns is None:
+            columns = self.columns
+
+        if len(columns) == 1:
+            points = self.column(columns[0]).tolist()
+        else:
+            # one tolist call converts every value to a Python object at once.
+            # Like DataFrame.values, columns are cast to a common dtype
+            values = np.column_stack([self.column(c) for c in columns])
+            points = list(map(tuple, values.tolist()))
+
+        return [
+            points[start:end]
+            for start, end in zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist())
+        ]
+
+    def to_frame(self, name: str, columns: list[str] | None = None) -> pd.DataFrame:
+        """Returns the group keys with a list column of curves named name"""
+        df = self.keys.copy()
+        df[name] = self.to_lists(columns)
+        return df
+
+    def first(self, name: str) -> np.ndarray:
+        """First value of a column in each curve"""
+        return self.column(name)[self.offsets[:-1]]
+
+    def sum(self, name: str, where: np.ndarray | None = None) -> np.ndarray:
+        """Sum of a column in each curve, skipping missing values.
+
+        Arguments:
+            name (str): column to sum
+            where (numpy.ndarray, optional): boolean mask of points to include
+        """
+        values = pd.to_numeric(self.column(name))
+        missing = pd.isna(values)
+        if where is not None:
+            missing |= ~where
+        if missing.any():
+            values = np.where(missing, 0, values)
+
+        if len(values) == 0:
+            return values
+        return np.add.reduceat(values, self.offsets[:-1])
+
+    def quantity_at_price(
+        self,
+        price: float | np.ndarray,
+        quantity: str,
+        price_column: str,
+    ) -> np.ndarray:
+        """Total quantity offered at or below price in each curve, e.g. the MW
+        that would clear at a market clearing price.
+
+        Arguments:
+            price (float, numpy.ndarray): a price for all curves or one price
+                per curve
+            quantity (str): column with the quantity of each point
+            price_column (str): column with the price of each point
+        """
+        price = np.asarray(price, dtype=float)
+        if price.ndim:
+            price = np.repeat(price, self.lengths)
+
+        prices = pd.to_numeric(self.column(price_column)).astype(float)
+        return self.sum(quantity, where=prices <= price)
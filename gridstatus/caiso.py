@@ -1,16 +1,17 @@
 import copy
 import io
+import json
+import os
+import tempfile
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stderr
-from zipfile import ZipFile
+from zipfile import BadZipFile, ZipFile, is_zipfile
 
 import numpy as np
 import pandas as pd
 import requests
-import tabula
-from tabulate import tabulate
-from termcolor import colored
 
 from gridstatus import caiso_utils, utils
 from gridstatus.base import (
@@ -20,8 +21,12 @@ from gridstatus.base import (
     NoDataFoundException,
     NotSupported,
 )
-from gridstatus.decorators import support_date_range
-from gridstatus.gs_logging import logger
+from gridstatus.decorators import (
+    DayBeginOffset,
+    date_range_boundaries,
+    support_date_range,
+)
+from gridstatus.gs_logging import log, logger
 from gridstatus.lmp_config import lmp_config
 
 CURRENT_BASE = "https://www.caiso.com/outlook/current"
@@ -30,6 +35,12 @@ HISTORY_BASE = "https://www.caiso.com/outlook/history"
 DAY_AHEAD_MARKET_MARKET_RUN_ID = "DAM"
 REAL_TIME_DISPATCH_MARKET_RUN_ID = "RTD"
 
+# Curtailment reports downloaded at the same time by CAISO.get_curtailment
+MAX_CURTAILMENT_DOWNLOADS = 8
+
+# Types of OASIS value columns, so files without rows don't upcast them to object
+OASIS_DTYPES = {"MW": "float64", "PRC": "float64", "VALUE": "float64"}
+
 OASIS_DATASET_CONFIG = {
     "transmission_interface_usage": {
         "query": {
@@ -438,6 +449,8 @@ class CAISO(ISOBase):
         Args:
             dataset (str, optional): dataset to return data for. If None, returns all datasets.
         """
+        from tabulate import tabulate
+        from termcolor import colored
 
         for dataset_name, config in OASIS_DATASET_CONFIG.items():
             if dataset is not None and dataset_name not in dataset:
@@ -585,11 +598,13 @@ class CAISO(ISOBase):
 
         retry_num = 0
         while retry_num < 3:
-            r = requests.get(url)
+            r = requests.get(url, stream=True)
 
             if r.status_code == 200:
                 break
 
+            r.close()
+
             retry_num += 1
             logger.error(f"Failed to get data from CAISO. Error: {r.status_code}")
             logger.error(f"Retrying {retry_num}...")
@@ -599,21 +614,33 @@ class CAISO(ISOBase):
         if (
             "Content-Disposition" not in r.headers
             or ".xml.zip;" in r.headers["Content-Disposition"]
-            or b".xml" in r.content
         ):
+            r.close()
             # avoid rate limiting
             time.sleep(sleep)
             return None
 
-        z = ZipFile(io.BytesIO(r.content))
+        body = utils.spool_response(r)
+
+        # this is also when no data is available. the response is an xml file,
+        # which is usually zipped
+        if is_zipfile(body):
+            z = ZipFile(body)
+            is_xml = any(".xml" in name for name in z.namelist())
+        else:
+            body.seek(0)
+            is_xml = b".xml" in body.read()
+            if not is_xml:
+                raise BadZipFile(f"Response from {url} is not a zip file")
+
+        if is_xml:
+            # avoid rate limiting
+            time.sleep(sleep)
+            return None
 
         # parse and concat all files
-        dfs = []
         logger.debug(f"Found {len(z.namelist())} files: {z.namelist()}")
-        for f in z.namelist():
-            logger.debug(f"Parsing file: {f}")
-            df = pd.read_csv(z.open(f))
-            dfs.append(df)
+        dfs = utils.read_zip_csvs(z, names=z.namelist(), dtype=OASIS_DTYPES)
 
         df = pd.concat(dfs)
 
@@ -1719,11 +1746,14 @@ class CAISO(ISOBase):
 
         return queue
 
-    @support_date_range(frequency="DAY_START")
+    @support_date_range(frequency=None)
     def get_curtailment(
         self,
         date: str | pd.Timestamp,
+        end: str | pd.Timestamp | None = None,
         verbose: bool = False,
+        cache_dir: str | None = None,
+        error: str = "ignore",
     ) -> pd.DataFrame:
         """Return curtailment data for a given date
 
@@ -1740,51 +1770,127 @@ class CAISO(ISOBase):
 
             verbose: print out url being fetched. Defaults to False.
 
+            cache_dir (str, optional): directory to cache the parsed report of
+                each day in. Reports for past days never change, so they are
+                read from the cache instead of downloaded and parsed again.
+                Requires pyarrow.
+
+            error (str, optional): for a range, "ignore" to skip days without
+                a report or "raise" to raise for the first of them.
+                Defaults to "ignore".
+
         Returns:
             pandas.DataFrame: A DataFrame of curtailment data
         """
         # round to beginning of day
         date = date.normalize()
 
-        # todo handle not always just 4th pge
-        date_str = date.strftime("%b-%d-%Y").lower()
-
-        pdf = None
-        base_url = "http://www.caiso.com/documents/wind-solar-real-time-dispatch-curtailment-report-"  # noqa
+        if end is None:
+            days = [date]
+        else:
+            days = [
+                day.normalize()
+                for day in date_range_boundaries(date, end, DayBeginOffset())[:-1]
+            ]
 
-        # Base url and date string format change for dates prior to May 31, 2024
-        if date < pd.Timestamp("2024-05-31", tz=date.tzinfo):
-            base_url = "https://www.caiso.com/documents/wind_solarreal-timedispatchcurtailmentreport"  # noqa
+        cache_paths = {}
+        if cache_dir is not None:
+            utils.require_pyarrow("cache_dir")
 
-            date_str = date.strftime("%b%d_%Y").lower()
+            today = pd.Timestamp.now(tz=self.default_timezone).normalize()
+            cache_paths = {
+                day: _curtailment_cache_path(cache_dir, day)
+                for day in days
+                # today's report may not be published or complete yet
+                if day < today
+            }
 
-        # # handle specfic case where dec 02, 2021 has wrong year in file name
-        if date_str == "dec02_2021":
-            date_str = "02dec_2020"
+        dfs = {}
+        for day, cache_path in cache_paths.items():
+            if os.path.exists(cache_path):
+                log(f"Reading cached {cache_path}", verbose)
+                dfs[day] = pd.read_parquet(cache_path)
+
+        to_fetch = [day for day in days if day not in dfs]
+        if to_fetch:
+            for day, df in self._fetch_curtailment(to_fetch).items():
+                if isinstance(df, Exception):
+                    # a range skips days without a report, like the other
+                    # methods supporting date ranges do by default
+                    if end is None or error == "raise":
+                        raise df
+                    logger.warning(f"Could not get curtailment for {day}: {df}")
+                    continue
+
+                dfs[day] = df
+                if day in cache_paths:
+                    _write_parquet(cache_paths[day], df)
+
+        if not dfs:
+            raise ValueError(
+                f"Could not find curtailment PDFs from {date} to {end}",
+            )
 
-        url = f"{base_url}{date_str}.pdf"
+        return pd.concat(
+            [dfs[day] for day in days if day in dfs],
+            ignore_index=True,
+        )
 
-        logger.info(f"Fetching URL: {url}")
+    def _fetch_curtailment(self, days: list) -> dict:
+        """Downloads and parses the curtailment reports for days.
 
-        r = requests.get(url)
-        if r.status_code == 404:
-            raise ValueError(
-                f"Could not find curtailment PDF for {date}",
-            )
-        pdf = io.BytesIO(r.content)
+        Reports are downloaded concurrently and the tables of all of them are
+        extracted with a single tabula call, which only starts java once.
+        Returns a dict of day to the parsed report, or to the exception raised
+        while getting it.
+        """
+        results = {}
 
-        if pdf is None:
-            raise ValueError(
-                "Could not find curtailment PDF for {}".format(date),
-            )
+        with tempfile.TemporaryDirectory() as pdf_dir:
 
-        with io.StringIO() as buf, redirect_stderr(buf):
-            try:
-                tables = tabula.read_pdf(pdf, pages="all")
-            except Exception:
-                print(buf.getvalue())
-                raise RuntimeError("Problem Reading PDF")
+            def _download(day):
+                url = _curtailment_url(day)
+                logger.info(f"Fetching URL: {url}")
 
+                r = requests.get(url)
+                if r.status_code == 404:
+                    raise ValueError(
+                        f"Could not find curtailment PDF for {day}",
+                    )
+                r.raise_for_status()
+
+                path = os.path.join(pdf_dir, day.strftime("%Y-%m-%d") + ".pdf")
+                with open(path, "wb") as f:
+                    f.write(r.content)
+                return path
+
+            pdf_paths = {}
+            with ThreadPoolExecutor(
+                max_workers=min(len(days), MAX_CURTAILMENT_DOWNLOADS),
+            ) as executor:
+                futures = {day: executor.submit(_download, day) for day in days}
+                for day, future in futures.items():
+                    try:
+                        pdf_paths[day] = future.result()
+                    except Exception as e:
+                        results[day] = e
+
+            if pdf_paths:
+                tables = _read_pdf_tables(pdf_dir, list(pdf_paths.values()))
+
+            for day, path in pdf_paths.items():
+                try:
+                    if isinstance(tables[path], Exception):
+                        raise tables[path]
+                    results[day] = self._parse_curtailment_tables(day, tables[path])
+                except Exception as e:
+                    results[day] = e
+
+        return results
+
+    @staticmethod
+    def _parse_curtailment_tables(date, tables):
+        """Parses the tables extracted from the curtailment report for date"""
         index_curtailment_table = list(
             map(lambda df: "FUEL TYPE" in df.columns, tables),
         ).index(True)
@@ -2247,3 +2353,125 @@ class CAISO(ISOBase):
         df.columns.name = None
 
         return df
+
+
+def _curtailment_url(date):
+    # todo handle not always just 4th pge
+    date_str = date.strftime("%b-%d-%Y").lower()
+
+    base_url = "http://www.caiso.com/documents/wind-solar-real-time-dispatch-curtailment-report-"  # noqa
+
+    # Base url and date string format change for dates prior to May 31, 2024
+    if date < pd.Timestamp("2024-05-31", tz=date.tzinfo):
+        base_url = "https://www.caiso.com/documents/wind_solarreal-timedispatchcurtailmentreport"  # noqa
+
+        date_str = date.strftime("%b%d_%Y").lower()
+
+    # # handle specfic case where dec 02, 2021 has wrong year in file name
+    if date_str == "dec02_2021":
+        date_str = "02dec_2020"
+
+    return f"{base_url}{date_str}.pdf"
+
+
+def _curtailment_cache_path(cache_dir, date):
+    return os.path.join(
+        os.path.expanduser(cache_dir),
+        "caiso",
+        "curtailment",
+        date.strftime("%Y-%m-%d") + ".parquet",
+    )
+
+
+def _write_parquet(path, df):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    utils.write_atomic(path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+
+
+def _tables_from_tabula_json(raw_json):
+    """Converts the tables tabula-java writes as JSON to DataFrames the way
+    tabula.read_pdf does: the first row is the header, empty cells are NaN
+    and columns that are all numbers are converted to numbers."""
+    tables = []
+    for table in raw_json:
+        rows = [[cell["text"] or np.nan for cell in row] for row in table["data"]]
+        if not rows:
+            continue
+
+        df = _normalize_table_columns(pd.DataFrame(rows[1:], columns=rows[0]))
+        for column in df.columns:
+            try:
+                df[column] = pd.to_numeric(df[column])
+            except (ValueError, TypeError):
+                pass
+        tables.append(df)
+
+    return tables
+
+
+def _normalize_table_columns(df):
+    """Names the columns of a table read from a PDF like tabula does, so tables
+    have the same columns however they were read: empty names are
+    "Unnamed: 0", "Unnamed: 1", ... and repeated names get a ".1", ".2", ...
+    suffix"""
+    columns = []
+    unnamed = 0
+    for column in df.columns:
+        if pd.isna(column) or column == "":
+            column = f"Unnamed: {unnamed}"
+            unnamed += 1
+        columns.append(column)
+
+    counts = {}
+    for i, column in enumerate(columns):
+        count = counts.get(column, 0)
+        # the suffixed name may itself be a column name
+        while count > 0:
+            counts[column] = count + 1
+            column = f"{column}.{count}"
+            count = counts.get(column, 0)
+        columns[i] = column
+        counts[column] = count + 1
+
+    df.columns = columns
+    return df
+
+
+def _read_pdf_tables(pdf_dir, pdf_paths):
+    """Extracts the tables of every PDF in pdf_dir, returning a dict of path in
+    pdf_paths to its list of tables.
+
+    tabula starts java for every call, which takes a few seconds, so the whole
+    directory is converted in one batch. If the batch fails, e.g. because of one
+    bad file, each PDF is read on its own and the exception raised for a PDF is
+    returned in place of its tables.
+    """
+    # tabula starts a JVM and is slow to import, so only load it when needed
+    import tabula
+
+    with io.StringIO() as buf, redirect_stderr(buf):
+        try:
+            tabula.convert_into_by_batch(pdf_dir, output_format="json", pages="all")
+            tables = {}
+            for path in pdf_paths:
+                with open(path[: -len(".pdf")] + ".json") as f:
+                    tables[path] = _tables_from_tabula_json(json.load(f))
+            return tables
+        except Exception:
+            logger.warning(
+                f"Could not read PDFs in one batch, reading each one: {buf.getvalue()}",
+            )
+
+    tables = {}
+    for path in pdf_paths:
+        with io.StringIO() as buf, redirect_stderr(buf):
+            try:
+                tables[path] = [
+                    _normalize_table_columns(df)
+                    for df in tabula.read_pdf(path, pages="all")
+                ]
+            except Exception:
+                print(buf.getvalue())
+                tables[path] = RuntimeError("Problem Reading PDF")
+
+    return tables
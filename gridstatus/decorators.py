@@ -1,45 +1,161 @@
 import functools
+import inspect
 import os
 import pprint
+import time
 
 import pandas as pd
+import requests
 import tqdm
 
 from gridstatus import utils
-from gridstatus.base import Markets
+from gridstatus.base import Markets, NotSupported
+from gridstatus.gs_logging import logger
 
 
-def _get_args_dict(fn, args, kwargs):
-    args_names = fn.__code__.co_varnames[: fn.__code__.co_argcount]
+def _get_args_dict(fn, args, kwargs, args_names=None):
+    if args_names is None:
+        args_names = _get_args_names(fn)
     return {**dict(zip(args_names, args)), **kwargs}
 
 
-# make custom function rather than using pd.date_range
-# due to handling of localized timezones
+def _get_args_names(fn):
+    # names of the original method's arguments, e.g. under output_schema
+    code = inspect.unwrap(fn).__code__
+    return code.co_varnames[: code.co_argcount]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_args(fn):
+    return {
+        name: param.default
+        for name, param in inspect.signature(fn).parameters.items()
+        if param.default is not inspect.Parameter.empty
+    }
+
+
 def date_range_maker(start, end, freq, inclusive="neither"):
     """Generate a date range based on start and end dates and a frequency."""
     # implement other behavior
     # if/when needed
     assert inclusive == "neither"
 
-    if isinstance(freq, str):
-        freq = pd.tseries.frequencies.to_offset(freq)
+    return list(date_range_boundaries(start, end, freq)[1:-1])
 
-    # Generate the date range
-    current_date = start + freq
 
-    dates = []
-    while current_date < end:
-        dates.append(current_date)
-        current_date += freq
+def date_range_boundaries(start, end, freq) -> pd.DatetimeIndex:
+    """Splits start to end into ranges of freq. Returns the boundaries of the
+    ranges, starting with start and ending with end, so consecutive
+    boundaries are the (start, end) of each range.
+
+    The boundaries are the same as repeatedly adding freq to start, but are
+    computed with DatetimeIndex arithmetic:
+
+        - FiveMinOffset and HourBeginOffset round up to the next 5 minutes or
+          hour in UTC, so every interval is the same length across DST
+        - DayBeginOffset, MonthBeginOffset and YearBeginOffset step through
+          local midnights
+        - fixed length frequencies such as "31D" add absolute time
+    """
+    if isinstance(freq, str):
+        freq = pd.tseries.frequencies.to_offset(freq)
 
-    return dates
+    tz = start.tz
+
+    if isinstance(freq, (FiveMinOffset, HourBeginOffset)):
+        step = "5min" if isinstance(freq, FiveMinOffset) else "h"
+        # add 1 microsecond to get to the next interval when already on one
+        first = (start.tz_convert("UTC") + pd.Timedelta(microseconds=1)).ceil(step)
+        inner = pd.date_range(
+            first,
+            end.tz_convert("UTC"),
+            freq=step,
+        ).tz_convert(tz)
+
+    elif isinstance(freq, (DayBeginOffset, MonthBeginOffset, YearBeginOffset)):
+        # step through local midnights in wall time
+        inner = pd.date_range(
+            (start + freq).tz_localize(None),
+            end.tz_localize(None),
+            freq=freq.pandas_freq,
+        ).tz_localize(tz)
+
+    elif isinstance(freq, pd.offsets.Tick):
+        # adding a Tick is absolute time, so step in UTC
+        inner = pd.date_range(
+            start.tz_convert("UTC") + freq,
+            end.tz_convert("UTC"),
+            freq=freq,
+        ).tz_convert(tz)
+
+    else:
+        # other offsets, such as weekly, are rare and span few ranges
+        inner = []
+        current_date = start + freq
+        while current_date < end:
+            inner.append(current_date)
+            current_date += freq
+        inner = pd.DatetimeIndex(inner, dtype=pd.DatetimeTZDtype(tz=tz))
+
+    # only boundaries before end. compare as instants since end may be
+    # ambiguous in wall time
+    inner = inner[inner < end]
+
+    return pd.DatetimeIndex([start]).append(inner).append(pd.DatetimeIndex([end]))
+
+
+# Keyword arguments consumed by support_date_range rather than the decorated method
+DATE_RANGE_KWARGS = (
+    "save_to",
+    "error",
+    "stream",
+    "store",
+    "adaptive",
+    "fill_gaps",
+)
+
+STREAM_OPTIONS = (False, True, "with_bounds")
+
+# DataFrame.attrs that are kept when the requests of a date range are
+# concatenated, mapped to the function that merges the values of each request.
+# pd.concat drops attrs that differ between DataFrames
+MERGED_ATTRS = {}
 
 
 # TODO(kladar): Add support for date or start to be in args OR kwargs dict as well, since some APIs have
 # current or latest endpoints that are automatically handled. Currently cannot refactor this confidently
 # without improved testing since it touches many methods
 class support_date_range:
+    """Splits a date range into requests of at most ``frequency`` and calls the
+    decorated method once per request.
+
+    In addition to their own arguments, decorated methods accept:
+
+        save_to (str): folder to save each request's result to as a csv
+        error (str): "ignore" (default) to skip failed requests or "raise".
+            Methods that declare an error argument also receive it, e.g. to
+            handle the days of a range they fetch in one request.
+        store (gridstatus.Store): local store to read requests from if already
+            stored and to save fetched requests to. A single date is treated
+            as a request for that day. Ignored for date="latest".
+        fill_gaps (bool): with store, request every range that has intervals
+            without stored rows (see Store.find_gaps), even if it was requested
+            before, and read the other ranges from the store. Ranges are the
+            same requests as without a store.
+        stream (bool | str): if True, return a generator that yields each
+            request's DataFrame as soon as it is ready instead of concatenating
+            them, so only one request's data is held in memory. If
+            "with_bounds", yield (start, end, df) tuples instead. end is None
+            when no end date was given.
+        adaptive (bool | dict): if True, resize requests based on how long
+            the previous request took and how much data it returned, using
+            ``frequency`` as the largest request size. Requests are shrunk
+            and retried if they time out. A dict is passed to
+            ``AdaptiveChunkSize`` to change its targets. Only applies to
+            methods with a fixed length frequency such as "31D" that take an
+            end date, other methods ignore it.
+    """
+
     def __init__(self, frequency, update_dates=None, return_raw=False):
         """Maximum frequency of ranges. if None, then no new ranges are created."""
         self.frequency = frequency
@@ -47,9 +163,24 @@ class support_date_range:
         self.return_raw = return_raw
 
     def __call__(self, f):
+        args_names = _get_args_names(f)
+        schema = getattr(f, "output_schema", None)
+
         @functools.wraps(f)
         def wrapped_f(*args, **kwargs):
-            args_dict = _get_args_dict(f, args, kwargs)
+            stream = kwargs.pop("stream", False)
+            if stream not in STREAM_OPTIONS:
+                raise ValueError(
+                    "Invalid value for stream: {}. Must be one of {}".format(
+                        stream,
+                        STREAM_OPTIONS,
+                    ),
+                )
+
+            adaptive = kwargs.pop("adaptive", False)
+            fill_gaps = kwargs.pop("fill_gaps", False)
+
+            args_dict = _get_args_dict(f, args, kwargs, args_names)
 
             # delete end if None to avoid attribute error
             if "end" in args_dict and not args_dict["end"]:
@@ -61,9 +192,18 @@ class support_date_range:
                 os.makedirs(save_to, exist_ok=True)
 
             error = "ignore"
-            errors = []
             if "error" in args_dict:
                 error = args_dict.pop("error")
+            if "error" in args_names:
+                args_dict["error"] = error
+
+            store = args_dict.pop("store", None)
+            if store is not None and self.return_raw:
+                raise NotSupported(
+                    "store is not supported for function {}".format(f),
+                )
+            if fill_gaps and store is None:
+                raise ValueError("fill_gaps requires a store")
 
             # if date is a tuple, then change to start and end
             if "date" in args_dict and isinstance(args_dict["date"], tuple):
@@ -90,7 +230,13 @@ class support_date_range:
                 del args_dict["start"]
 
             if args_dict["date"] == "latest":
-                return f(*args, **kwargs)
+                # latest data is still being published, so it isn't stored
+                if stream:
+                    return _stream_chunks(
+                        _iter_single(f, (), args_dict),
+                        stream,
+                    )
+                return f(**args_dict)
 
             default_timezone = args_dict["self"].default_timezone
 
@@ -109,8 +255,17 @@ class support_date_range:
 
             # no date range handling required
             if "end" not in args_dict:
-                df = f(**args_dict)
-                _handle_save_to(df, save_to, args_dict, f)
+                chunks = _iter_single(
+                    f,
+                    (),
+                    args_dict,
+                    save_to=save_to,
+                    store=store,
+                    fill_gaps=fill_gaps,
+                )
+                if stream:
+                    return _stream_chunks(chunks, stream)
+                _, _, df = next(chunks)
                 return df
 
             if (
@@ -165,80 +320,56 @@ class support_date_range:
                 elif frequency == "YEAR_START":
                     frequency = YearBeginOffset()
 
-                dates = date_range_maker(
+                dates = date_range_boundaries(
                     args_dict["date"],
                     args_dict["end"],
                     freq=frequency,
-                    inclusive="neither",
                 )
-                dates = [args_dict["date"]] + dates + [args_dict["end"]]
 
-            # make sure everything is in default timezone
-            # of the ISO
-            dates = [utils._handle_date(d, default_timezone) for d in dates]
+                # make sure everything is in default timezone
+                # of the ISO
+                dates = list(dates.tz_convert(default_timezone))
 
             # sometime api have restrictions/optimizations based on date ranges
             # update_dates allows for the caller to insert this logic
             if self.update_dates is not None:
                 dates = self.update_dates(dates, args_dict)
 
-            start_date = dates[0]
-
             # remove end date and add back later if needed
             del args_dict["end"]
 
-            all_df = []
-
-            # every None removes two possible queries
-            total = len(dates) - dates.count(None) * 2 - 1
+            max_size = _adaptive_max_size(frequency) if adaptive else None
 
-            with tqdm.tqdm(disable=total <= 1, total=total) as pbar:
-                for end_date in dates[1:]:
-                    # if we come across None, it means we should reset
-                    if end_date is None:
-                        start_date = None
-                        continue
-
-                    # if start_date is None, we just reset and end is actually the start
-                    if start_date is None:
-                        start_date = end_date
-                        continue
-
-                    args_dict["date"] = start_date
+            if max_size is not None:
+                chunks = _iter_adaptive_date_ranges(
+                    f,
+                    args_dict,
+                    dates,
+                    AdaptiveChunkSize(
+                        max_size,
+                        **(adaptive if isinstance(adaptive, dict) else {}),
+                    ),
+                    error=error,
+                    save_to=save_to,
+                    store=store,
+                    fill_gaps=fill_gaps,
+                )
+            else:
+                chunks = _iter_date_ranges(
+                    f,
+                    args_dict,
+                    dates,
+                    frequency,
+                    error=error,
+                    save_to=save_to,
+                    store=store,
+                    fill_gaps=fill_gaps,
+                )
 
-                    # no need for end if we are querying for just 1 day
-                    if frequency != "1D" and not isinstance(frequency, DayBeginOffset):
-                        args_dict["end"] = end_date
+            if stream:
+                return _stream_chunks(chunks, stream)
 
-                    try:
-                        df = f(**args_dict)
-                    except Exception as e:
-                        if error == "raise":
-                            raise e
-                        elif error == "ignore":
-                            df = None
-                            errors += [args_dict.copy()]
-                            print("Error: {}".format(e))
-                            print("Args: {}\n".format(args_dict))
-                        else:
-                            raise ValueError(
-                                "Invalid value for error: {}".format(
-                                    error,
-                                ),
-                            )
-
-                    _handle_save_to(df, save_to, args_dict, f)
-
-                    pbar.update(1)
-
-                    if df is not None:
-                        all_df.append(df)
-
-                    start_date = end_date
-
-            if errors:
-                print("Errors that occurred while getting data:")
-                pprint.pprint(errors)
+            all_df = [df for _, _, df in chunks if df is not None]
 
             if self.return_raw:
                 return all_df
@@ -253,14 +384,403 @@ class support_date_range:
                         df[k].append(v)
                 for k, v in df.items():
                     df[k] = pd.concat(v).reset_index(drop=True)
+            elif schema is not None and all_df:
+                df = schema.with_timezone(default_timezone).concat(all_df)
             else:
                 df = pd.concat(all_df).reset_index(drop=True)
 
+            if isinstance(df, pd.DataFrame):
+                _merge_attrs(df, all_df)
+
             return df
 
         return wrapped_f
 
 
+def _merge_attrs(df, dfs):
+    """Sets the MERGED_ATTRS of dfs on their concatenation df"""
+    for name, merge in MERGED_ATTRS.items():
+        values = [d.attrs[name] for d in dfs if name in d.attrs]
+        if values:
+            df.attrs[name] = merge(values)
+
+
+def _iter_single(f, args, kwargs, save_to=None, store=None, fill_gaps=False):
+    """Yields the result of a single call to f as (start, end, df)"""
+    date = kwargs.get("date")
+    if not isinstance(date, pd.Timestamp):
+        date = None
+
+    if store is not None and date is not None:
+        df = _call_with_store(
+            f,
+            kwargs,
+            store,
+            date,
+            date + pd.DateOffset(days=1),
+            fill_gaps=fill_gaps,
+        )
+    else:
+        df = f(*args, **kwargs)
+
+    _handle_save_to(df, save_to, kwargs, f)
+    yield date, None, df
+
+
+def _store_params(f, args_dict, store):
+    """Arguments of a call to f that identify its dataset in store"""
+    # include defaults so omitting an argument is the same dataset as passing
+    # its default value
+    return store.dataset_params({**_get_default_args(f), **args_dict})
+
+
+def _call_with_store(f, args_dict, store, start, end, fill_gaps=False):
+    """Reads the request from store if it is covered, otherwise calls f and
+    saves the result. With fill_gaps, the request is only read from store if
+    every interval of it has stored rows."""
+    if not store.can_store(args_dict):
+        return f(**args_dict)
+
+    iso = args_dict["self"].__class__.__name__
+    params = _store_params(f, args_dict, store)
+
+    if fill_gaps:
+        gaps = store.find_gaps(iso, f.__name__, params, start, end)
+        if not gaps:
+            return store.read_range(iso, f.__name__, params, start, end)
+        logger.info(f"Filling gaps in {iso} {f.__name__}: {gaps}")
+    elif store.covers(iso, f.__name__, params, start, end):
+        return store.read_range(iso, f.__name__, params, start, end)
+
+    df = f(**args_dict)
+    store.write(iso, f.__name__, params, start, end, df)
+    return df
+
+
+def _iter_date_ranges(
+    f,
+    args_dict,
+    dates,
+    frequency,
+    error="ignore",
+    save_to=None,
+    store=None,
+    fill_gaps=False,
+):
+    """Calls f for each range in dates, yielding (start, end, df). df is None if
+    the request failed and errors are ignored.
+
+    A None in dates means the range ends at the date before it and a new range
+    starts at the date after it.
+    """
+    errors = []
+
+    start_date = dates[0]
+
+    # every None removes two possible queries
+    total = len(dates) - dates.count(None) * 2 - 1
+
+    with _progress_bar(total) as pbar:
+        for end_date in dates[1:]:
+            # if we come across None, it means we should reset
+            if end_date is None:
+                start_date = None
+                continue
+
+            # if start_date is None, we just reset and end is actually the start
+            if start_date is None:
+                start_date = end_date
+                continue
+
+            args_dict["date"] = start_date
+
+            # no need for end if we are querying for just 1 day
+            if frequency != "1D" and not isinstance(frequency, DayBeginOffset):
+                args_dict["end"] = end_date
+
+            try:
+                if store is not None:
+                    df = _call_with_store(
+                        f,
+                        args_dict,
+                        store,
+                        start_date,
+                        end_date,
+                        fill_gaps=fill_gaps,
+                    )
+                else:
+                    df = f(**args_dict)
+            except Exception as e:
+                df = _handle_range_error(e, error, args_dict, errors)
+
+            _handle_save_to(df, save_to, args_dict, f)
+
+            pbar.update(1)
+
+            yield start_date, end_date, df
+
+            start_date = end_date
+
+    if errors:
+        print("Errors that occurred while getting data:")
+        pprint.pprint(errors)
+
+
+# Errors that may be caused by requesting too much data at once, so the request
+# is retried for a shorter range
+RETRY_SMALLER_EXCEPTIONS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    MemoryError,
+)
+
+
+class AdaptiveChunkSize:
+    """Size of the next request of an adaptive date range.
+
+    After each request, the size is scaled so that a request of that size
+    would take about ``target_seconds`` and return at most ``target_rows``
+    rows and ``target_bytes`` bytes, growing or shrinking by at most
+    ``MAX_GROWTH`` per request. The size never exceeds ``max_size``, which is
+    the method's frequency, and is rounded down to whole days (or hours, or 5
+    minutes for short frequencies).
+    """
+
+    MAX_GROWTH = 2
+    MAX_SHRINK = 4
+
+    def __init__(
+        self,
+        max_size: pd.Timedelta,
+        target_seconds: float = 30,
+        target_rows: int = 1_000_000,
+        target_bytes: int = 256 * 1024**2,
+    ):
+        self.max_size = max_size
+        self.target_seconds = target_seconds
+        self.target_rows = target_rows
+        self.target_bytes = target_bytes
+
+        if max_size >= pd.Timedelta(days=2):
+            self.unit = pd.Timedelta(days=1)
+        elif max_size >= pd.Timedelta(hours=2):
+            self.unit = pd.Timedelta(hours=1)
+        else:
+            self.unit = min(max_size, pd.Timedelta(minutes=5))
+
+        # start from the largest size allowed
+        self.size = max_size
+
+    def next_end(self, start: pd.Timestamp) -> pd.Timestamp:
+        """End of a request starting at start"""
+        if self.unit == pd.Timedelta(days=1):
+            # calendar days so ranges stay aligned to midnight across DST, but
+            # never longer than max_size, which is a limit in absolute time
+            return min(
+                start + pd.DateOffset(days=self.size // self.unit),
+                start + self.max_size,
+            )
+        return start + self.size
+
+    def observe(
+        self,
+        duration: pd.Timedelta,
+        seconds: float,
+        df: pd.DataFrame,
+    ) -> None:
+        """Resizes after a request for duration took seconds and returned df"""
+        ratios = [self.target_seconds / seconds] if seconds > 0 else []
+        if isinstance(df, pd.DataFrame) and len(df):
+            ratios.append(self.target_rows / len(df))
+            ratios.append(self.target_bytes / df.memory_usage(index=False).sum())
+
+        factor = min(ratios, default=self.MAX_GROWTH)
+        factor = min(max(factor, 1 / self.MAX_SHRINK), self.MAX_GROWTH)
+
+        size = duration * factor
+        if factor >= 1:
+            # a short request at the end of a range isn't a reason to shrink
+            size = max(size, self.size)
+
+        self._resize(size)
+
+    def shrink(self) -> bool:
+        """Halves the size. Returns False if it is already the smallest size."""
+        if self.size <= self.unit:
+            return False
+
+        self._resize(self.size / 2)
+        return True
+
+    def _resize(self, size: pd.Timedelta) -> None:
+        size = min(size, self.max_size)
+        self.size = max((size // self.unit) * self.unit, self.unit)
+
+
+def _adaptive_max_size(frequency) -> pd.Timedelta | None:
+    """Largest request size of a fixed length frequency, or None if requests
+    of the frequency can't be resized"""
+    # methods with daily frequencies are called for a single date without an end
+    if not isinstance(frequency, str) or frequency == "1D":
+        return None
+
+    try:
+        offset = pd.tseries.frequencies.to_offset(frequency)
+    except ValueError:
+        return None
+
+    if not isinstance(offset, pd.offsets.Tick):
+        return None
+
+    return pd.Timedelta(offset)
+
+
+def _contiguous_ranges(dates):
+    """Merges the ranges in dates into (start, end) ranges that aren't split by
+    a None"""
+    ranges = []
+    start_date = dates[0]
+    for end_date in dates[1:]:
+        if end_date is None:
+            start_date = None
+        elif start_date is None:
+            start_date = end_date
+        elif ranges and ranges[-1][1] == start_date:
+            ranges[-1] = (ranges[-1][0], end_date)
+            start_date = end_date
+        else:
+            ranges.append((start_date, end_date))
+            start_date = end_date
+    return ranges
+
+
+def _iter_adaptive_date_ranges(
+    f,
+    args_dict,
+    dates,
+    chunk_size,
+    error="ignore",
+    save_to=None,
+    store=None,
+    fill_gaps=False,
+):
+    """Like _iter_date_ranges, but splits the ranges in dates into requests of
+    chunk_size, which is resized after every request. Requests never cross a
+    None in dates, so restrictions added by update_dates still apply.
+    """
+    errors = []
+
+    ranges = _contiguous_ranges(dates)
+    total = sum((end - start for start, end in ranges), pd.Timedelta(0))
+
+    with _progress_bar(
+        int(total.total_seconds()) if total > chunk_size.max_size else 0,
+        bar_format="{l_bar}{bar}| [{elapsed}<{remaining}]",
+    ) as pbar:
+        for range_start, range_end in ranges:
+            start_date = range_start
+
+            while start_date < range_end:
+                end_date = min(chunk_size.next_end(start_date), range_end)
+
+                args_dict["date"] = start_date
+                args_dict["end"] = end_date
+
+                request_start = time.perf_counter()
+                try:
+                    if store is not None:
+                        df = _call_with_store(
+                            f,
+                            args_dict,
+                            store,
+                            start_date,
+                            end_date,
+                            fill_gaps=fill_gaps,
+                        )
+                    else:
+                        df = f(**args_dict)
+                except RETRY_SMALLER_EXCEPTIONS as e:
+                    if chunk_size.shrink():
+                        logger.info(
+                            f"Request from {start_date} to {end_date} failed with "
+                            f"{e!r}. Retrying with a size of {chunk_size.size}",
+                        )
+                        continue
+                    df = _handle_range_error(e, error, args_dict, errors)
+                except Exception as e:
+                    df = _handle_range_error(e, error, args_dict, errors)
+                else:
+                    chunk_size.observe(
+                        end_date - start_date,
+                        time.perf_counter() - request_start,
+                        df,
+                    )
+
+                _handle_save_to(df, save_to, args_dict, f)
+
+                pbar.update(int((end_date - start_date).total_seconds()))
+
+                yield start_date, end_date, df
+
+                start_date = end_date
+
+    if errors:
+        print("Errors that occurred while getting data:")
+        pprint.pprint(errors)
+
+
+def _handle_range_error(e, error, args_dict, errors):
+    if error == "raise":
+        raise e
+    elif error == "ignore":
+        errors += [args_dict.copy()]
+        print("Error: {}".format(e))
+        print("Args: {}\n".format(args_dict))
+        return None
+    else:
+        raise ValueError(
+            "Invalid value for error: {}".format(
+                error,
+            ),
+        )
+
+
+class _NoProgressBar:
+    """Stands in for a tqdm progress bar when there is nothing to show"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def update(self, n=1):
+        pass
+
+
+def _progress_bar(total, **kwargs):
+    # creating a disabled tqdm bar still has a cost, which adds up for methods
+    # called often for a single range
+    if total <= 1:
+        return _NoProgressBar()
+    return tqdm.tqdm(total=total, **kwargs)
+
+
+def _stream_chunks(chunks, stream):
+    """Yields the DataFrame of every successful chunk, or (start, end, df)
+    tuples if stream is "with_bounds"
+    """
+    for start, end, df in chunks:
+        if df is None:
+            continue
+
+        if stream == "with_bounds":
+            yield start, end, df
+        else:
+            yield df
+
+
 def _handle_save_to(df, save_to, args_dict, f):
     if df is not None and save_to is not None:
         if "end" in args_dict:
@@ -358,11 +878,13 @@ def pjm_update_dates(dates, args_dict):
 
     # remove trailing None
     if new_dates[-1] is None:
-        new_dates = new_dates[:-1]
+        new_dates.pop()
 
     # restriction 2: archive / standard boundary
-    for i, date in enumerate(new_dates[:-1]):
-        next_date = new_dates[i + 1]
+    # build a new list in one pass rather than splicing into new_dates
+    split_dates = []
+    for date, next_date in zip(new_dates, new_dates[1:]):
+        split_dates.append(date)
         # check if archive date is between date and next_date
         if None not in [date, next_date] and date < archive_date < next_date:
             day_before_archive = archive_date - pd.Timedelta(days=1)
@@ -374,22 +896,18 @@ def pjm_update_dates(dates, args_dict):
                 minute=59,
                 tz=args_dict["self"].default_timezone,
             )
+            split_dates += [add_before, None, archive_date]
 
-            new_dates = (
-                new_dates[: i + 1]
-                + [
-                    add_before,
-                    None,
-                    archive_date,
-                ]
-                + new_dates[i + 1 :]
-            )
+    new_dates = split_dates + new_dates[-1:]
 
     return new_dates
 
 
 # custom offset that I dont believe exists in pandas
 class DayBeginOffset:
+    # equivalent pandas frequency once on a boundary
+    pandas_freq = "D"
+
     def __ladd__(self, other):
         return other.normalize() + pd.DateOffset(days=1)
 
@@ -398,6 +916,8 @@ class DayBeginOffset:
 
 
 class MonthBeginOffset:
+    pandas_freq = "MS"
+
     def __ladd__(self, other):
         return other.normalize() + pd.offsets.MonthBegin(1)
 
@@ -450,6 +970,8 @@ class HourBeginOffset:
 
 
 class YearBeginOffset:
+    pandas_freq = "YS"
+
     def __ladd__(self, other):
         return other.normalize() + pd.offsets.YearBegin(1)
 
@@ -1,5 +1,6 @@
 import concurrent.futures
 import datetime
+import functools
 import json
 import os
 import re
@@ -11,7 +12,6 @@ from zipfile import BadZipFile
 import numpy as np
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 import gridstatus
@@ -32,6 +32,8 @@ HENRY_HUB_NATURAL_GAS_SPOT_PRICES_PATH = "natural-gas/pri/fut"
 # Physical location of Henry Hub is Louisiana
 HENRY_HUB_TIMEZONE = "US/Central"
 
+GRID_MONITOR_FILES_PATH = Path(__file__).parent / "eia_data" / "grid_monitor_files.json"
+
 
 class EIA:
     BASE_URL = "https://api.eia.gov/v2/"
@@ -269,9 +271,7 @@ class EIA:
             dict: Grid monitor data for specified area(s).
         """
 
-        config_path = Path(__file__).parent / "eia_data" / "grid_monitor_files.json"
-        with open(config_path, "r") as f:
-            GRID_MONITOR_FILES = json.load(f)
+        GRID_MONITOR_FILES = _load_grid_monitor_files()
 
         areas_to_fetch = GRID_MONITOR_FILES.keys()
         if area_id:
@@ -397,6 +397,8 @@ class EIA:
         if verbose:
             logger.info(f"Downloading {url}", verbose)
 
+        from bs4 import BeautifulSoup
+
         with requests.get(url) as response:
             content = response.content
             soup = BeautifulSoup(content, "html.parser")
@@ -797,6 +799,13 @@ class EIA:
         return df[columns]
 
 
+@functools.lru_cache(maxsize=None)
+def _load_grid_monitor_files():
+    """Parse the static grid monitor file listing once per process"""
+    with open(GRID_MONITOR_FILES_PATH, "r") as f:
+        return json.load(f)
+
+
 def _handle_time(df, frequency="1h"):
     df.insert(0, "Interval End", pd.to_datetime(df["period"], utc=True))
     df.insert(0, "Interval Start", df["Interval End"] - pd.Timedelta(frequency))
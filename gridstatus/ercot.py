@@ -1,15 +1,18 @@
 import datetime
+import glob
 import io
+import os
+import re
 import time
 from dataclasses import dataclass
 from enum import Enum
-from zipfile import ZipFile
+from zipfile import BadZipFile, ZipFile
 
+import numpy as np
 import pandas as pd
 import pytz
 import requests
 import tqdm
-from bs4 import BeautifulSoup
 from pytz.exceptions import NonExistentTimeError
 
 from gridstatus import utils
@@ -21,7 +24,8 @@ from gridstatus.base import (
     NoDataFoundException,
     NotSupported,
 )
-from gridstatus.decorators import support_date_range
+from gridstatus.bid_curves import GroupedCurves
+from gridstatus.decorators import MERGED_ATTRS, support_date_range
 from gridstatus.ercot_60d_utils import (
     DAM_ENERGY_BID_AWARDS_KEY,
     DAM_ENERGY_BIDS_KEY,
@@ -60,6 +64,7 @@ from gridstatus.ercot_constants import (
 )
 from gridstatus.gs_logging import log, logger
 from gridstatus.lmp_config import lmp_config
+from gridstatus.schemas import DATETIME, output_schema
 
 LOCATION_TYPE_HUB = "Trading Hub"
 LOCATION_TYPE_RESOURCE_NODE = "Resource Node"
@@ -71,6 +76,39 @@ LOCATION_TYPE_ZONE_DC_EW = "Load Zone DC Tie Energy Weighted"
 ELECTRICAL_BUS_LOCATION_TYPE = "Electrical Bus"
 SETTLEMENT_POINT_LOCATION_TYPE = "Settlement Point"
 
+# Key in DataFrame.attrs with the publish date of the newest document read,
+# to pass as published_after_cursor on the next call
+PUBLISH_CURSOR_ATTR = "publish_cursor"
+# date ranges keep the newest cursor of their requests
+MERGED_ATTRS[PUBLISH_CURSOR_ATTR] = max
+
+LMP_SCHEMA = {
+    "Interval Start": DATETIME,
+    "Interval End": DATETIME,
+    "SCED Timestamp": DATETIME,
+    "Market": "object",
+    "Location": "string",
+    "Location Type": "category",
+    "LMP": "float64",
+}
+
+SPP_SCHEMA = {
+    "Time": DATETIME,
+    "Interval Start": DATETIME,
+    "Interval End": DATETIME,
+    "Location": "string",
+    "Location Type": "category",
+    "Market": "object",
+    "SPP": "float64",
+}
+
+SCED_SYSTEM_LAMBDA_SCHEMA = {
+    "Interval Start": DATETIME,
+    "Interval End": DATETIME,
+    "SCED Timestamp": DATETIME,
+    "System Lambda": "float64",
+}
+
 """
 Report Type IDs
 """
@@ -249,6 +287,14 @@ RESOURCE_NODE_SETTLEMENT_TYPES = ["RN", "PCCRN", "LCCRN", "PUN"]
 LOAD_ZONE_SETTLEMENT_TYPES = ["LZ", "LZ_DC"]
 HUB_SETTLEMENT_TYPES = ["HU", "SH", "AH"]
 
+# Names of the settlement point column in the different price reports
+SETTLEMENT_POINT_COLUMNS = [
+    "SettlementPoint",
+    "Settlement Point",
+    "SettlementPointName",
+    "Settlement Point Name",
+]
+
 
 @dataclass
 class Document:
@@ -257,6 +303,184 @@ class Document:
     constructed_name: str
     friendly_name: str
     friendly_name_timestamp: pd.Timestamp
+    # the same document id is used by the ERCOT API archive
+    doc_id: str | None = None
+    report_type_id: int | None = None
+
+
+def _yearly_spp_cache_path(cache_dir, report_type_id, year, publish_date):
+    publish_date = publish_date.tz_convert("UTC").strftime("%Y%m%dT%H%M%S")
+    return os.path.join(
+        os.path.expanduser(cache_dir),
+        "ercot",
+        str(report_type_id),
+        f"{year}_{publish_date}.parquet",
+    )
+
+
+def _write_yearly_spp_cache(cache_path, df):
+    """Saves df to cache_path, removing data cached for earlier publishes of the
+    same workbook"""
+    cache_folder = os.path.dirname(cache_path)
+    os.makedirs(cache_folder, exist_ok=True)
+
+    year = os.path.basename(cache_path).split("_")[0]
+    for old_path in glob.glob(os.path.join(cache_folder, f"{year}_*.parquet")):
+        os.remove(old_path)
+
+    utils.write_atomic(
+        cache_path,
+        lambda tmp_path: df.to_parquet(tmp_path, index=False),
+    )
+
+
+# Same whitespace handling as pandas.read_html
+_HTML_WHITESPACE_RE = re.compile(r"[\r\n]+|\s{2,}")
+
+
+def _parse_display_table(html):
+    """Parses the first table of an ERCOT display page (e.g. actual loads of
+    weather zones) with a header row followed by one row per hour.
+
+    The table is read with lxml, and pandas.read_html is only used if the
+    table isn't laid out as expected."""
+    try:
+        return _parse_display_table_lxml(html)
+    except ValueError as e:
+        logger.debug(f"Falling back to pandas.read_html: {e}")
+        return pd.read_html(io.BytesIO(html), header=0)[0]
+
+
+def _parse_display_table_lxml(html):
+    from lxml import html as lxml_html
+
+    tables = lxml_html.fromstring(html).xpath("//table")
+    if not tables:
+        raise ValueError("No tables found")
+
+    # Cells are expected to only hold text, which can be read directly instead
+    # of walking each cell for its text content
+    table = tables[0]
+    if table.xpath(".//tr/*/* | .//*[@colspan or @rowspan]"):
+        raise ValueError("Table has nested elements or merged cells")
+
+    header, *rows = [
+        [(cell.text or "").strip() for cell in row.iterchildren("th", "td")]
+        for row in table.iter("tr")
+    ]
+    if not rows or any(len(row) != len(header) for row in rows):
+        raise ValueError("Table rows don't match the header")
+
+    return pd.DataFrame(
+        {
+            _HTML_WHITESPACE_RE.sub(" ", name): _infer_html_column(values)
+            for name, values in zip(header, zip(*rows))
+        },
+    )
+
+
+def _infer_html_column(values):
+    """Converts cell texts the way read_html infers them, e.g. "1,234.5" to
+    1234.5 and "0100" to 100, leaving other columns (e.g. "0200*") as strings.
+    Pages are small, so plain Python is faster than vectorized conversion."""
+    numbers = [value.replace(",", "") for value in values]
+    if all(numbers):
+        for dtype in (np.int64, np.float64):
+            try:
+                return np.array(numbers, dtype=dtype)
+            except (ValueError, OverflowError):
+                pass
+
+    try:
+        return np.array([float(value) if value else np.nan for value in numbers])
+    except ValueError:
+        return np.array([value if value else np.nan for value in values], dtype=object)
+
+
+def _parse_key_value_table(html):
+    """Parses an ERCOT dashboard table (e.g. real time system conditions) of
+    header rows each followed by (category, value) rows.
+
+    Returns:
+        tuple: list of (is_header, cell texts) for each row and the text of
+            the last updated time
+    """
+    try:
+        return _parse_key_value_table_lxml(html)
+    except ValueError as e:
+        logger.debug(f"Falling back to BeautifulSoup: {e}")
+        return _parse_key_value_table_bs4(html)
+
+
+def _parse_key_value_table_lxml(html):
+    from lxml import html as lxml_html
+
+    doc = lxml_html.fromstring(html)
+
+    tables = doc.xpath(
+        '//table[contains(concat(" ", normalize-space(@class), " "), " tableStyle ")]',
+    )
+    time_divs = doc.xpath(
+        '//div[contains(concat(" ", normalize-space(@class), " "), " schedTime ")'
+        ' and contains(concat(" ", normalize-space(@class), " "), " rightAlign ")]',
+    )
+    if not tables or not time_divs:
+        raise ValueError("Table or last updated time not found")
+
+    time_text = time_divs[0].text_content()
+    if ": " not in time_text:
+        raise ValueError(f"Unexpected last updated time {time_text!r}")
+
+    rows = []
+    for row in tables[0].xpath(".//tr"):
+        cells = row.xpath("./td")
+        if not cells:
+            raise ValueError("Row without cells")
+
+        is_header = cells[0].get("class", "").split() == ["headerValueClass"]
+        if not is_header and len(cells) < 2:
+            raise ValueError("Value row without a value")
+
+        rows.append((is_header, [cell.text_content().strip() for cell in cells]))
+
+    if not rows or not rows[0][0]:
+        raise ValueError("Table doesn't start with a header")
+
+    return rows, time_text.split(": ")[1]
+
+
+def _parse_key_value_table_bs4(html):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    table = soup.find("table", attrs={"class": "tableStyle"})
+
+    rows = []
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        is_header = cells[0].get("class") == ["headerValueClass"]
+        rows.append((is_header, [cell.text.strip() for cell in cells]))
+
+    time_div = soup.find("div", attrs={"class": "schedTime rightAlign"})
+    # Split the string on ': ' to get just the time part
+    time_text = time_div.text.split(": ")[1]
+
+    return rows, time_text
+
+
+def _with_publish_cursor(df, docs):
+    """Records the publish date of the newest of docs in df.attrs"""
+    if docs:
+        df.attrs[PUBLISH_CURSOR_ATTR] = max(doc.publish_date for doc in docs)
+    return df
+
+
+def _empty_after_cursor(df, published_after_cursor):
+    """Result of a poll that found no files published after the cursor, which
+    is passed on unchanged"""
+    df.attrs[PUBLISH_CURSOR_ATTR] = published_after_cursor
+    return df
 
 
 def parse_timestamp_from_friendly_name(friendly_name):
@@ -284,8 +508,41 @@ def parse_timestamp_from_friendly_name(friendly_name):
     return timestamp
 
 
+# Archive EMIL ids of reports that read_docs can download from the ERCOT API in
+# bulk. Keys are report type ids
+ARCHIVE_EMIL_IDS = {
+    SCED_SYSTEM_LAMBDA_RTID: "np6-322-cd",
+    DAM_SETTLEMENT_POINT_PRICES_RTID: "np4-190-cd",
+    SETTLEMENT_POINT_PRICES_AT_RESOURCE_NODES_HUBS_AND_LOAD_ZONES_RTID: "np6-905-cd",
+    LMPS_BY_ELECTRICAL_BUS_RTID: "np6-787-cd",
+    LMPS_BY_SETTLEMENT_POINT_RTID: "np6-788-cd",
+}
+
+# Environment variables with credentials for the ERCOT API
+ERCOT_API_CREDENTIAL_VARIABLES = (
+    "ERCOT_API_USERNAME",
+    "ERCOT_API_PASSWORD",
+    "ERCOT_API_SUBSCRIPTION_KEY",
+)
+
+
 class Ercot(ISOBase):
-    """Electric Reliability Council of Texas (ERCOT)"""
+    """Electric Reliability Council of Texas (ERCOT)
+
+    Reports read one file per request, such as get_lmp and get_spp over long
+    ranges, are downloaded in batches of up to 1,000 files through the ERCOT
+    API archive when they have at least archive_document_threshold files
+    published more than archive_document_min_age ago and ERCOT API credentials
+    are set as environment variables (see ErcotAPI). More recent files, and
+    batches the archive can't download, are downloaded from MIS. Set
+    archive_api to an ErcotAPI to use other credentials, or
+    archive_document_threshold to None to always download from MIS.
+
+    Methods that take a published_after_cursor, such as get_lmp, only read files
+    published after it. The publish time of the newest file read is in
+    df.attrs["publish_cursor"], to pass on the next call. If no files were
+    published since, no rows are returned and the cursor is unchanged.
+    """
 
     name = "Electric Reliability Council of Texas"
     iso_id = "ercot"
@@ -312,6 +569,17 @@ class Ercot(ISOBase):
     ACTUAL_LOADS_WEATHER_ZONES_URL_FORMAT = "https://www.ercot.com/content/cdr/html/{timestamp}_actual_loads_of_weather_zones.html"  # noqa
     LOAD_HISTORICAL_MAX_DAYS = 14
 
+    # Number of files that are downloaded through the ERCOT API archive rather
+    # than one request per file. None to disable
+    archive_document_threshold = 50
+
+    # Files published more recently than this are downloaded from MIS, since
+    # the archive may not have them yet
+    archive_document_min_age = pd.Timedelta(days=1)
+
+    # ErcotAPI used for archive downloads. Created from the environment if None
+    archive_api = None
+
     def get_status(self, date, verbose=False):
         """Returns status of grid"""
         if date != "latest":
@@ -590,8 +858,9 @@ class Ercot(ISOBase):
         msg = f"Fetching {url}"
         log(msg, verbose)
 
-        dfs = pd.read_html(url, header=0)
-        df = dfs[0]
+        r = requests.get(url)
+        r.raise_for_status()
+        df = _parse_display_table(r.content)
 
         if df["Hour Ending"].dtype == "object":
             df["RepeatedHourFlag"] = df["Hour Ending"].str.contains("*", regex=False)
@@ -880,77 +1149,129 @@ class Ercot(ISOBase):
             .reset_index(drop=True)
         )
 
-    def get_rtm_spp(self, year, verbose=False):
+    def get_rtm_spp(self, year, verbose=False, cache_dir=None, excel_engine=None):
         """Get Historical RTM Settlement Point Prices(SPPs)
             for each of the Hubs and Load Zones
 
         Arguments:
             year(int): year to get data for
                 Starting 2011, returns data for the entire year
+            cache_dir(str, optional): directory to cache the parsed data in.
+                See _get_yearly_spp for details.
+            excel_engine(str, optional): engine used by pandas.read_excel to
+                parse the workbook, e.g. "calamine" which is much faster than
+                the default if python-calamine is installed
 
         Source:
             https://www.ercot.com/mp/data-products/data-product-details?id=NP6-785-ER
         """  # noqa
-        doc_info = self._get_document(
-            report_type_id=HISTORICAL_RTM_LOAD_ZONE_AND_HUB_PRICES_RTID,
-            constructed_name_contains=f"{year}.zip",
-            verbose=verbose,
-        )
-
-        x = utils.get_zip_file(doc_info.url, verbose=verbose)
-        all_sheets = pd.read_excel(x, sheet_name=None)
-        df = pd.concat(all_sheets.values())
-
-        # fix parsing error where no data is present
-        # should only be 1 row per year
-        count = df[["Delivery Hour", "Delivery Interval"]].isnull().all(axis=1).sum()
-        if count == 1:
-            df = df.dropna(
-                subset=["Delivery Hour", "Delivery Interval"],
-                how="all",
-            )
-        elif count > 1:
-            raise ValueError(
-                "Parsing error, more than expected null rows found",
-            )
-
-        df["Delivery Interval"] = df["Delivery Interval"].astype("Int64")
-        df = self.parse_doc(df, verbose=verbose)
-        return self._finalize_spp_df(
-            df,
+        return self._get_yearly_spp(
+            HISTORICAL_RTM_LOAD_ZONE_AND_HUB_PRICES_RTID,
+            year,
             market=Markets.REAL_TIME_15_MIN,
+            cache_dir=cache_dir,
+            excel_engine=excel_engine,
             verbose=verbose,
         )
 
-    def get_dam_spp(self, year, verbose=False):
+    def get_dam_spp(self, year, verbose=False, cache_dir=None, excel_engine=None):
         """Get Historical DAM Settlement Point Prices(SPPs)
         for each of the Hubs and Load Zones
 
         Arguments:
             year(int): year to get data for.
                 Starting 2011, returns data for the entire year
+            cache_dir(str, optional): directory to cache the parsed data in.
+                See _get_yearly_spp for details.
+            excel_engine(str, optional): engine used by pandas.read_excel to
+                parse the workbook, e.g. "calamine" which is much faster than
+                the default if python-calamine is installed
 
 
         Source:
             https://www.ercot.com/mp/data-products/data-product-details?id=NP4-180-ER
         """
+        return self._get_yearly_spp(
+            HISTORICAL_DAM_LOAD_ZONE_AND_HUB_PRICES_RTID,
+            year,
+            market=Markets.DAY_AHEAD_HOURLY,
+            cache_dir=cache_dir,
+            excel_engine=excel_engine,
+            verbose=verbose,
+        )
+
+    def _get_yearly_spp(
+        self,
+        report_type_id,
+        year,
+        market,
+        cache_dir=None,
+        excel_engine=None,
+        verbose=False,
+    ):
+        """Reads a yearly workbook of settlement point prices, which has a sheet
+        per month.
+
+        Parsing a workbook takes minutes, so if cache_dir is provided the parsed
+        data is saved there as Parquet and read back by later calls. The cache is
+        keyed by the publish date of the document, so it is replaced when ERCOT
+        republishes the workbook, e.g. daily for the current year. Caching
+        requires pyarrow.
+        """
         doc_info = self._get_document(
-            report_type_id=HISTORICAL_DAM_LOAD_ZONE_AND_HUB_PRICES_RTID,
+            report_type_id=report_type_id,
             constructed_name_contains=f"{year}.zip",
             verbose=verbose,
         )
 
+        cache_path = None
+        if cache_dir is not None:
+            utils.require_pyarrow("cache_dir")
+
+            cache_path = _yearly_spp_cache_path(
+                cache_dir,
+                report_type_id,
+                year,
+                doc_info.publish_date,
+            )
+            if os.path.exists(cache_path):
+                log(f"Reading cached {cache_path}", verbose)
+                return pd.read_parquet(cache_path)
+
         x = utils.get_zip_file(doc_info.url, verbose=verbose)
-        all_sheets = pd.read_excel(x, sheet_name=None)
+        all_sheets = pd.read_excel(x, sheet_name=None, engine=excel_engine)
         df = pd.concat(all_sheets.values())
-        # filter where DSTFlag == 10
+
+        if market == Markets.REAL_TIME_15_MIN:
+            # fix parsing error where no data is present
+            # should only be 1 row per year
+            count = (
+                df[["Delivery Hour", "Delivery Interval"]].isnull().all(axis=1).sum()
+            )
+            if count == 1:
+                df = df.dropna(
+                    subset=["Delivery Hour", "Delivery Interval"],
+                    how="all",
+                )
+            elif count > 1:
+                raise ValueError(
+                    "Parsing error, more than expected null rows found",
+                )
+
+            df["Delivery Interval"] = df["Delivery Interval"].astype("Int64")
+
         df = self.parse_doc(df, verbose=verbose)
-        return self._finalize_spp_df(
+        df = self._finalize_spp_df(
             df,
-            market=Markets.DAY_AHEAD_HOURLY,
+            market=market,
             verbose=verbose,
         )
 
+        if cache_path is not None:
+            _write_yearly_spp_cache(cache_path, df)
+
+        return df
+
     def get_raw_interconnection_queue(self, verbose=False):
         doc_info = self._get_document(
             report_type_id=GIS_REPORT_RTID,
@@ -1093,18 +1414,22 @@ class Ercot(ISOBase):
         return queue
 
     @support_date_range(frequency=None)
+    @output_schema(LMP_SCHEMA)
     def get_lmp(
         self,
         date,
         end=None,
         location_type: str = SETTLEMENT_POINT_LOCATION_TYPE,  # TODO: support 'ALL'
         verbose=False,
+        published_after_cursor: pd.Timestamp | None = None,
     ):
         """Get LMP data for ERCOT normally produced by SCED every five minutes
 
         Can specify the location type to return "electrical bus"
         or "settlement point" data. Defaults to "settlement point"
 
+        Only files published after published_after_cursor are read, if given
+        (see Ercot). Column types are declared by Ercot.schema("get_lmp").
         """
         if location_type.lower() == ELECTRICAL_BUS_LOCATION_TYPE.lower():
             report = LMPS_BY_ELECTRICAL_BUS_RTID
@@ -1125,16 +1450,24 @@ class Ercot(ISOBase):
             end = end
             date = None
 
-        docs = self._get_documents(
+        published_after_cursor = self._handle_publish_cursor(published_after_cursor)
+        docs = self._get_documents_after_cursor(
+            published_after_cursor,
             report_type_id=report,
             date=date,
+            published_after=published_after_cursor,
             friendly_name_timestamp_after=start,
             friendly_name_timestamp_before=end,
             extension="csv",
             verbose=verbose,
         )
+        if not docs:
+            return _empty_after_cursor(
+                self.schema("get_lmp").empty(),
+                published_after_cursor,
+            )
 
-        return self._handle_lmp(docs=docs, verbose=verbose)
+        return _with_publish_cursor(self._handle_lmp(docs=docs, verbose=verbose), docs)
 
     def _handle_lmp(self, docs, verbose=False, sced=True):
         df = self.read_docs(
@@ -1205,6 +1538,7 @@ class Ercot(ISOBase):
         },
     )
     @support_date_range(frequency=None)
+    @output_schema(SPP_SCHEMA)
     def get_spp(
         self,
         date,
@@ -1213,6 +1547,7 @@ class Ercot(ISOBase):
         locations: list = "ALL",
         location_type: str = "ALL",
         verbose=False,
+        published_after_cursor: pd.Timestamp | None = None,
     ):
         """Get SPP data for ERCOT
 
@@ -1224,6 +1559,9 @@ class Ercot(ISOBase):
             - ``Load Zone``
             - ``Trading Hub``
             - ``Resource Node``
+
+        Only files published after published_after_cursor are read, if given
+        (see Ercot). Column types are declared by Ercot.schema("get_spp").
         """
 
         publish_date = None
@@ -1260,16 +1598,25 @@ class Ercot(ISOBase):
                 published_after = date
             report = DAM_SETTLEMENT_POINT_PRICES_RTID
 
-        docs = self._get_documents(
+        docs = self._get_documents_after_cursor(
+            published_after_cursor,
             report_type_id=report,
             date=publish_date,
             published_before=published_before,
-            published_after=published_after,
+            published_after=self._handle_publish_cursor(
+                published_after_cursor,
+                published_after,
+            ),
             friendly_name_timestamp_before=friendly_name_timestamp_before,
             friendly_name_timestamp_after=friendly_name_timestamp_after,
             constructed_name_contains="csv.zip",
             verbose=verbose,
         )
+        if not docs:
+            return _empty_after_cursor(
+                self.schema("get_spp").empty(),
+                self._handle_publish_cursor(published_after_cursor),
+            )
 
         df = self.read_docs(
             docs,
@@ -1285,9 +1632,10 @@ class Ercot(ISOBase):
                 ],
             ),
             verbose=verbose,
+            filters=self._settlement_point_filters(locations),
         )
 
-        return self._finalize_spp_df(
+        df = self._finalize_spp_df(
             df,
             locations=locations,
             location_type=location_type,
@@ -1295,15 +1643,10 @@ class Ercot(ISOBase):
             verbose=verbose,
         )
 
+        return _with_publish_cursor(df, docs)
+
     def _handle_settlement_point_name_and_type(self, df, verbose=False):
-        df = df.rename(
-            columns={
-                "SettlementPoint": "Location",
-                "Settlement Point": "Location",
-                "SettlementPointName": "Location",
-                "Settlement Point Name": "Location",
-            },
-        )
+        df = df.rename(columns=dict.fromkeys(SETTLEMENT_POINT_COLUMNS, "Location"))
 
         # todo is this needed if we are defaulting to resource node?
         mapping_df = self._get_settlement_point_mapping(verbose=verbose)
@@ -1352,6 +1695,21 @@ class Ercot(ISOBase):
 
         return df
 
+    @staticmethod
+    def _settlement_point_filters(locations):
+        """Filters for read_doc that keep the rows of price reports needed for
+        locations, which can be a list, "ALL" or None"""
+        if locations == "ALL" or locations is None:
+            return None
+
+        # energy weighted load zones are only named with "_EW" after reading, so
+        # also keep rows for the name without it. Extra rows are removed by
+        # _finalize_spp_df.
+        names = set(locations) | {
+            location.removesuffix("_EW") for location in locations
+        }
+        return dict.fromkeys(SETTLEMENT_POINT_COLUMNS, names)
+
     def _finalize_spp_df(
         self,
         df,
@@ -1896,19 +2254,16 @@ class Ercot(ISOBase):
 
         html = requests.get(url).content
 
-        soup = BeautifulSoup(html, "html.parser")
-
-        table = soup.find("table", attrs={"class": "tableStyle"})
+        rows, time_text = _parse_key_value_table(html)
 
         data = {}
         header = None
-        for row in table.find_all("tr"):
-            cells = row.find_all("td")
-            if cells[0].get("class") == ["headerValueClass"]:
-                header = cells[0].text.strip()  # new header for new dataframe
+        for is_header, cells in rows:
+            if is_header:
+                header = cells[0]  # new header for new dataframe
             else:
-                category = cells[0].text.strip()
-                value = cells[1].text.strip()
+                category = cells[0]
+                value = cells[1]
                 header_prepend = header
                 if " (MW)" in header:
                     header_prepend = header_prepend.replace(" (MW)", "")
@@ -1924,11 +2279,6 @@ class Ercot(ISOBase):
 
         df = pd.DataFrame([data])
 
-        time_div = soup.find("div", attrs={"class": "schedTime rightAlign"})
-        time_text = time_div.text.split(": ")[
-            1
-        ]  # Split the string on ': ' to get just the time part
-
         now = pd.Timestamp.now(tz=self.default_timezone)
 
         # Determine if during the repeated DST hour. Pandas wants ambiguous=True if the
@@ -2483,12 +2833,6 @@ class Ercot(ISOBase):
             df_self_arranged = pd.read_csv(z.open(self_arranged))
             all_dfs.append(df_self_arranged)
 
-        def _make_bid_curve(df):
-            return [
-                tuple(x)
-                for x in df[["MW Offered", f"{as_name} Offer Price"]].values.tolist()
-            ]
-
         for as_name in offers_products:
             suffix = f"{as_name}-{date_str}.csv"
             offers = f"{prefix}_Agg_AS_Offers_{suffix}"
@@ -2509,11 +2853,11 @@ class Ercot(ISOBase):
                 df_offers_hourly[name] = None
 
             else:
-                df_offers_hourly = (
-                    df_offers.groupby(["Delivery Date", "Hour Ending"])
-                    .apply(_make_bid_curve, include_groups=False)
-                    .reset_index(name=name)
-                )
+                df_offers_hourly = GroupedCurves(
+                    df_offers,
+                    by=["Delivery Date", "Hour Ending"],
+                    columns=["MW Offered", f"{as_name} Offer Price"],
+                ).to_frame(name)
             all_dfs.append(df_offers_hourly)
 
         df = pd.concat(
@@ -2572,7 +2916,14 @@ class Ercot(ISOBase):
         return df
 
     @support_date_range(frequency=None)
-    def get_sced_system_lambda(self, date, end=None, verbose=False):
+    @output_schema(SCED_SYSTEM_LAMBDA_SCHEMA)
+    def get_sced_system_lambda(
+        self,
+        date,
+        end=None,
+        verbose=False,
+        published_after_cursor: pd.Timestamp | None = None,
+    ):
         """Get System lambda of each successful SCED
 
         Normally published every 5 minutes
@@ -2582,6 +2933,8 @@ class Ercot(ISOBase):
             end (str, datetime, optional): end time to get data for. If None,
                 return 1 day of data. Defaults to None.
             verbose (bool, optional): print verbose output. Defaults to False.
+            published_after_cursor (pd.Timestamp, optional): only read files
+                published after this time (see Ercot)
 
         Returns:
             pandas.DataFrame: A DataFrame
@@ -2605,18 +2958,26 @@ class Ercot(ISOBase):
             friendly_name_timestamp_before = end
             date = None
 
-        docs = self._get_documents(
+        published_after_cursor = self._handle_publish_cursor(published_after_cursor)
+        docs = self._get_documents_after_cursor(
+            published_after_cursor,
             report_type_id=SCED_SYSTEM_LAMBDA_RTID,
             date=date,
+            published_after=published_after_cursor,
             friendly_name_timestamp_after=friendly_name_timestamp_after,
             friendly_name_timestamp_before=friendly_name_timestamp_before,
             verbose=verbose,
             constructed_name_contains="csv.zip",
         )
+        if not docs:
+            return _empty_after_cursor(
+                self.schema("get_sced_system_lambda").empty(),
+                published_after_cursor,
+            )
 
         df = self._handle_sced_system_lambda(docs, verbose=verbose)
 
-        return df
+        return _with_publish_cursor(df, docs)
 
     def _handle_sced_timestamp(self, df, verbose=False):
         df = df.rename(
@@ -2653,22 +3014,14 @@ class Ercot(ISOBase):
         return df
 
     def _handle_sced_system_lambda(self, docs, verbose):
-        all_dfs = []
-        for doc in tqdm.tqdm(
+        df = self.read_docs(
             docs,
-            desc="Reading SCED System Lambda files",
-            disable=not verbose,
-        ):
-            log(f"Reading {doc.url}", verbose)
-            df = pd.read_csv(doc.url, compression="zip")
-            all_dfs.append(df)
-
-        if len(all_dfs) == 0:
-            df = pd.DataFrame(
+            parse=False,
+            empty_df=pd.DataFrame(
                 columns=["SCEDTimeStamp", "RepeatedHourFlag", "SystemLambda"],
-            )
-        else:
-            df = pd.concat(all_dfs)
+            ),
+            verbose=verbose,
+        )
 
         df = self._handle_sced_timestamp(df, verbose=verbose)
 
@@ -2720,35 +3073,29 @@ class Ercot(ISOBase):
             },
         )
 
-        def _handle_offers(df):
-            return pd.Series(
-                {
-                    "Offered Price": df["Offered Price"].iloc[0],
-                    "Total Offered Quantity": df["Offered Quantity"].sum(),
-                    "Offered Quantities": df["Offered Quantity"].tolist(),
-                },
-            )
-
-        df = (
-            df.groupby(
-                [
-                    "Time",
-                    "Interval Start",
-                    "Interval End",
-                    "Market",
-                    "QSE",
-                    "DME",
-                    "Resource Name",
-                    "AS Type",
-                    "Block Indicator",
-                ],
-                dropna=False,  # Have to include missing because older data has missing
-                # values in some columns
-            )
-            .apply(_handle_offers, include_groups=False)
-            .reset_index()
+        offers = GroupedCurves(
+            df,
+            by=[
+                "Time",
+                "Interval Start",
+                "Interval End",
+                "Market",
+                "QSE",
+                "DME",
+                "Resource Name",
+                "AS Type",
+                "Block Indicator",
+            ],
+            columns=["Offered Price", "Offered Quantity"],
+            dropna=False,  # Have to include missing because older data has missing
+            # values in some columns
         )
 
+        df = offers.keys
+        df["Offered Price"] = offers.first("Offered Price")
+        df["Total Offered Quantity"] = offers.sum("Offered Quantity")
+        df["Offered Quantities"] = offers.to_lists(["Offered Quantity"])
+
         return df
 
     def get_dam_price_corrections(self, dam_type, verbose=False):
@@ -2928,7 +3275,13 @@ class Ercot(ISOBase):
         return df
 
     @support_date_range(frequency=None)
-    def get_real_time_adders_and_reserves(self, date, end=None, verbose=False):
+    def get_real_time_adders_and_reserves(
+        self,
+        date,
+        end=None,
+        verbose=False,
+        published_after_cursor: pd.Timestamp | None = None,
+    ):
         """Get Real-Time ORDC and Reliability Deployment Price Adders and
             Reserves by SCED Interval
 
@@ -2938,33 +3291,54 @@ class Ercot(ISOBase):
             date (str, datetime): date to get data for
             end (str, datetime): end date to get data for
             verbose (bool, optional): print verbose output. Defaults to False.
+            published_after_cursor (pd.Timestamp, optional): only read files
+                published after this time (see Ercot)
         Returns:
             pandas.DataFrame: A DataFrame with ORDC data
 
         NOTE: data only goes back 5 days
         """
         if date == "latest":
-            docs = [
-                self._get_document(
-                    report_type_id=REAL_TIME_ADDERS_AND_RESERVES_RTID,
-                    published_before=date,
-                    verbose=verbose,
-                ),
-            ]
+            docs = self._get_documents_after_cursor(
+                published_after_cursor,
+                report_type_id=REAL_TIME_ADDERS_AND_RESERVES_RTID,
+                date="latest",
+                published_after=self._handle_publish_cursor(published_after_cursor),
+                verbose=verbose,
+            )
         else:
             # Set date to get a full day of published data
             if not end:
                 end = date + pd.DateOffset(days=1)
 
-            docs = self._get_documents(
+            docs = self._get_documents_after_cursor(
+                published_after_cursor,
                 report_type_id=REAL_TIME_ADDERS_AND_RESERVES_RTID,
-                published_after=date,
+                published_after=self._handle_publish_cursor(
+                    published_after_cursor,
+                    date,
+                ),
                 published_before=end,
                 extension="csv",
                 verbose=verbose,
             )
 
-        return self._handle_real_time_adders_and_reserves_docs(docs, verbose=verbose)
+        if not docs:
+            return _empty_after_cursor(
+                pd.DataFrame(
+                    columns=[
+                        "SCED Timestamp",
+                        "Interval Start",
+                        "Interval End",
+                        "BatchID",
+                    ],
+                ),
+                self._handle_publish_cursor(published_after_cursor),
+            )
+
+        df = self._handle_real_time_adders_and_reserves_docs(docs, verbose=verbose)
+
+        return _with_publish_cursor(df, docs)
 
     def _handle_real_time_adders_and_reserves_docs(self, docs, verbose=False):
         df = self.read_docs(docs, parse=False, verbose=verbose)
@@ -3054,6 +3428,72 @@ class Ercot(ISOBase):
 
         return df.sort_values("Interval Start")
 
+    def tail(
+        self,
+        report_type_id: int,
+        since: str | pd.Timestamp | None = None,
+        constructed_name_contains: str | None = None,
+        extension: str | None = None,
+        verbose: bool = False,
+    ) -> tuple[list[Document], pd.Timestamp | None]:
+        """Returns the documents of a report published after since, oldest first,
+        and a cursor to pass as since on the next call.
+
+        Polling with the returned cursor only returns new documents, so each poll
+        only reads what was published since the previous one.
+
+        Arguments:
+            report_type_id (int): ERCOT report type id
+            since (str, pd.Timestamp, optional): publish time of the last
+                document already processed. If None, only the latest document is
+                returned.
+            constructed_name_contains (str, optional): only return documents with
+                this in their constructed name, e.g. "csv.zip"
+            extension (str, optional): only return documents with friendly names
+                ending with this, e.g. "csv"
+            verbose (bool, optional): print verbose output. Defaults to False.
+
+        Returns:
+            tuple[list[Document], pd.Timestamp | None]: the new documents and the
+                publish time of the newest one, or since if there are none
+
+        Example:
+            docs, cursor = ercot.tail(SCED_SYSTEM_LAMBDA_RTID, extension="csv")
+            # later
+            docs, cursor = ercot.tail(
+                SCED_SYSTEM_LAMBDA_RTID,
+                since=cursor,
+                extension="csv",
+            )
+        """
+        since = self._handle_publish_cursor(since)
+
+        try:
+            docs = self._get_documents(
+                report_type_id=report_type_id,
+                date="latest" if since is None else None,
+                published_after=since,
+                constructed_name_contains=constructed_name_contains,
+                extension=extension,
+                verbose=verbose,
+            )
+        except NoDataFoundException:
+            return [], since
+
+        docs = sorted(docs, key=lambda doc: doc.publish_date)
+
+        return docs, docs[-1].publish_date
+
+    def _handle_publish_cursor(self, cursor, published_after=None):
+        """Returns the later of a publish cursor and published_after, ignoring
+        missing values"""
+        cursor = utils._handle_date(cursor, tz=self.default_timezone)
+        if published_after is None or published_after == "latest":
+            return cursor
+        if cursor is None:
+            return published_after
+        return max(cursor, published_after)
+
     def _get_document(
         self,
         report_type_id: int,
@@ -3094,6 +3534,16 @@ class Ercot(ISOBase):
 
         return max(documents, key=lambda x: x.publish_date)
 
+    def _get_documents_after_cursor(self, published_after_cursor, **kwargs):
+        """Like _get_documents, but returns no documents instead of raising if a
+        published_after_cursor is given and nothing was published after it"""
+        try:
+            return self._get_documents(**kwargs)
+        except NoDataFoundException:
+            if published_after_cursor is None:
+                raise
+            return []
+
     def _get_documents(
         self,
         report_type_id: int,
@@ -3166,6 +3616,8 @@ class Ercot(ISOBase):
                 constructed_name=doc["Document"]["ConstructedName"],
                 friendly_name=friendly_name,
                 friendly_name_timestamp=friendly_name_timestamp,
+                doc_id=str(doc["Document"]["DocID"]),
+                report_type_id=report_type_id,
             )
 
             if published_after:
@@ -3201,7 +3653,7 @@ class Ercot(ISOBase):
             if match:
                 matches.append(doc_obj)
 
-        if date == "latest":
+        if date == "latest" and matches:
             return [max(matches, key=lambda x: x.publish_date)]
 
         if not matches:
@@ -3281,8 +3733,7 @@ class Ercot(ISOBase):
         msg = f"Fetching {doc_url}"
         log(msg, verbose)
 
-        r = requests.get(doc_url)
-        z = ZipFile(io.BytesIO(r.content))
+        z = ZipFile(utils.download_to_file(doc_url))
         names = z.namelist()
         settlement_points_file = [
             name for name in names if "Settlement_Points" in name
@@ -3297,12 +3748,37 @@ class Ercot(ISOBase):
         verbose: bool = False,
         request_kwargs: dict | None = None,
         read_csv_kwargs: dict | None = None,
+        filters: dict | None = None,
     ):
+        """Reads a document. If filters, a dict of column name to values to keep,
+        is provided, rows are filtered while the file is parsed."""
         logger.debug(f"Reading {doc.url}")
 
-        response = requests.get(doc.url, **(request_kwargs or {})).content
-        df = pd.read_csv(
-            io.BytesIO(response), compression="zip", **(read_csv_kwargs or {})
+        # the csv is parsed as it is decompressed from the downloaded file, so
+        # the file is never held in memory uncompressed
+        with utils.download_to_file(doc.url, **(request_kwargs or {})) as f:
+            return self._read_doc_file(
+                f,
+                parse=parse,
+                verbose=verbose,
+                read_csv_kwargs=read_csv_kwargs,
+                filters=filters,
+            )
+
+    def _read_doc_file(
+        self,
+        f,
+        parse: bool = True,
+        verbose: bool = False,
+        read_csv_kwargs: dict | None = None,
+        filters: dict | None = None,
+    ):
+        """Reads a downloaded document, a zipped csv"""
+        df = utils.read_csv_filtered(
+            f,
+            filters=filters,
+            compression="zip",
+            **(read_csv_kwargs or {}),
         )
 
         if parse:
@@ -3316,22 +3792,118 @@ class Ercot(ISOBase):
         empty_df: pd.DataFrame | None = None,
         verbose: bool = False,
         request_kwargs: dict | None = None,
+        filters: dict | None = None,
     ):
         if len(docs) == 0:
             return empty_df
 
-        dfs = []
-        for doc in tqdm.tqdm(docs, desc="Reading files", disable=not verbose):
-            dfs.append(
-                self.read_doc(
-                    doc,
-                    parse=parse,
-                    verbose=verbose,
-                    request_kwargs=request_kwargs,
-                ),
-            )
+        dfs = [None] * len(docs)
+        with tqdm.tqdm(
+            total=len(docs),
+            desc="Reading files",
+            disable=not verbose,
+        ) as pbar:
+            # batches are parsed as they are downloaded, so only one batch of
+            # files is held at a time
+            for indices, files in self._iter_archive_batches(docs, verbose=verbose):
+                for i, f in zip(indices, files):
+                    with f:
+                        dfs[i] = self._read_doc_file(
+                            f,
+                            parse=parse,
+                            verbose=verbose,
+                            filters=filters,
+                        )
+                    pbar.update()
+
+            # recent docs and batches the archive couldn't download
+            for i, doc in enumerate(docs):
+                if dfs[i] is None:
+                    dfs[i] = self.read_doc(
+                        doc,
+                        parse=parse,
+                        verbose=verbose,
+                        request_kwargs=request_kwargs,
+                        filters=filters,
+                    )
+                    pbar.update()
+
         return pd.concat(dfs).reset_index(drop=True)
 
+    def _get_archive_api(self):
+        """ErcotAPI for archive downloads, or None without credentials"""
+        if self.archive_api is None:
+            if not all(os.getenv(v) for v in ERCOT_API_CREDENTIAL_VARIABLES):
+                return None
+
+            from gridstatus.ercot_api.ercot_api import ErcotAPI
+
+            self.archive_api = ErcotAPI()
+
+        return self.archive_api
+
+    def _iter_archive_batches(self, docs: list[Document], verbose=False):
+        """Downloads docs in batches from the ERCOT API archive if there are
+        enough docs old enough to be archived, all from one report with an
+        archive. Yields the indices in docs of each batch and its files.
+
+        Batches the archive can't download, e.g. after a connection error, are
+        logged and skipped, so those docs are downloaded from MIS.
+        Authentication errors are raised.
+        """
+        threshold = self.archive_document_threshold
+        if threshold is None or len(docs) < threshold:
+            return
+
+        archived_before = pd.Timestamp.now(tz=self.default_timezone) - (
+            self.archive_document_min_age
+        )
+        indices = [
+            i
+            for i, doc in enumerate(docs)
+            if doc.doc_id is not None and doc.publish_date < archived_before
+        ]
+        if len(indices) < threshold:
+            return
+
+        emil_ids = {ARCHIVE_EMIL_IDS.get(docs[i].report_type_id) for i in indices}
+        if len(emil_ids) != 1 or None in emil_ids:
+            return
+
+        api = self._get_archive_api()
+        if api is None:
+            return
+
+        (emil_id,) = emil_ids
+        log(f"Downloading {len(indices)} files from the {emil_id} archive", verbose)
+
+        for batch_start in range(0, len(indices), api.batch_size):
+            batch = indices[batch_start : batch_start + api.batch_size]
+            try:
+                files = api._bulk_download_batch(
+                    doc_ids=[docs[i].doc_id for i in batch],
+                    emil_id=emil_id,
+                )
+            except requests.RequestException as e:
+                # e.g. connection errors and timeouts, but not invalid credentials
+                response = getattr(e, "response", None)
+                if response is not None and response.status_code in (401, 403):
+                    raise
+                self._log_archive_batch_failed(batch, emil_id, e)
+                continue
+            except (BadZipFile, NoDataFoundException) as e:
+                self._log_archive_batch_failed(batch, emil_id, e)
+                continue
+
+            yield batch, files
+
+    @staticmethod
+    def _log_archive_batch_failed(batch, emil_id, e):
+        logger.warning(
+            f"Could not download {len(batch)} files from the {emil_id} archive, "
+            f"downloading them from MIS instead: {e!r}",
+        )
+
     def parse_doc(
         self,
         doc: pd.DataFrame,
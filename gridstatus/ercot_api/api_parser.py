@@ -1,3 +1,4 @@
+import json
 import types
 from datetime import date, datetime
 from typing import Union
@@ -75,6 +76,16 @@ def _bool_parser(boolvalue: Union[str, bool]) -> str:
         return boolvalue.lower()
 
 
+def get_endpoints_map(endpoints_map_file: str) -> dict:
+    """Returns the parsed endpoints map, reading and parsing the endpoints file
+    only once per process"""
+    global _endpoints_map
+    if _endpoints_map is None:
+        with open(endpoints_map_file) as f:
+            _endpoints_map = parse_all_endpoints(apijson=json.load(f))
+    return _endpoints_map
+
+
 def parse_all_endpoints(apijson: dict) -> dict:
     return {
         endpoint_string: _parse_endpoint_contents(contents)
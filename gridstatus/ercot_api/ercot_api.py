@@ -1,7 +1,8 @@
 import argparse
-import json
 import os
 import random
+import shutil
+import tempfile
 import time
 from typing import Dict
 from zipfile import ZipFile
@@ -16,7 +17,7 @@ from gridstatus import utils
 from gridstatus.base import Markets, NoDataFoundException
 from gridstatus.decorators import support_date_range
 from gridstatus.ercot import ELECTRICAL_BUS_LOCATION_TYPE, Ercot
-from gridstatus.ercot_api.api_parser import _timestamp_parser, parse_all_endpoints
+from gridstatus.ercot_api.api_parser import _timestamp_parser, get_endpoints_map
 from gridstatus.ercot_constants import (
     SOLAR_ACTUAL_AND_FORECAST_BY_GEOGRAPHICAL_REGION_COLUMNS,
     SOLAR_ACTUAL_AND_FORECAST_COLUMNS,
@@ -166,11 +167,10 @@ class ErcotAPI:
             )
 
         self.client_id = "fec253ea-0d06-4272-a5e6-b478baeecd70"  # From the docs
-        self.endpoints_map = self._get_endpoints_map()
         self.token_url = TOKEN_URL
         self.token = None
         self.token_expiry = None
-        self.ercot = Ercot()
+        self._ercot = None
 
         self.sleep_seconds = sleep_seconds
         self.initial_delay = min(max(0.1, sleep_seconds), 60.0)
@@ -178,6 +178,17 @@ class ErcotAPI:
         # maximum batch size support by ERCOT API is 1000
         self.batch_size = min(max(1, batch_size), 1_000)
 
+    @property
+    def endpoints_map(self) -> dict:
+        return self._get_endpoints_map()
+
+    @property
+    def ercot(self) -> Ercot:
+        """Ercot instance used to reuse its parsers, created on first use"""
+        if self._ercot is None:
+            self._ercot = Ercot()
+        return self._ercot
+
     def _local_now(self):
         return pd.Timestamp("now", tz=self.default_timezone)
 
@@ -372,7 +383,7 @@ class ErcotAPI:
         )
 
     def _handle_wind_actual_and_forecast_hourly(self, data, columns, verbose=False):
-        data = Ercot().parse_doc(data, verbose=verbose)
+        data = self.ercot.parse_doc(data, verbose=verbose)
 
         data.columns = data.columns.str.replace("_", " ")
 
@@ -389,7 +400,7 @@ class ErcotAPI:
             .sort_values(["Interval Start", "Publish Time"])
         )
 
-        data = Ercot()._rename_hourly_wind_or_solar_report(data)
+        data = self.ercot._rename_hourly_wind_or_solar_report(data)
 
         return data[columns]
 
@@ -469,7 +480,7 @@ class ErcotAPI:
         )
 
     def _handle_solar_actual_and_forecast_hourly(self, data, columns, verbose=False):
-        data = Ercot().parse_doc(data, verbose=verbose)
+        data = self.ercot.parse_doc(data, verbose=verbose)
 
         data.columns = data.columns.str.replace("_", " ")
 
@@ -486,7 +497,7 @@ class ErcotAPI:
             .sort_values(["Interval Start", "Publish Time"])
         )
 
-        data = Ercot()._rename_hourly_wind_or_solar_report(data)
+        data = self.ercot._rename_hourly_wind_or_solar_report(data)
 
         return data[columns]
 
@@ -621,10 +632,10 @@ class ErcotAPI:
             verbose=verbose,
         )
 
-        df = Ercot().parse_doc(data)
+        df = self.ercot.parse_doc(data)
         df["Publish Time"] = pd.to_datetime(df["postDatetime"])
 
-        return Ercot()._handle_as_plan(df)
+        return self.ercot._handle_as_plan(df)
 
     @support_date_range(frequency=None)
     def get_lmp_by_settlement_point(self, date, end=None, verbose=False):
@@ -1074,9 +1085,9 @@ class ErcotAPI:
             verbose=verbose,
         )
 
-        data = Ercot().parse_doc(data, verbose=verbose)
+        data = self.ercot.parse_doc(data, verbose=verbose)
 
-        data = Ercot()._finalize_spp_df(
+        data = self.ercot._finalize_spp_df(
             data,
             market=Markets.REAL_TIME_15_MIN,
             locations="ALL",
@@ -1114,9 +1125,9 @@ class ErcotAPI:
             verbose=verbose,
         )
 
-        data = Ercot().parse_doc(data, verbose=verbose)
+        data = self.ercot.parse_doc(data, verbose=verbose)
 
-        data = Ercot()._finalize_spp_df(
+        data = self.ercot._finalize_spp_df(
             data,
             market=Markets.DAY_AHEAD_HOURLY,
             locations="ALL",
@@ -1186,7 +1197,7 @@ class ErcotAPI:
             zip_file = ZipFile(bytes)
 
             # Process load resources
-            processed_files = Ercot()._handle_60_day_dam_disclosure(
+            processed_files = self.ercot._handle_60_day_dam_disclosure(
                 z=zip_file,
                 process=True,
                 verbose=verbose,
@@ -1248,7 +1259,7 @@ class ErcotAPI:
             zip_file = ZipFile(bytes)
 
             # Process load resources
-            processed_files = Ercot()._handle_60_day_sced_disclosure(
+            processed_files = self.ercot._handle_60_day_sced_disclosure(
                 z=zip_file,
                 process=process,
                 verbose=verbose,
@@ -1386,44 +1397,65 @@ class ErcotAPI:
         self,
         doc_ids: list[str],
         emil_id: str,
-    ) -> list[pd.io.common.BytesIO]:
+    ) -> list:
         documents = []
-        doc_id_batches = [
-            doc_ids[i : i + self.batch_size]
-            for i in range(0, len(doc_ids), self.batch_size)
-        ]
-        # empty list that is the length of the doc_ids
-        # we will fill this list with the documents in the correct order
-        documents = [None] * len(doc_ids)
-        for batch in doc_id_batches:
-            payload = {"docIds": batch}
-            response = self.make_api_call(
-                f"{BASE_URL}/archive/{emil_id}/download",
-                api_params=payload,
-                parse_json=False,
-                method="POST",
+        for i in range(0, len(doc_ids), self.batch_size):
+            documents.extend(
+                self._bulk_download_batch(
+                    doc_ids=doc_ids[i : i + self.batch_size],
+                    emil_id=emil_id,
+                ),
             )
+        return documents
 
-            with ZipFile(pd.io.common.BytesIO(response)) as outer_zip:
-                logger.debug(
-                    f"Received zip file with {len(outer_zip.namelist())} files",
-                )
+    def _bulk_download_batch(
+        self,
+        doc_ids: list[str],
+        emil_id: str,
+    ) -> list:
+        """Downloads up to batch_size documents in one request. Returns the
+        documents in the order of doc_ids as files that are moved to disk when
+        they are large.
 
-                for inner_zip_name in outer_zip.namelist():
-                    # place the document in the correct index
-                    # based of the supplied doc_ids order
-                    # since downstream code expects this
-                    doc_id = inner_zip_name.split(".")[0]
-                    doc_index = doc_ids.index(doc_id)
-                    with outer_zip.open(inner_zip_name) as inner_zip_file:
-                        documents[doc_index] = pd.io.common.BytesIO(
-                            inner_zip_file.read(),
-                        )
+        Raises:
+            NoDataFoundException: if the archive didn't return every document
+        """
+        response = self.make_api_call(
+            f"{BASE_URL}/archive/{emil_id}/download",
+            api_params={"docIds": doc_ids},
+            parse_json=False,
+            method="POST",
+        )
 
-        # assert there are no None values in the documents list
-        # because this would indicate we missed a document
-        assert None not in documents, "Missing documents in bulk download"
-        return documents
+        documents = dict.fromkeys(doc_ids)
+        with ZipFile(pd.io.common.BytesIO(response)) as outer_zip:
+            logger.debug(
+                f"Received zip file with {len(outer_zip.namelist())} files",
+            )
+
+            for inner_zip_name in outer_zip.namelist():
+                doc_id = inner_zip_name.split(".")[0]
+                if doc_id not in documents:
+                    continue
+                f = tempfile.SpooledTemporaryFile(
+                    max_size=utils.SPOOL_MAX_MEMORY_BYTES,
+                )
+                with outer_zip.open(inner_zip_name) as inner_zip_file:
+                    shutil.copyfileobj(inner_zip_file, f)
+                f.seek(0)
+                documents[doc_id] = f
+
+        missing = [doc_id for doc_id, f in documents.items() if f is None]
+        if missing:
+            for f in documents.values():
+                if f is not None:
+                    f.close()
+            raise NoDataFoundException(
+                f"Missing documents in bulk download from {emil_id}: {missing}",
+            )
+
+        # downstream code expects the order of doc_ids
+        return [documents[doc_id] for doc_id in doc_ids]
 
     def _get_historical_data_links(
         self,
@@ -1630,10 +1662,7 @@ class ErcotAPI:
         return parsed_api_params
 
     def _get_endpoints_map(self):
-        endpoints = json.load(open(ENDPOINTS_MAP_FILE))
-        endpoints = parse_all_endpoints(apijson=endpoints)
-
-        return endpoints
+        return get_endpoints_map(ENDPOINTS_MAP_FILE)
 
     def _create_progress_bar(
         self,
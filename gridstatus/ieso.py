@@ -9,9 +9,8 @@ from urllib.error import HTTPError
 
 import pandas as pd
 import requests
-import xmltodict
 
-from gridstatus import utils
+from gridstatus import ieso_utils, utils
 from gridstatus.base import ISOBase, NotSupported
 from gridstatus.decorators import support_date_range
 from gridstatus.gs_logging import logger
@@ -651,97 +650,16 @@ class IESO(ISOBase):
             date.strftime("_%Y%m%d") if date != "latest" else "",
         )
 
-        r = self._request(url, verbose)
-
-        root = ET.fromstring(r.content)
-
-        # Define the namespace map. This is different than all the other XML files
-        ns = {"": "http://www.theIMO.com/schema"}
-
-        date = root.find(".//Date", ns).text
-
-        data = []
+        r = self._request(url, verbose, stream=True)
 
-        for gen in root.findall(".//Generator", ns):
-            generator_name = gen.find("GeneratorName", ns).text
-            fuel_type = gen.find("FuelType", ns).text
-
-            for output in gen.findall("Outputs/Output", ns):
-                hour = output.find("Hour", ns).text
-                energy_mw = (
-                    output.find("EnergyMW", ns).text
-                    if output.find(
-                        "EnergyMW",
-                        ns,
-                    )
-                    is not None
-                    else None
-                )
-
-                # For SOLAR/WIND, the forecast is stored under the capability and these
-                # Fuel types have an available capacity. See the schema definition:
-                # http://reports.ieso.ca/docrefs/schema/GenOutputCapability_r3.xsd
-                # There is no capability for these generators.
-                if fuel_type in ["SOLAR", "WIND"]:
-                    forecast_mw = (
-                        gen.find(f".//Capabilities/Capability[Hour='{hour}']", ns)
-                        .find("EnergyMW", ns)
-                        .text
-                    )
-
-                    available_capacity_mw = (
-                        gen.find(
-                            f".//Capacities/AvailCapacity[Hour='{hour}']",
-                            ns,
-                        )
-                        .find("EnergyMW", ns)
-                        .text
-                    )
-
-                    capability_mw = None
-
-                # For non-SOLAR/WIND, there is no forecast or available capacity.
-                # Instead, there is a capability.
-                else:
-                    forecast_mw = None
-
-                    capability_mw = (
-                        gen.find(
-                            f".//Capabilities/Capability[Hour='{hour}']",
-                            ns,
-                        )
-                        .find("EnergyMW", ns)
-                        .text
-                    )
-
-                    available_capacity_mw = None
-
-                data.append(
-                    [
-                        date,
-                        hour,
-                        generator_name,
-                        fuel_type,
-                        energy_mw,
-                        capability_mw,
-                        available_capacity_mw,
-                        forecast_mw,
-                    ],
-                )
-
-        columns = [
-            "Date",
-            "Hour",
-            "Generator Name",
-            "Fuel Type",
-            "Output MW",
-            "Capability MW",
-            "Available Capacity MW",
-            "Forecast MW",
-        ]
+        # Stream the XML instead of loading the whole document into memory
+        with r:
+            data = ieso_utils.parse_generator_output_capability(r.raw)
 
-        # Creating the DataFrame with the correct date
-        df = pd.DataFrame(data, columns=columns)
+        df = pd.DataFrame(
+            data,
+            columns=ieso_utils.GENERATOR_OUTPUT_CAPABILITY_COLUMNS,
+        )
         df["Interval Start"] = (
             pd.to_datetime(df["Date"])
             + pd.to_timedelta(
@@ -783,63 +701,17 @@ class IESO(ISOBase):
             str(date.year),
         )
 
-        r = self._request(url, verbose)
+        r = self._request(url, verbose, stream=True)
 
-        root = ET.fromstring(r.content)
-        ns = NAMESPACES_FOR_XML
-        data = []
-
-        # Iterate through each day
-        for day_data in root.findall(".//DailyData", ns):
-            date = (
-                day_data.find("Day", ns).text
-                if day_data.find("Day", ns) is not None
-                else None
-            )
+        # A year of hourly data is large, so stream it instead of loading the
+        # whole document into memory
+        with r:
+            data = ieso_utils.parse_historical_fuel_mix(r.raw)
 
-            # Iterate through each hour of the day
-            for hourly_data in day_data.findall("HourlyData", ns):
-                hour = (
-                    hourly_data.find("Hour", ns).text
-                    if hourly_data.find("Hour", ns) is not None
-                    else None
-                )
+        # Title case the fuel types, e.g. NUCLEAR -> Nuclear
+        data = {column.title(): values for column, values in data.items()}
 
-                # Initialize fuel type outputs
-                fuel_outputs = {
-                    "NUCLEAR": 0,
-                    "GAS": 0,
-                    "HYDRO": 0,
-                    "WIND": 0,
-                    "SOLAR": 0,
-                    "BIOFUEL": 0,
-                }
-
-                # Extracting output for each fuel type
-                for fuel_total in hourly_data.findall("FuelTotal", ns):
-                    fuel_type = (
-                        fuel_total.find("Fuel", ns).text
-                        if fuel_total.find("Fuel", ns) is not None
-                        else None
-                    )
-                    output = (
-                        fuel_total.find(".//Output", ns).text
-                        if fuel_total.find(".//Output", ns) is not None
-                        else 0
-                    )
-
-                    if fuel_type in fuel_outputs:
-                        fuel_outputs[fuel_type] = float(output)
-
-                # Adding the row to the data list
-                row = [date, hour] + list(fuel_outputs.values())
-                data.append(row)
-
-        columns = ["Date", "Hour"] + list(fuel_outputs.keys())
-        columns = [c.title() for c in columns]
-
-        # Creating the DataFrame with the adjusted parsing logic
-        df = pd.DataFrame(data, columns=columns)
+        df = pd.DataFrame(data)
         df["Interval Start"] = (
             pd.to_datetime(df["Date"])
             + pd.to_timedelta(
@@ -1087,7 +959,12 @@ class IESO(ISOBase):
 
         return data.sort_values("Interval Start")
 
-    def _request(self, url: str, verbose: bool = False):
+    def _request(self, url: str, verbose: bool = False, stream: bool = False):
+        """Gets a URL, retrying failed requests.
+
+        With stream=True, the body isn't downloaded up front and can be read
+        incrementally from r.raw, which transparently decompresses it.
+        """
         logger.info(f"Fetching URL: {url}")
 
         max_retries = 3
@@ -1103,11 +980,13 @@ class IESO(ISOBase):
             tls_verify = True
 
         while retry_num < max_retries:
-            r = requests.get(url, verify=tls_verify)
+            r = requests.get(url, verify=tls_verify, stream=stream)
 
             if r.ok:
                 break
 
+            r.close()
+
             retry_num += 1
             logger.info(f"Request failed. Error: {r.reason}. Retrying {retry_num}...")
 
@@ -1120,6 +999,9 @@ class IESO(ISOBase):
                 f"Failed to retrieve data from {url} in {max_retries} tries.",
             )
 
+        if stream:
+            r.raw.decode_content = True
+
         return r
 
     @support_date_range(frequency="DAY_START")
@@ -1193,6 +1075,8 @@ class IESO(ISOBase):
         Returns:
             tuple[dict, datetime.datetime]: The Resource Adequacy Report JSON and its last modified time
         """
+        import xmltodict
+
         base_url = "https://reports-public.ieso.ca/public/Adequacy2"
 
         if isinstance(date, (datetime.datetime, datetime.date)):
@@ -1256,6 +1140,8 @@ class IESO(ISOBase):
         return json_data, last_modified_time
 
     def _fetch_and_parse_file(self, base_url: str, file: str) -> dict:
+        import xmltodict
+
         url = f"{base_url}/{file}"
         r = self._request(url)
         return xmltodict.parse(r.text)
@@ -0,0 +1,165 @@
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Iterator
+
+# Fuel types in the historical fuel mix report, in column order
+HISTORICAL_FUEL_TYPES = ["NUCLEAR", "GAS", "HYDRO", "WIND", "SOLAR", "BIOFUEL"]
+
+GENERATOR_OUTPUT_CAPABILITY_COLUMNS = [
+    "Date",
+    "Hour",
+    "Generator Name",
+    "Fuel Type",
+    "Output MW",
+    "Capability MW",
+    "Available Capacity MW",
+    "Forecast MW",
+]
+
+
+def local_name(tag: str) -> str:
+    """Tag name without its namespace"""
+    return tag.rpartition("}")[2]
+
+
+def iterparse_elements(source: BinaryIO, tags: set[str]) -> Iterator[ET.Element]:
+    """Yields every element whose name (ignoring namespace) is in tags once it is
+    fully parsed. The element is removed from the tree after it is yielded, so
+    memory use doesn't grow with the size of the document."""
+    stack = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if local_name(elem.tag) in tags:
+            yield elem
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+
+def _child_text(elem: ET.Element, name: str) -> str | None:
+    """Text of the first child named name, or None if there is no such child"""
+    for child in elem:
+        if local_name(child.tag) == name:
+            return child.text
+    return None
+
+
+def _values_by_hour(container: ET.Element | None) -> dict[str, str | None]:
+    """Maps hour to EnergyMW for the hourly items of a container such as
+    Capabilities or Capacities. The first item for an hour wins."""
+    values = {}
+    if container is None:
+        return values
+
+    for item in container:
+        values.setdefault(_child_text(item, "Hour"), _child_text(item, "EnergyMW"))
+
+    return values
+
+
+def parse_generator_output_capability(source: BinaryIO) -> dict[str, list]:
+    """Parses a GenOutputCapability report into columns of
+    GENERATOR_OUTPUT_CAPABILITY_COLUMNS, one row per generator per hour.
+
+    For SOLAR and WIND, the forecast is stored under the capability and these
+    fuel types have an available capacity. All other fuel types only have a
+    capability. See the schema definition:
+    http://reports.ieso.ca/docrefs/schema/GenOutputCapability_r3.xsd
+    """
+    data = {column: [] for column in GENERATOR_OUTPUT_CAPABILITY_COLUMNS}
+    date = None
+
+    for elem in iterparse_elements(source, {"Date", "Generator"}):
+        if local_name(elem.tag) == "Date":
+            if date is None:
+                date = elem.text
+            continue
+
+        generator_name = None
+        fuel_type = None
+        outputs = []
+        capabilities = None
+        capacities = None
+
+        for child in elem:
+            name = local_name(child.tag)
+            if name == "GeneratorName":
+                generator_name = child.text
+            elif name == "FuelType":
+                fuel_type = child.text
+            elif name == "Outputs":
+                outputs = [
+                    (_child_text(output, "Hour"), _child_text(output, "EnergyMW"))
+                    for output in child
+                ]
+            elif name == "Capabilities":
+                capabilities = child
+            elif name == "Capacities":
+                capacities = child
+
+        # build hour lookups once per generator instead of searching per hour
+        capability_by_hour = _values_by_hour(capabilities)
+        capacity_by_hour = _values_by_hour(capacities)
+        is_variable = fuel_type in ["SOLAR", "WIND"]
+
+        for hour, energy_mw in outputs:
+            data["Hour"].append(hour)
+            data["Generator Name"].append(generator_name)
+            data["Fuel Type"].append(fuel_type)
+            data["Output MW"].append(energy_mw)
+
+            if is_variable:
+                data["Capability MW"].append(None)
+                data["Available Capacity MW"].append(capacity_by_hour.get(hour))
+                data["Forecast MW"].append(capability_by_hour.get(hour))
+            else:
+                data["Capability MW"].append(capability_by_hour.get(hour))
+                data["Available Capacity MW"].append(None)
+                data["Forecast MW"].append(None)
+
+    data["Date"] = [date] * len(data["Hour"])
+
+    return data
+
+
+def parse_historical_fuel_mix(source: BinaryIO) -> dict[str, list]:
+    """Parses a yearly GenOutputbyFuelHourly report into columns of Date, Hour and
+    each of HISTORICAL_FUEL_TYPES, one row per hour. Fuel types missing from an
+    hour are 0."""
+    data = {column: [] for column in ["Date", "Hour"] + HISTORICAL_FUEL_TYPES}
+
+    for daily_data in iterparse_elements(source, {"DailyData"}):
+        day = _child_text(daily_data, "Day")
+
+        for hourly_data in daily_data:
+            if local_name(hourly_data.tag) != "HourlyData":
+                continue
+
+            fuel_outputs = dict.fromkeys(HISTORICAL_FUEL_TYPES, 0)
+
+            for fuel_total in hourly_data:
+                if local_name(fuel_total.tag) != "FuelTotal":
+                    continue
+
+                fuel_type = _child_text(fuel_total, "Fuel")
+                output = next(
+                    (
+                        e.text
+                        for e in fuel_total.iter()
+                        if local_name(e.tag) == "Output"
+                    ),
+                    0,
+                )
+
+                if fuel_type in fuel_outputs:
+                    fuel_outputs[fuel_type] = float(output)
+
+            data["Date"].append(day)
+            data["Hour"].append(_child_text(hourly_data, "Hour"))
+            for fuel_type, output in fuel_outputs.items():
+                data[fuel_type].append(output)
+
+    return data
@@ -1,9 +1,10 @@
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import BinaryIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from gridstatus import utils
 from gridstatus.base import (
@@ -17,6 +18,18 @@ from gridstatus.decorators import support_date_range
 from gridstatus.gs_logging import log
 from gridstatus.lmp_config import lmp_config
 
+DAY_AHEAD_LMP_URL = "https://www.iso-ne.com/static-transform/csv/histRpts/da-lmp/WW_DALMP_ISO_{date_str}.csv"  # noqa
+REAL_TIME_5_MIN_LMP_URL = "https://www.iso-ne.com/static-transform/csv/histRpts/5min-rt-prelim/lmp_5min_{date_str}_{interval}.csv"  # noqa
+
+# Locations rarely change, so the location table used to fill in location
+# information for real time LMPs is only rebuilt once it is this old
+LOCATION_TABLE_MAX_AGE = pd.Timedelta(days=1)
+
+# Shared by all ISONE instances. "dates" are the days whose day ahead locations
+# have been added to the table.
+_location_table_cache = {"table": None, "fetched_at": None, "dates": set()}
+_location_table_lock = threading.Lock()
+
 
 class ISONE(ISOBase):
     """ISO New England (ISONE)"""
@@ -405,6 +418,10 @@ class ISONE(ISOBase):
         if locations is None:
             locations = "ALL"
 
+        # the real time 5 minute files only have location ids, so they can only
+        # be filtered after the location table is merged in
+        location_filters = utils.location_filters(locations, "Location Name")
+
         now = pd.Timestamp.now(tz=self.default_timezone)
 
         if market == Markets.REAL_TIME_5_MIN:
@@ -419,24 +436,27 @@ class ISONE(ISOBase):
                     self.lmp_real_time_intervals,
                 )
 
-            dfs = []
-            for interval in intervals:
+            def _get_interval(interval):
                 msg = "Loading interval {}".format(interval)
                 log(msg, verbose=verbose)
-                u = f"https://www.iso-ne.com/static-transform/csv/histRpts/5min-rt-prelim/lmp_5min_{date_str}_{interval}.csv"  # noqa
+                u = REAL_TIME_5_MIN_LMP_URL.format(date_str=date_str, interval=interval)
                 # Use a try and except in case the data for previous intervals is not
                 # published yet.
                 try:
-                    dfs.append(
-                        pd.read_csv(
-                            u,
-                            skiprows=[0, 1, 2, 3, 5],
-                            skipfooter=1,
-                            engine="python",
-                        ),
-                    )
+                    r = requests.get(u)
+                    r.raise_for_status()
+                    return _read_csv(r.content, skiprows=[0, 1, 2, 3, 5])
                 except Exception as e:
                     log(f"Failed to load {u} with {e}", verbose=verbose)
+                    return None
+
+            # intervals are separate files, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=max(len(intervals), 1)) as executor:
+                dfs = [
+                    df
+                    for df in executor.map(_get_interval, intervals)
+                    if df is not None
+                ]
 
             data_intervals = None
 
@@ -488,14 +508,16 @@ class ISONE(ISOBase):
                 url,
                 skiprows=[0, 1, 2, 3, 5],
                 verbose=verbose,
+                filters=location_filters,
             )
 
         elif market == Markets.DAY_AHEAD_HOURLY:
-            url = f"https://www.iso-ne.com/static-transform/csv/histRpts/da-lmp/WW_DALMP_ISO_{date_str}.csv"  # noqa
+            url = DAY_AHEAD_LMP_URL.format(date_str=date_str)
             data = _make_request(
                 url,
                 skiprows=[0, 1, 2, 3, 5],
                 verbose=verbose,
+                filters=location_filters,
             )
 
         else:
@@ -562,25 +584,24 @@ class ISONE(ISOBase):
 
         # handle missing location information for some markets
         if market != Markets.DAY_AHEAD_HOURLY:
-            day_ahead = self.get_lmp(
-                # query for same day in case it matters
-                date=data["Interval Start"].min().date(),
-                market=Markets.DAY_AHEAD_HOURLY,
-                locations=locations,
-                include_id=True,
-            )
-            location_mapping = day_ahead.drop_duplicates("Location Id")[
-                ["Location", "Location Id", "Location Type"]
-            ]
-
-            if "Location Id" in data.columns:
-                data = data.merge(
-                    location_mapping,
-                    how="left",
-                    on="Location Id",
+            on = "Location Id" if "Location Id" in data.columns else "Location"
+            if data.empty:
+                # none of the requested locations were in the file
+                location_table = pd.DataFrame(
+                    columns=["Location", "Location Id", "Location Type"],
+                )
+            else:
+                location_table = self._get_location_table(
+                    # use locations from the same day in case they changed
+                    date=data["Interval Start"].min().date(),
+                    required=data[on],
+                    on=on,
                 )
-            elif "Location" in data.columns:
-                data = data.merge(location_mapping, how="left", on="Location")
+            data = data.merge(
+                location_table.drop_duplicates(on),
+                how="left",
+                on=on,
+            )
 
         data = data[
             [
@@ -604,6 +625,53 @@ class ISONE(ISOBase):
         data = utils.filter_lmp_locations(data, locations)
         return data
 
+    def _get_location_table(self, date, required=None, on="Location Id", verbose=False):
+        """Location, Location Id and Location Type of each pricing location.
+
+        Only the day ahead LMP file has all three, so the table is built from
+        the day ahead file for date and cached for LOCATION_TABLE_MAX_AGE. If
+        any of the required values of column on aren't in the cached table,
+        the day ahead locations for date are added to it.
+        """
+        cache = _location_table_cache
+        now = pd.Timestamp.now(tz=self.default_timezone)
+
+        with _location_table_lock:
+            if (
+                cache["table"] is None
+                or now - cache["fetched_at"] > LOCATION_TABLE_MAX_AGE
+            ):
+                cache["table"] = self._get_day_ahead_locations(date, verbose)
+                cache["fetched_at"] = now
+                cache["dates"] = {date}
+
+            elif (
+                required is not None
+                and date not in cache["dates"]
+                and not required.isin(cache["table"][on]).all()
+            ):
+                # locations were added or retired since the table was built
+                cache["table"] = (
+                    pd.concat(
+                        [cache["table"], self._get_day_ahead_locations(date, verbose)],
+                    )
+                    .drop_duplicates("Location Id")
+                    .reset_index(drop=True)
+                )
+                cache["dates"].add(date)
+
+            return cache["table"]
+
+    def _get_day_ahead_locations(self, date, verbose=False):
+        url = DAY_AHEAD_LMP_URL.format(date_str=date.strftime("%Y%m%d"))
+        data = _make_request(url, skiprows=[0, 1, 2, 3, 5], verbose=verbose)
+
+        return data.rename(
+            columns={"Location Name": "Location", "Location ID": "Location Id"},
+        )[["Location", "Location Id", "Location Type"]].drop_duplicates(
+            "Location Id",
+        )
+
     def get_raw_interconnection_queue(self, verbose=False) -> BinaryIO:
         """Extract raw ISONE interconnection queue data.
 
@@ -622,6 +690,8 @@ class ISONE(ISOBase):
         You can see the image to text mapping in the upper left hand
         corner of the ISONE Queue data page: https://irtt.iso-ne.com/reports/external.
         """
+        from bs4 import BeautifulSoup
+
         r = requests.get("https://irtt.iso-ne.com/reports/external")
 
         soup = BeautifulSoup(r.text, "html.parser")
@@ -859,7 +929,7 @@ class ISONE(ISOBase):
         return selected_intervals
 
 
-def _make_request(url, skiprows, verbose):
+def _make_request(url, skiprows, verbose, filters=None):
     attempt = 0
     while attempt < 3:
         with requests.Session() as s:
@@ -887,15 +957,30 @@ def _make_request(url, skiprows, verbose):
                 try again later",
         )
 
-    df = pd.read_csv(
-        io.StringIO(response.content.decode("utf8")),
+    df = _read_csv(
+        response.content,
         skiprows=skiprows,
-        skipfooter=1,
-        engine="python",
+        filters=filters,
     ).drop_duplicates()
     return df
 
 
+def _read_csv(content, skiprows, filters=None):
+    """Reads an ISONE csv report, which ends with a trailer row.
+
+    The trailer row is removed before parsing so the C parser can be used
+    instead of the much slower python parser with skipfooter. Rows not matching
+    filters are dropped while parsing.
+    """
+    content = content.rstrip(b"\r\n")
+    content = content[: content.rfind(b"\n") + 1]
+    return utils.read_csv_filtered(
+        io.BytesIO(content),
+        filters=filters,
+        skiprows=skiprows,
+    )
+
+
 def _make_wsclient_request(url, data, verbose=False):
     """Make request to ISO NE wsclient"""
 
@@ -1,10 +1,8 @@
 import os
 import time
-from datetime import datetime
 from typing import Literal
 
 import pandas as pd
-import pytz
 import requests
 
 from gridstatus import utils
@@ -35,6 +33,55 @@ EXCLUDE_FROM_REALTIME_HOURLY_DEMAND = [
     ".H.INTERNALHUB",
 ]
 
+# Nested fields returned by the API, like {"$": ".Z.MAINE", "@LocId": "4001"},
+# mapped to the columns they are flattened into
+LOCATION_ID_FIELDS = {"$": "Location", "@LocId": "LocId"}
+LOCATION_TYPE_FIELDS = {"$": "Location", "@LocType": "Location Type"}
+INTERFACE_LOCATION_FIELDS = {"$": "Location", "@LocId": "Location Id"}
+
+
+def _flatten_nested_column(
+    df: pd.DataFrame,
+    column: str,
+    fields: dict[str, str],
+) -> pd.DataFrame:
+    """Splits a column of nested records into one column per field. Columns
+    that were already flattened (e.g. plain location names) are left as is."""
+    if df.empty or not isinstance(df[column].iloc[0], dict):
+        return df
+
+    # A list comprehension per field is still a Python loop over the records,
+    # but avoids the overhead of Series.apply and is faster than building a
+    # DataFrame with from_records
+    records = df[column].tolist()
+    for field, name in fields.items():
+        df[name] = [record[field] for record in records]
+
+    return df
+
+
+def _to_local_datetime(values: pd.Series, tz: str) -> pd.Series:
+    """Parses ISO-8601 timestamps with UTC offsets to tz.
+
+    Parsing through UTC handles days where the offset changes (DST). pyarrow
+    parses the offsets natively, which is much faster than pandas for mixed
+    offsets, so it's used when installed."""
+    try:
+        import pyarrow as pa
+
+        utc = pd.Series(
+            pa.array(values, from_pandas=True)
+            .cast(pa.timestamp("ns", tz="UTC"))
+            .to_pandas(),
+            index=values.index,
+            name=values.name,
+        )
+    except (ImportError, TypeError, ValueError):
+        # pyarrow.ArrowInvalid is a ValueError
+        utc = pd.to_datetime(values, utc=True, format="ISO8601")
+
+    return utc.dt.tz_convert(tz)
+
 
 class ISONEAPI:
     """
@@ -65,11 +112,32 @@ class ISONEAPI:
         self.initial_delay = min(sleep_seconds, 60.0)
         self.max_retries = min(max(0, max_retries), 10)
 
-    def parse_problematic_datetime(self, date_string: str | pd.Timestamp) -> datetime:
-        if isinstance(date_string, pd.Timestamp):
-            date_string = date_string.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
-        dt = datetime.strptime(date_string, "%Y-%m-%dT%H:%M:%S.%f%z")
-        return dt.astimezone(pytz.timezone(self.default_timezone))
+    def _normalize(
+        self,
+        df: pd.DataFrame,
+        nested_columns: dict[str, dict[str, str]] | None = None,
+        date_columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Flattens nested fields and parses timestamps for a DataFrame of API
+        records.
+
+        Args:
+            df (pd.DataFrame): records returned by the API
+            nested_columns (dict[str, dict[str, str]], optional): columns holding
+                nested records mapped to their fields and output column names
+            date_columns (list[str], optional): columns of ISO-8601 timestamps to
+                convert to the default timezone
+
+        Returns:
+            pd.DataFrame: the normalized DataFrame
+        """
+        for column, fields in (nested_columns or {}).items():
+            df = _flatten_nested_column(df, column, fields)
+
+        for column in date_columns or []:
+            df[column] = _to_local_datetime(df[column], self.default_timezone)
+
+        return df
 
     def make_api_call(
         self,
@@ -208,7 +276,7 @@ class ISONEAPI:
         mix_df.columns.name = None
 
         mix_df = mix_df.rename(columns={"BeginDate": "Time"})
-        mix_df["Time"] = mix_df["Time"].apply(self.parse_problematic_datetime)
+        mix_df = self._normalize(mix_df, date_columns=["Time"])
         mix_df = mix_df.fillna(0)
         mix_df = utils.move_cols_to_front(mix_df, ["Time"])
 
@@ -241,8 +309,6 @@ class ISONEAPI:
                 url = f"{self.base_url}/realtimehourlydemand/current"
                 response = self.make_api_call(url)
                 df = pd.DataFrame(response["HourlyRtDemands"]["HourlyRtDemand"])
-                df["LocId"] = df["Location"].apply(lambda x: x["@LocId"])
-                df["Location"] = df["Location"].apply(lambda x: x["$"])
                 return self._handle_demand(df, interval_minutes=60)
 
             case ("latest", _):
@@ -331,13 +397,7 @@ class ISONEAPI:
             response = self.make_api_call(url)
             raw_data = response["HourlySystemLoads"]["HourlySystemLoad"]
 
-        df = pd.json_normalize(
-            raw_data,
-            meta=["BeginDate", "Load", "NativeLoad", "ArdDemand"],
-        )
-        df["Location"] = df["Location.$"]
-        df["LocId"] = df["Location.@LocId"]
-        df = df.drop(columns=["Location.$", "Location.@LocId"])
+        df = pd.DataFrame(raw_data)
         df.rename(
             columns={"NativeLoad": "Native Load", "ArdDemand": "ARD Demand"},
             inplace=True,
@@ -384,8 +444,6 @@ class ISONEAPI:
                 url = f"{self.base_url}/dayaheadhourlydemand/current"
                 response = self.make_api_call(url)
                 df = pd.DataFrame(response["HourlyDaDemands"]["HourlyDaDemand"])
-                df["LocId"] = df["Location"].apply(lambda x: x["@LocId"])
-                df["Location"] = df["Location"].apply(lambda x: x["$"])
                 return self._handle_demand(df, interval_minutes=60)
 
             case ("latest", _):
@@ -462,20 +520,12 @@ class ISONEAPI:
                 "Load",
             ]
 
-        try:
-            # Try the standard pandas datetime conversion first
-            df["Interval Start"] = pd.to_datetime(df["BeginDate"])
-            df["Interval Start"] = df["Interval Start"].dt.tz_convert(
-                self.default_timezone,
-            )
-        except AttributeError:
-            # NOTE(kladar) consistently the above logic fails for DST conversion days.
-            # This catches those and fixes it.
-            # Data coming out looks good, no missed intervals and no duplicates.
-            log.warning("Standard datetime conversion failed. Using custom parsing.")
-            df["Interval Start"] = df["BeginDate"].apply(
-                self.parse_problematic_datetime,
-            )
+        df = self._normalize(
+            df,
+            nested_columns={"Location": LOCATION_ID_FIELDS},
+            date_columns=["BeginDate"],
+        )
+        df["Interval Start"] = df["BeginDate"]
 
         df = df.sort_values(["Interval Start", "Location"])
         df["Interval End"] = df["Interval Start"] + pd.Timedelta(
@@ -586,24 +636,7 @@ class ISONEAPI:
         Returns:
             pd.DataFrame: Processed DataFrame.
         """
-        try:
-            # Try the standard pandas datetime conversion first
-
-            date_columns = ["BeginDate", "CreationDate"]
-            df[date_columns] = df[date_columns].apply(pd.to_datetime)
-            df[date_columns] = df[date_columns].apply(
-                lambda x: x.dt.tz_convert(self.default_timezone),
-            )
-
-        except AttributeError:
-            # NOTE(kladar) consistently the above logic fails for DST conversion days.
-            # This catches those and fixes it.
-            # Data coming out looks good, no missed intervals and no duplicates.
-            log.warning("Standard datetime conversion failed. Using custom parsing.")
-            df["BeginDate"] = df["BeginDate"].apply(self.parse_problematic_datetime)
-            df["CreationDate"] = df["CreationDate"].apply(
-                self.parse_problematic_datetime,
-            )
+        df = self._normalize(df, date_columns=["BeginDate", "CreationDate"])
 
         df["Interval End"] = df["BeginDate"] + pd.Timedelta(
             minutes=interval_minutes,
@@ -730,17 +763,18 @@ class ISONEAPI:
         return self._handle_interchange_dataframe(df, interval_minutes=15)
 
     def _handle_interchange_dataframe(self, df: pd.DataFrame, interval_minutes: int):
-        df["Interval Start"] = pd.to_datetime(df["BeginDate"], utc=True).dt.tz_convert(
-            self.default_timezone,
+        # Split location column from {'$': '.I.ROSETON 345 1', '@LocId': '4011'} to
+        # Location and Location Id
+        df = self._normalize(
+            df,
+            nested_columns={"Location": INTERFACE_LOCATION_FIELDS},
+            date_columns=["BeginDate"],
         )
+        df["Interval Start"] = df["BeginDate"]
         df["Interval End"] = df["Interval Start"] + pd.Timedelta(
             minutes=interval_minutes,
         )
 
-        # Split location column from {'$': '.I.ROSETON 345 1', '@LocId': '4011'} to
-        # Location and Location Id
-        df[["Location", "Location Id"]] = pd.json_normalize(df["Location"])
-
         df = df.rename(columns={"ActInterchange": "Actual Interchange"})
 
         return df[
@@ -796,17 +830,18 @@ class ISONEAPI:
         return self._handle_external_flows_dataframe(df, interval_minutes=5)
 
     def _handle_external_flows_dataframe(self, df: pd.DataFrame, interval_minutes: int):
-        df["Interval Start"] = pd.to_datetime(df["BeginDate"], utc=True).dt.tz_convert(
-            self.default_timezone,
+        # Split location column from {'$': '.I.ROSETON 345 1', '@LocId': '4011'} to
+        # Location and Location Id
+        df = self._normalize(
+            df,
+            nested_columns={"Location": INTERFACE_LOCATION_FIELDS},
+            date_columns=["BeginDate"],
         )
+        df["Interval Start"] = df["BeginDate"]
         df["Interval End"] = df["Interval Start"] + pd.Timedelta(
             minutes=interval_minutes,
         )
 
-        # Split location column from {'$': '.I.ROSETON 345 1', '@LocId': '4011'} to
-        # Location and Location Id
-        df[["Location", "Location Id"]] = pd.json_normalize(df["Location"])
-
         df = df.rename(
             columns={
                 "ActualFlow": "Actual Flow",
@@ -892,16 +927,16 @@ class ISONEAPI:
         verbose: bool = False,
     ) -> pd.DataFrame:
         response = self.make_api_call(url)
-        df = pd.DataFrame(response["HourlyLmps"]["HourlyLmp"])
-        df["Interval Start"] = pd.to_datetime(df["BeginDate"], utc=True).dt.tz_convert(
-            self.default_timezone,
+        df = self._normalize(
+            pd.DataFrame(response["HourlyLmps"]["HourlyLmp"]),
+            nested_columns={"Location": LOCATION_TYPE_FIELDS},
+            date_columns=["BeginDate"],
         )
+        df["Interval Start"] = df["BeginDate"]
         df["Interval End"] = df["Interval Start"] + pd.Timedelta(
             minutes=60,
         )
 
-        df["Location Type"] = df["Location"].apply(lambda x: x["@LocType"])
-        df["Location"] = df["Location"].apply(lambda x: x["$"])
         df = df.rename(
             columns={
                 "LmpTotal": "LMP",
@@ -16,12 +16,21 @@ class lmp_config:
     def __call__(self, func):
         lmp_config.configs[func.__qualname__] = self.supports
 
+        # computed once since inspecting the signature is slow relative to
+        # calls for the latest data
+        signature = inspect.signature(func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            bound_args = self._get_bound_args(func, args, kwargs)
+            date_range_kwargs = self._pop_date_range_kwargs(kwargs)
+            bound_args = self._get_bound_args(func, args, kwargs, signature)
             if len(args) > 0 and isinstance(args[0], ISOBase):
                 bound_args = self._verify_bound_args(bound_args)
-                return self._class_method_wrapper(func, bound_args)
+                return self._class_method_wrapper(
+                    func,
+                    bound_args,
+                    **date_range_kwargs,
+                )
             else:
                 # This is a runtime check after method is called.
                 # Possible improvement: move this to "compile"-time.
@@ -57,10 +66,18 @@ class lmp_config:
             )
 
     @staticmethod
-    def _class_method_wrapper(func, bound_args):
+    def _class_method_wrapper(func, bound_args, **extra_kwargs):
         instance_args = bound_args.args
         instance_kwargs = bound_args.kwargs
-        return func(*instance_args, **instance_kwargs)
+        return func(*instance_args, **instance_kwargs, **extra_kwargs)
+
+    @staticmethod
+    def _pop_date_range_kwargs(kwargs):
+        """Removes kwargs handled by @support_date_range (e.g. save_to, stream)
+        so they aren't bound to the signature of the wrapped method"""
+        from gridstatus.decorators import DATE_RANGE_KWARGS
+
+        return {k: kwargs.pop(k) for k in DATE_RANGE_KWARGS if k in kwargs}
 
     def _verify_bound_args(self, bound_args: inspect.BoundArguments):
         """Verify date/start and market args/kwargs. Transform values and injects
@@ -85,8 +102,9 @@ class lmp_config:
             raise ValueError("market is required")
 
         tz = instance.default_timezone
-        date_value = self._parse_date(date, tz=tz)
-        market_value = Markets(market)
+        # the value of "latest" isn't used to check support, so skip parsing it
+        date_value = None if date == "latest" else self._parse_date(date, tz=tz)
+        market_value = market if isinstance(market, Markets) else Markets(market)
 
         self._check_support(date, date_value, market_value, tz)
 
@@ -137,9 +155,15 @@ class lmp_config:
         return cls.configs.get(method.__qualname__, {}).copy()
 
     @staticmethod
-    def _get_bound_args(fn, args, kwargs) -> inspect.BoundArguments:
+    def _get_bound_args(
+        fn,
+        args,
+        kwargs,
+        sig: inspect.Signature | None = None,
+    ) -> inspect.BoundArguments:
         """Returns args as ordered dictionary and kwargs"""
-        sig = inspect.signature(fn)
+        if sig is None:
+            sig = inspect.signature(fn)
         if "start" in kwargs and "date" not in kwargs and len(args) < 2:
             # For @support_date_range which allows start/end kwargs
             kwargs["date"] = kwargs.pop("start")
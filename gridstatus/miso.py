@@ -1,13 +1,16 @@
+import io
 import json
 import re
 import urllib
+import urllib.error
 import warnings
 from typing import BinaryIO
 
+import numpy as np
 import pandas as pd
 import requests
 
-from gridstatus import utils
+from gridstatus import single_flight, utils
 from gridstatus.base import ISOBase, Markets, NoDataFoundException, NotSupported
 from gridstatus.decorators import support_date_range
 from gridstatus.gs_logging import logger
@@ -456,7 +459,10 @@ class MISO(ISOBase):
                 )
 
             logger.info(f"Downloading LMP data from {url}")
-            data = pd.read_csv(url)
+            data = self._read_report_csv(
+                url,
+                filters=utils.location_filters(locations, "CPNODE"),
+            )
 
             data["Interval Start"] = pd.to_datetime(data["INTERVAL"]).dt.tz_localize(
                 self.default_timezone,
@@ -473,6 +479,8 @@ class MISO(ISOBase):
 
             interval_duration = 5
 
+            data = data.sort_values(["Interval Start", "Node"])
+
         elif market in [
             Markets.REAL_TIME_HOURLY_FINAL,
             Markets.REAL_TIME_HOURLY_PRELIM,
@@ -488,11 +496,14 @@ class MISO(ISOBase):
                 url = f"https://docs.misoenergy.org/marketreports/{date_str}_rt_lmp_prelim.csv"
 
             logger.info(f"Downloading LMP data from {url}")
-            raw_data = pd.read_csv(url, skiprows=4)
+            raw_data = self._read_report_csv(
+                url,
+                filters=utils.location_filters(locations, "Node"),
+                skiprows=4,
+            )
             data = self._handle_hourly_lmp(date, raw_data)
             interval_duration = 60
 
-        data = data.sort_values(["Interval Start", "Node"])
         data = add_interval_end(data, interval_duration)
 
         data = data.rename(
@@ -537,36 +548,92 @@ class MISO(ISOBase):
         date: str | pd.Timestamp,
         raw_data: pd.DataFrame,
     ) -> pd.DataFrame:
-        data_melted = raw_data.melt(
-            id_vars=["Node", "Type", "Value"],
-            value_vars=[col for col in raw_data.columns if col.startswith("HE")],
-            var_name="HE",
-            value_name="value",
-        )
+        """Reshapes a daily market report, which has a row per node and value
+        (LMP, MCC, MLC) with a column per hour ending, to a row per node and
+        hour with a column per value. Rows are sorted by Interval Start, Node
+        and Type.
+        """
+        if raw_data.empty:
+            # e.g. none of the requested locations are in the report
+            return pd.DataFrame(
+                columns=pd.Index(
+                    ["Node", "Type", "LMP", "MCC", "MLC", "Interval Start"],
+                    name="Value",
+                ),
+            )
 
-        data = data_melted.pivot_table(
-            index=["Node", "Type", "HE"],
-            columns="Value",
-            values="value",
-            aggfunc="first",
-        ).reset_index()
+        he_cols = [col for col in raw_data.columns if col.startswith("HE")]
+        hours = np.array([int(col.split(" ")[1]) for col in he_cols])
+        hour_order = np.argsort(hours, kind="stable")
+
+        # the first row for a node, type and value wins
+        raw_data = raw_data.drop_duplicates(["Node", "Type", "Value"])
 
-        data["Interval Start"] = (
-            data["HE"]
-            .apply(
-                lambda x: date.replace(tzinfo=None, hour=int(x.split(" ")[1]) - 1),
+        node_codes, nodes = pd.MultiIndex.from_frame(
+            raw_data[["Node", "Type"]],
+        ).factorize(sort=True)
+        value_codes, value_names = pd.factorize(raw_data["Value"], sort=True)
+
+        values = raw_data[he_cols].to_numpy()
+        if not np.issubdtype(values.dtype, np.number):
+            values = pd.to_numeric(values.ravel(), errors="coerce").reshape(
+                values.shape,
             )
-            .dt.tz_localize(self.default_timezone)
+
+        # scatter each report row into an (hour, node, value) cube and flatten
+        # it to one row per hour and node
+        cube = np.full((len(he_cols), len(nodes), len(value_names)), np.nan)
+        cube[:, node_codes, value_codes] = values.T[hour_order]
+        rows = cube.reshape(-1, len(value_names))
+
+        hour_idx = np.repeat(np.arange(len(he_cols)), len(nodes))
+        node_idx = np.tile(np.arange(len(nodes)), len(he_cols))
+
+        # drop hours with no values for a node
+        keep = ~np.isnan(rows).all(axis=1)
+        hour_idx = hour_idx[keep]
+        node_idx = node_idx[keep]
+
+        # hour 1 is from 00:00 - 01:00
+        interval_starts = (
+            pd.Timestamp(date.replace(tzinfo=None, hour=0))
+            + pd.to_timedelta(hours[hour_order] - 1, unit="h")
+        ).tz_localize(self.default_timezone)
+
+        data = pd.DataFrame(
+            rows[keep],
+            columns=pd.Index(value_names, name="Value"),
         )
+        data.insert(0, "Node", nodes.get_level_values(0)[node_idx])
+        data.insert(1, "Type", nodes.get_level_values(1)[node_idx])
+        data["Interval Start"] = interval_starts[hour_idx]
 
         return data
 
+    def _read_report_csv(self, url, filters=None, **kwargs) -> pd.DataFrame:
+        """Reads a csv market report. Concurrent requests for the same report,
+        e.g. the day ahead report used for location types, share one download.
+
+        Arguments:
+            url (str): url of the report
+            filters (dict, optional): passed to utils.read_csv_filtered
+            **kwargs: passed to pandas.read_csv
+
+        Raises:
+            urllib.error.HTTPError: if the report can't be downloaded, the same
+                error pandas.read_csv raises for a url
+        """
+        r = single_flight.get(url)
+        if not r.ok:
+            raise urllib.error.HTTPError(url, r.status_code, r.reason, r.headers, None)
+        return utils.read_csv_filtered(io.BytesIO(r.content), filters=filters, **kwargs)
+
     def _get_node_to_type_mapping(self, verbose: bool = False) -> pd.DataFrame:
         # use dam to get location types
         today = utils._handle_date("today", self.default_timezone)
         url = f"https://docs.misoenergy.org/marketreports/{today.strftime('%Y%m%d')}_da_expost_lmp.csv"  # noqa
         logger.info(f"Downloading LMP data from {url}")
-        today_dam_data = pd.read_csv(url, skiprows=4)
+        today_dam_data = self._read_report_csv(url, skiprows=4)
         node_to_type = (
             today_dam_data[["Node", "Type"]]
             .drop_duplicates()
@@ -837,6 +837,9 @@ class PJM(ISOBase):
                 ),
             )
 
+        # rows to keep from each page when the API can't filter
+        page_filters = {}
+
         if location_type:
             location_type = location_type.upper()
             if location_type not in self.location_types:
@@ -848,9 +851,10 @@ class PJM(ISOBase):
                 warnings.warn(
                     (
                         "When using Real Time 5 Minute market, location_type filter"
-                        " will happen after all data is downloaded"
+                        " will happen as data is downloaded"
                     ),
                 )
+                page_filters["type"] = {location_type}
             else:
                 params["type"] = f"*{location_type}*"
 
@@ -870,9 +874,10 @@ class PJM(ISOBase):
             warnings.warn(
                 (
                     "Querying before archive date, so filtering by location will happen"
-                    " after all data is downloaded"
+                    " as data is downloaded"
                 ),
             )
+            page_filters["pnode_id"] = set(map(int, locations))
 
         # returns on the latest version of the data
         params["row_is_current"] = "TRUE"
@@ -885,6 +890,7 @@ class PJM(ISOBase):
                 params=params,
                 verbose=verbose,
                 interval_duration_min=interval_duration_min,
+                filters=page_filters,
             )
         except NoDataFoundException as e:
             if "No data found" not in str(e):
@@ -905,6 +911,7 @@ class PJM(ISOBase):
                 params=params,
                 verbose=verbose,
                 interval_duration_min=interval_duration_min,
+                filters=page_filters,
             )
 
             data["system_energy_price_rt"] = (
@@ -1152,8 +1159,12 @@ class PJM(ISOBase):
         row_count: int = 50000,
         interval_duration_min: int | None = None,
         filter_timestamp_name: str = "datetime_beginning",
+        filters: dict | None = None,
         verbose: bool = False,
     ):
+        """Fetches every page of an endpoint. If filters, a dict of column name to
+        values to keep, is provided, each page is filtered as it is received so
+        only matching rows are held in memory."""
         default_params = {
             "startRow": start_row,
             "rowCount": row_count,
@@ -1200,7 +1211,7 @@ class PJM(ISOBase):
         if r["totalRows"] == 0:
             raise NoDataFoundException(f"No data found for {endpoint}")
 
-        df = pd.DataFrame(r["items"])
+        df = utils.filter_rows(pd.DataFrame(r["items"]), filters)
 
         num_pages = math.ceil(r["totalRows"] / row_count)
         if num_pages > 1:
@@ -1215,7 +1226,7 @@ class PJM(ISOBase):
                         "Ocp-Apim-Subscription-Key": self.api_key,
                     },
                 )
-                to_add.append(pd.DataFrame(r["items"]))
+                to_add.append(utils.filter_rows(pd.DataFrame(r["items"]), filters))
 
             df = pd.concat(to_add)
 
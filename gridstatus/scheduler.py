@@ -0,0 +1,373 @@
+import datetime
+import threading
+
+import pandas as pd
+
+from gridstatus.base import Markets
+from gridstatus.decorators import _store_params
+from gridstatus.gs_logging import logger
+
+
+class PublishSchedule:
+    """When an ISO publishes the data of a method for a date.
+
+    Arguments:
+        name (str): name used to look up the schedule, e.g. "ercot_dam_spp"
+        iso (str, type): ISO class or its name, e.g. "Ercot"
+        method (str): method that returns the data, e.g. "get_spp"
+        publish_time (str): local time the data is usually published, e.g.
+            "12:30"
+        publish_delay_days (int): days from the data's date to the day it is
+            published. -1 for day ahead data published the day before.
+        kwargs (dict, optional): arguments passed to the method
+        report_type_id (int, optional): ERCOT report type id. If given, the
+            report's document list is polled with Ercot.tail, which is much
+            cheaper than calling the method.
+        lead (pd.Timedelta, str): start polling this long before publish_time
+        window (pd.Timedelta, str): stop polling this long after publish_time
+        poll_interval (pd.Timedelta, str): time between polls
+    """
+
+    def __init__(
+        self,
+        name: str,
+        iso,
+        method: str,
+        publish_time: str,
+        publish_delay_days: int = 0,
+        kwargs: dict | None = None,
+        report_type_id: int | None = None,
+        lead: pd.Timedelta | str = "10min",
+        window: pd.Timedelta | str = "3h",
+        poll_interval: pd.Timedelta | str = "2min",
+    ):
+        self.name = name
+        self.iso = iso
+        self.method = method
+        self.publish_time = datetime.time.fromisoformat(publish_time)
+        self.publish_delay_days = publish_delay_days
+        self.kwargs = kwargs or {}
+        self.report_type_id = report_type_id
+        self.lead = pd.Timedelta(lead)
+        self.window = pd.Timedelta(window)
+        self.poll_interval = pd.Timedelta(poll_interval)
+
+    def __repr__(self) -> str:
+        return (
+            f"PublishSchedule({self.name!r}, {self.iso_name}.{self.method}, "
+            f"publish_time={self.publish_time}, "
+            f"publish_delay_days={self.publish_delay_days})"
+        )
+
+    @property
+    def iso_name(self) -> str:
+        return self.iso if isinstance(self.iso, str) else self.iso.__name__
+
+    def expected_publish(self, date: pd.Timestamp, tz: str) -> pd.Timestamp:
+        """Time the data for date is usually published"""
+        day = pd.Timestamp(date).tz_localize(None).normalize() + pd.DateOffset(
+            days=self.publish_delay_days,
+        )
+        return pd.Timestamp.combine(day.date(), self.publish_time).tz_localize(tz)
+
+    def data_date(self, publish_day: pd.Timestamp) -> pd.Timestamp:
+        """Date of the data published on publish_day"""
+        return publish_day.normalize() - pd.DateOffset(days=self.publish_delay_days)
+
+
+# Usual publish times of common datasets. Times are approximate and in the
+# timezone of the ISO
+PUBLISH_SCHEDULES = [
+    PublishSchedule(
+        "ercot_dam_spp",
+        "Ercot",
+        "get_spp",
+        publish_time="12:30",
+        publish_delay_days=-1,
+        kwargs={"market": Markets.DAY_AHEAD_HOURLY},
+        # DAM_SETTLEMENT_POINT_PRICES_RTID
+        report_type_id=12331,
+    ),
+    PublishSchedule(
+        "ercot_as_reports",
+        "Ercot",
+        "get_as_reports",
+        publish_time="03:00",
+        publish_delay_days=2,
+        # TWO_DAY_ANCILLARY_SERVICES_REPORTS_RTID
+        report_type_id=13057,
+    ),
+    PublishSchedule(
+        "ercot_60_day_dam_disclosure",
+        "Ercot",
+        "get_60_day_dam_disclosure",
+        publish_time="05:00",
+        publish_delay_days=60,
+        # SIXTY_DAY_DAM_DISCLOSURE_REPORTS_RTID
+        report_type_id=13051,
+    ),
+    PublishSchedule(
+        "miso_dam_lmp",
+        "MISO",
+        "get_lmp",
+        publish_time="14:00",
+        publish_delay_days=-1,
+        kwargs={"market": Markets.DAY_AHEAD_HOURLY},
+    ),
+    PublishSchedule(
+        "nyiso_dam_lmp",
+        "NYISO",
+        "get_lmp",
+        publish_time="11:00",
+        publish_delay_days=-1,
+        kwargs={"market": Markets.DAY_AHEAD_HOURLY},
+    ),
+]
+
+
+class PrefetchScheduler:
+    """Fetches datasets as soon as they are published, in a background thread.
+
+    Around the usual publish time of each schedule, the scheduler polls for
+    the data, calling the method once it is published so that the result is
+    ready before it is needed. Results are kept in memory for wait() and
+    saved to store, if given, so that date range methods called with that store
+    read them from disk. Day ahead data is saved too, although its range ends
+    in the future.
+
+    Example:
+        scheduler = PrefetchScheduler(store=gridstatus.Store("~/data"))
+        scheduler.start()
+
+        tomorrow = pd.Timestamp.now(tz="US/Central").normalize() + pd.DateOffset(
+            days=1,
+        )
+        df = scheduler.wait("ercot_dam_spp", tomorrow, timeout=3600)
+
+    Arguments:
+        schedules (list[PublishSchedule], optional): datasets to prefetch.
+            Defaults to PUBLISH_SCHEDULES.
+        store (gridstatus.Store, optional): store to save results to
+        tick (float): seconds between checks of the schedules
+        keep_days (int): days of results to keep in memory
+    """
+
+    def __init__(
+        self,
+        schedules: list[PublishSchedule] | None = None,
+        store=None,
+        tick: float = 30,
+        keep_days: int = 7,
+    ):
+        if schedules is None:
+            schedules = PUBLISH_SCHEDULES
+        self.schedules = {schedule.name: schedule for schedule in schedules}
+        self.store = store
+        self.tick = tick
+        self.keep_days = keep_days
+
+        self._lock = threading.Lock()
+        self._isos = {}
+        self._events = {}
+        self._results = {}
+        self._last_poll = {}
+        self._missed = set()
+        self._first_run = None
+        self._callbacks = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """Starts prefetching in a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="gridstatus-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops the background thread after its current poll"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def on_ready(self, callback) -> None:
+        """Calls callback(name, date, result) from the scheduler's thread when a
+        dataset is fetched"""
+        self._callbacks.append(callback)
+
+    def ready(self, name: str, date) -> threading.Event:
+        """Event set once the data of schedule name for date is fetched"""
+        key = self._key(name, date)
+        with self._lock:
+            return self._events.setdefault(key, threading.Event())
+
+    def wait(self, name: str, date, timeout: float | None = None):
+        """Waits for the data of schedule name for date and returns it.
+
+        Raises:
+            TimeoutError: if the data isn't fetched within timeout seconds
+            KeyError: if the data was fetched more than keep_days ago and
+                was forgotten
+        """
+        if not self.ready(name, date).wait(timeout):
+            raise TimeoutError(f"{name} for {date} wasn't ready in {timeout}s")
+
+        key = self._key(name, date)
+        with self._lock:
+            if key not in self._results:
+                raise KeyError(
+                    f"{name} for {date} is older than {self.keep_days} days and "
+                    "was forgotten",
+                )
+            return self._results[key]
+
+    def run_pending(self, now: pd.Timestamp | None = None) -> list:
+        """Polls every schedule that is expected to publish around now, and
+        fetches the ones that were published. now must have a timezone and
+        defaults to the current time.
+
+        Returns:
+            list[tuple[str, pd.Timestamp]]: (name, date) of fetched data
+        """
+        if now is None:
+            now = pd.Timestamp.now(tz="UTC")
+        if self._first_run is None:
+            self._first_run = now
+
+        fetched = []
+        for schedule in self.schedules.values():
+            iso = self._get_iso(schedule)
+            local_now = now.tz_convert(iso.default_timezone)
+
+            # data published yesterday may still be in its window after midnight
+            for days_ago in (1, 0):
+                publish_day = local_now.normalize() - pd.DateOffset(days=days_ago)
+                date = schedule.data_date(publish_day)
+                if self._poll(schedule, iso, date, local_now):
+                    fetched.append((schedule.name, date))
+
+        self._forget_old(now)
+        return fetched
+
+    def _poll(self, schedule, iso, date, now) -> bool:
+        key = self._key(schedule.name, date)
+        if self.ready(schedule.name, date).is_set() or key in self._missed:
+            return False
+
+        expected = schedule.expected_publish(date, iso.default_timezone)
+        if now < expected - schedule.lead:
+            return False
+
+        if now > expected + schedule.window:
+            self._missed.add(key)
+            # windows that ended before the scheduler started were never polled
+            if expected + schedule.window >= self._first_run:
+                logger.warning(
+                    f"{schedule.name} for {date.date()} wasn't published by "
+                    f"{expected + schedule.window}",
+                )
+            return False
+
+        last_poll = self._last_poll.get(key)
+        if last_poll is not None and now < last_poll + schedule.poll_interval:
+            return False
+        self._last_poll[key] = now
+
+        try:
+            if not self._is_published(schedule, iso, date, expected):
+                return False
+            result = self._fetch(schedule, iso, date)
+        except Exception as e:
+            logger.debug(f"{schedule.name} for {date.date()} not ready: {e!r}")
+            return False
+
+        if result is None or (isinstance(result, pd.DataFrame) and result.empty):
+            return False
+
+        logger.info(f"Prefetched {schedule.name} for {date.date()}")
+        with self._lock:
+            self._results[key] = result
+        self.ready(schedule.name, date).set()
+        for callback in self._callbacks:
+            callback(schedule.name, date, result)
+        return True
+
+    def _is_published(self, schedule, iso, date, expected) -> bool:
+        """Checks the cheapest listing of the data, if there is one"""
+        if schedule.report_type_id is None:
+            # the method itself is the check
+            return True
+
+        # documents published since the start of the publish day. Documents
+        # published on later days belong to later dates
+        since = expected.normalize() - pd.Timedelta(microseconds=1)
+        docs, _ = iso.tail(schedule.report_type_id, since=since)
+        return any(
+            schedule.data_date(doc.publish_date).date() == date.date() for doc in docs
+        )
+
+    def _fetch(self, schedule, iso, date):
+        method = getattr(iso, schedule.method)
+        # methods without support_date_range can't use a store
+        f = getattr(method, "__wrapped__", None)
+        if self.store is None or f is None:
+            return method(date=date, **schedule.kwargs)
+
+        result = method(date=date, store=self.store, **schedule.kwargs)
+
+        # day ahead data ends after now, so the method doesn't store it
+        iso_name = iso.__class__.__name__
+        params = _store_params(f, {"self": iso, **schedule.kwargs}, self.store)
+        start = date
+        end = date + pd.DateOffset(days=1)
+        if not self.store.covers(iso_name, f.__name__, params, start, end):
+            self.store.write(
+                iso_name,
+                f.__name__,
+                params,
+                start,
+                end,
+                result,
+                published=True,
+            )
+        return result
+
+    def _get_iso(self, schedule):
+        iso = self._isos.get(schedule.iso_name)
+        if iso is None:
+            iso_class = schedule.iso
+            if isinstance(iso_class, str):
+                import gridstatus
+
+                iso_class = getattr(gridstatus, iso_class)
+            iso = self._isos[schedule.iso_name] = iso_class()
+        return iso
+
+    def _forget_old(self, now):
+        cutoff = now.tz_localize(None) - pd.Timedelta(days=self.keep_days)
+        with self._lock:
+            for key in [k for k in self._events if k[1] < cutoff]:
+                self._events.pop(key)
+                self._results.pop(key, None)
+                self._last_poll.pop(key, None)
+                self._missed.discard(key)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                logger.warning(f"Prefetching failed with {e!r}")
+            self._stop.wait(self.tick)
+
+    @staticmethod
+    def _key(name, date):
+        # dates without time or timezone, so any form of the same date matches
+        return name, pd.Timestamp(pd.Timestamp(date).date())
@@ -0,0 +1,225 @@
+import functools
+
+import pandas as pd
+
+from gridstatus.base import ISOBase, NotSupported
+
+# Declares a tz-aware column in the timezone of the ISO
+DATETIME = "datetime"
+
+
+class Schema:
+    """Column names and types of a method's output.
+
+    Columns are cast once when the method returns, so results have the same
+    types whether or not a request had data, and results of a date range can
+    be concatenated without upcasting.
+
+    Arguments:
+        columns (dict): column names and their types. Types are anything
+            pandas accepts as a dtype, DATETIME for timestamps in the
+            timezone, or "category" for categoricals with any categories.
+        timezone (str, optional): timezone of DATETIME columns. Methods of
+            an ISO use its default timezone.
+
+    Example:
+        Schema(
+            {
+                "Interval Start": DATETIME,
+                "Location": "string",
+                "Location Type": "category",
+                "LMP": "float64",
+            },
+            timezone="US/Central",
+        )
+    """
+
+    def __init__(self, columns: dict, timezone: str | None = None):
+        self.columns = dict(columns)
+        self.timezone = timezone
+
+    def __repr__(self) -> str:
+        return f"Schema({self.columns!r}, timezone={self.timezone!r})"
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Schema)
+            and self.columns == other.columns
+            and self.timezone == other.timezone
+        )
+
+    def with_timezone(self, timezone: str) -> "Schema":
+        """Returns the schema with DATETIME columns in timezone"""
+        return Schema(self.columns, timezone=timezone)
+
+    @property
+    def dtypes(self) -> dict:
+        """pandas dtype of each column"""
+        dtypes = {}
+        for name, dtype in self.columns.items():
+            if dtype == DATETIME:
+                if self.timezone is None:
+                    raise ValueError(f"Schema has no timezone for {name}")
+                dtype = pd.DatetimeTZDtype("ns", tz=self.timezone)
+            dtypes[name] = pd.api.types.pandas_dtype(dtype)
+        return dtypes
+
+    def cast(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Casts the columns of df that are in the schema. Columns that already
+        have their type aren't copied, and other columns are left as is."""
+        cast = {}
+        for name, dtype in self.dtypes.items():
+            if name not in df.columns:
+                continue
+
+            column = df[name]
+            if _has_dtype(column, dtype):
+                continue
+
+            if isinstance(dtype, pd.DatetimeTZDtype):
+                cast[name] = _to_timezone(column, dtype)
+            else:
+                cast[name] = column.astype(dtype)
+
+        if not cast:
+            return df
+
+        return _replace_columns(df, cast)
+
+    def concat(self, dfs: list[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenates DataFrames cast to the schema.
+
+        Categoricals with different categories would be concatenated as
+        objects, so their categories are unioned first, which only recodes
+        them.
+        """
+        dfs = [self.cast(df) for df in dfs]
+
+        for name, dtype in self.dtypes.items():
+            if (
+                not isinstance(dtype, pd.CategoricalDtype)
+                or dtype.categories is not None
+            ):
+                continue
+
+            columns = [df[name] for df in dfs if name in df.columns]
+            categories = [c.cat.categories for c in columns]
+            if all(c.equals(categories[0]) for c in categories):
+                continue
+
+            union = functools.reduce(lambda a, b: a.union(b, sort=False), categories)
+            dfs = [_set_categories(df, name, union) for df in dfs]
+
+        return pd.concat(dfs).reset_index(drop=True)
+
+    def empty(self) -> pd.DataFrame:
+        """DataFrame with the schema's columns and no rows"""
+        return pd.DataFrame(
+            {name: pd.Series(dtype=dtype) for name, dtype in self.dtypes.items()},
+        )
+
+    def to_arrow(self):
+        """Equivalent pyarrow schema, e.g. to create Parquet files or tables
+        before data is fetched. Requires pyarrow."""
+        import pyarrow as pa
+
+        return pa.schema(
+            [(name, _arrow_type(dtype)) for name, dtype in self.dtypes.items()],
+        )
+
+
+class output_schema:
+    """Declares the schema of a method's output and casts its results to it.
+
+    Schemas are registered by the method's qualified name (e.g.
+    "Ercot.get_spp") and can be looked up with ISOBase.schema. Date range
+    methods decorated with support_date_range concatenate their results with
+    the schema, so decorate the method itself:
+
+        @support_date_range(frequency="DAY_START")
+        @output_schema({"Interval Start": DATETIME, "LMP": "float64"})
+        def get_lmp(self, date, end=None, verbose=False):
+            ...
+    """
+
+    schemas = {}
+
+    def __init__(self, columns: dict):
+        self.schema = Schema(columns)
+
+    def __call__(self, func):
+        output_schema.schemas[func.__qualname__] = self.schema
+        schema = self.schema
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            df = func(*args, **kwargs)
+            if not isinstance(df, pd.DataFrame):
+                return df
+            # support_date_range passes self as a keyword
+            iso = args[0] if args else kwargs["self"]
+            return schema.with_timezone(iso.default_timezone).cast(df)
+
+        # used by support_date_range to concatenate results
+        wrapper.output_schema = schema
+
+        return wrapper
+
+    @classmethod
+    def get(cls, iso: type[ISOBase], method: str) -> Schema:
+        """Schema of a method of an ISO, in the ISO's timezone"""
+        for klass in iso.__mro__:
+            schema = cls.schemas.get(f"{klass.__name__}.{method}")
+            if schema is not None:
+                return schema.with_timezone(iso.default_timezone)
+
+        raise NotSupported(f"{iso.__name__}.{method} has no declared schema")
+
+
+def _arrow_type(dtype):
+    import pyarrow as pa
+
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return pa.timestamp(dtype.unit, tz=str(dtype.tz))
+    if isinstance(dtype, pd.CategoricalDtype):
+        # categories are strings unless declared otherwise
+        values = pa.string()
+        if dtype.categories is not None and dtype.categories.dtype != object:
+            values = pa.from_numpy_dtype(dtype.categories.dtype)
+        return pa.dictionary(pa.int32(), values)
+    if dtype == object or isinstance(dtype, pd.StringDtype):
+        return pa.string()
+    return pa.from_numpy_dtype(dtype)
+
+
+def _replace_columns(df: pd.DataFrame, columns: dict) -> pd.DataFrame:
+    # a shallow copy keeps df.attrs and doesn't copy the other columns
+    df = df.copy(deep=False)
+    for name, column in columns.items():
+        df[name] = column
+    return df
+
+
+def _set_categories(df: pd.DataFrame, name: str, categories) -> pd.DataFrame:
+    if name not in df.columns:
+        return df
+    return _replace_columns(df, {name: df[name].cat.set_categories(categories)})
+
+
+def _has_dtype(column: pd.Series, dtype) -> bool:
+    if isinstance(dtype, pd.CategoricalDtype) and dtype.categories is None:
+        # categoricals with any categories
+        return isinstance(column.dtype, pd.CategoricalDtype)
+    return column.dtype == dtype
+
+
+def _to_timezone(column: pd.Series, dtype: pd.DatetimeTZDtype) -> pd.Series:
+    if isinstance(column.dtype, pd.DatetimeTZDtype):
+        return column.dt.tz_convert(dtype.tz).astype(dtype)
+
+    if pd.api.types.is_datetime64_dtype(column.dtype) and len(column):
+        # the local time of naive timestamps is ambiguous around DST
+        raise ValueError(f"{column.name} has timestamps without a timezone")
+
+    # e.g. objects from an empty placeholder or timestamps with mixed offsets
+    return pd.to_datetime(column, utc=True).dt.tz_convert(dtype.tz).astype(dtype)
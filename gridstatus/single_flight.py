@@ -0,0 +1,100 @@
+import threading
+import time
+
+import requests
+
+from gridstatus.gs_logging import logger
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        # when the result stops being reused. None while the call is running
+        self.expires_at = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls with the same key.
+
+    The first caller for a key (the leader) runs the function while later
+    callers for the same key wait for it to finish and get its result, or its
+    exception, instead of running the function themselves. Once the call
+    finishes, its result is kept for memo_seconds so callers arriving shortly
+    after also reuse it.
+
+    Results are shared between callers, so they shouldn't be mutated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, memo_seconds: float = 0):
+        """Returns fn() for the first caller for key and the same result for
+        callers waiting on it or arriving within memo_seconds of it finishing"""
+        with self._lock:
+            self._forget_expired()
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            logger.debug(f"Waiting on in-flight call for {key}")
+            call.done.wait()
+        else:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                # errors are never reused by later callers
+                memo_seconds = 0 if call.error is not None else memo_seconds
+                call.expires_at = time.monotonic() + memo_seconds
+                if memo_seconds <= 0:
+                    with self._lock:
+                        if self._calls.get(key) is call:
+                            del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _forget_expired(self):
+        now = time.monotonic()
+        expired = [
+            key
+            for key, call in self._calls.items()
+            if call.expires_at is not None and now >= call.expires_at
+        ]
+        for key in expired:
+            del self._calls[key]
+
+
+# Shared by every ISO, since they can fetch the same urls
+_requests = SingleFlight()
+
+
+def get(url: str, memo_seconds: float = 0, **kwargs) -> requests.Response:
+    """requests.get where concurrent requests for the same url and arguments
+    share one response. Streamed requests aren't shared since their content can
+    only be read once.
+
+    Arguments:
+        url (str): url to request
+        memo_seconds (float): seconds to reuse the response for identical
+            requests after it is received
+        **kwargs: passed to requests.get
+    """
+    if kwargs.get("stream"):
+        return requests.get(url, **kwargs)
+
+    key = (url, repr(sorted(kwargs.items())))
+    return _requests.do(
+        key,
+        lambda: requests.get(url, **kwargs),
+        memo_seconds=memo_seconds,
+    )
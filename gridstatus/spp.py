@@ -37,6 +37,22 @@ BASE_LOAD_FORECAST_SHORT_TERM_URL = f"{FILE_BROWSER_DOWNLOAD_URL}/stlf-vs-actual
 BASE_LOAD_FORECAST_MID_TERM_URL = f"{FILE_BROWSER_DOWNLOAD_URL}/mtlf-vs-actual?path="
 
 
+# Types of the columns in annual zip files, so files without rows don't upcast
+# them to object when concatenated
+CAPACITY_OF_GENERATION_ON_OUTAGE_DTYPES = {
+    "Market Hour": str,
+    "Outaged MW": "float64",
+}
+VER_CURTAILMENTS_DTYPES = {
+    "GMTIntervalEnding": str,
+    "WindRedispatchCurtailments": "float64",
+    "WindManualCurtailments": "float64",
+    "WindCurtailedForEnergy": "float64",
+    "SolarRedispatchCurtailments": "float64",
+    "SolarManualCurtailments": "float64",
+    "SolarCurtailedForEnergy": "float64",
+}
+
 LOCATION_TYPE_ALL = "ALL"
 LOCATION_TYPE_BUS = "Bus"
 LOCATION_TYPE_HUB = "Hub"
@@ -601,6 +617,7 @@ class SPP(ISOBase):
             url,
             process_csv=process_csv,
             verbose=verbose,
+            dtype=CAPACITY_OF_GENERATION_ON_OUTAGE_DTYPES,
         )
 
         df = df.sort_values("Interval Start")
@@ -664,7 +681,11 @@ class SPP(ISOBase):
             pd.DataFrame: VER Curtailments
         """
         url = f"{FILE_BROWSER_DOWNLOAD_URL}/ver-curtailments?path=/{year}/{year}.zip"  # noqa
-        df = utils.download_csvs_from_zip_url(url, verbose=verbose)
+        df = utils.download_csvs_from_zip_url(
+            url,
+            verbose=verbose,
+            dtype=VER_CURTAILMENTS_DTYPES,
+        )
 
         df = self._process_ver_curtailments(df)
 
@@ -0,0 +1,644 @@
+import contextlib
+import glob
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from gridstatus import utils
+from gridstatus.base import Markets
+from gridstatus.gs_logging import logger
+
+try:
+    import fcntl
+except ImportError:
+    # Windows, where coverage updates are only serialized within a process
+    fcntl = None
+
+# Arguments that describe which rows of a dataset are requested, or how they are
+# fetched, rather than which dataset it is, so they aren't part of the dataset key
+NON_DATASET_ARGS = {
+    "self",
+    "date",
+    "end",
+    "verbose",
+    "sleep",
+    "error",
+    "published_after_cursor",
+    "cache_dir",
+    "excel_engine",
+}
+
+# Arguments that make a request return only part of its range, e.g. the files
+# published after a cursor, so requests given them aren't stored
+PARTIAL_RANGE_ARGS = {"published_after_cursor"}
+
+TIME_COLUMNS = ["Interval Start", "Time"]
+
+COVERAGE_FILE = "_coverage.json"
+DATA_COVERAGE_FILE = "_data_coverage.json"
+EMPTY_COVERAGE_FILE = "_empty_coverage.json"
+PARAMS_FILE = "_params.json"
+LOCK_FILE = "_coverage.lock"
+
+# one lock per dataset path, since file locks don't exclude threads of the same
+# process
+_dataset_locks = {}
+_dataset_locks_lock = threading.Lock()
+
+
+class Store:
+    """Local store of data fetched by methods decorated with ``support_date_range``.
+
+    Each ISO, method and set of arguments (e.g. market and locations) is a
+    dataset saved as partitioned Parquet files, one file per request. The store
+    keeps track of the time ranges each dataset covers so that later requests
+    for a covered range are read from disk instead of the network.
+
+    Pass a store to any date range method to read from and write to it::
+
+        store = gridstatus.Store("~/gridstatus-data")
+        caiso.get_fuel_mix(start="2024-01-01", end="2024-02-01", store=store)
+
+    Stored data can be read back with filters applied while reading, or queried
+    with SQL across ISOs if duckdb is installed::
+
+        store.read("CAISO", "get_fuel_mix", start="2024-01-05", end="2024-01-06")
+        store.query("SELECT * FROM caiso_get_fuel_mix WHERE Solar > 10000")
+
+    Only requests that end before the current time are stored, since data for
+    the current day is still being published. PrefetchScheduler also stores day
+    ahead data once it is published. Requests with a published_after_cursor
+    only return newly published files, so they are neither read nor stored.
+
+    Requests can return less than their range, e.g. when a file is published
+    late, so the store also indexes the intervals that have rows. Missing
+    intervals are listed with find_gaps and refetched with fill_gaps::
+
+        store.find_gaps("CAISO", "get_fuel_mix", {}, start, end)
+        caiso.get_fuel_mix(start=start, end=end, store=store, fill_gaps=True)
+
+    Intervals that are still without rows when they are fetched again are
+    recorded as having no data, so they aren't gaps anymore.
+
+    Requires pyarrow.
+    """
+
+    def __init__(self, path: str):
+        utils.require_pyarrow("Store")
+
+        self.path = os.path.expanduser(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"Store({self.path!r})"
+
+    @staticmethod
+    def dataset_params(args_dict: dict) -> dict:
+        """Arguments of a method call that identify its dataset"""
+        params = {}
+        for k, v in args_dict.items():
+            if k in NON_DATASET_ARGS:
+                continue
+            if isinstance(v, Markets):
+                v = v.value
+            params[k] = v
+        return params
+
+    @staticmethod
+    def can_store(args_dict: dict) -> bool:
+        """Whether a method call returns its whole range, so it can be read
+        from and saved to the store"""
+        return all(args_dict.get(k) is None for k in PARTIAL_RANGE_ARGS)
+
+    def dataset_path(self, iso: str, method: str, params: dict | None = None) -> str:
+        key = json.dumps(params or {}, sort_keys=True, default=str)
+        digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+        return os.path.join(self.path, iso, method, digest)
+
+    def coverage(
+        self,
+        iso: str,
+        method: str,
+        params: dict | None = None,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """Returns the sorted, non-overlapping time ranges stored for a dataset"""
+        path = os.path.join(self.dataset_path(iso, method, params), COVERAGE_FILE)
+        if not os.path.exists(path):
+            return []
+
+        with open(path) as f:
+            ranges = json.load(f)
+
+        return [(pd.Timestamp(start), pd.Timestamp(end)) for start, end in ranges]
+
+    def data_coverage(
+        self,
+        iso: str,
+        method: str,
+        params: dict | None = None,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """Returns the sorted, non-overlapping time ranges with stored rows.
+
+        Datasets stored before rows were indexed use the ranges that were
+        requested.
+        """
+        path = os.path.join(self.dataset_path(iso, method, params), DATA_COVERAGE_FILE)
+        if not os.path.exists(path):
+            return self.coverage(iso, method, params)
+
+        with open(path) as f:
+            ranges = json.load(f)
+
+        return [(pd.Timestamp(start), pd.Timestamp(end)) for start, end in ranges]
+
+    def empty_coverage(
+        self,
+        iso: str,
+        method: str,
+        params: dict | None = None,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """Returns the sorted, non-overlapping time ranges that were fetched
+        more than once and had no rows each time"""
+        path = os.path.join(self.dataset_path(iso, method, params), EMPTY_COVERAGE_FILE)
+        if not os.path.exists(path):
+            return []
+
+        with open(path) as f:
+            ranges = json.load(f)
+
+        return [(pd.Timestamp(start), pd.Timestamp(end)) for start, end in ranges]
+
+    def find_gaps(
+        self,
+        iso: str,
+        method: str,
+        params: dict | None,
+        start: str | pd.Timestamp,
+        end: str | pd.Timestamp,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """Returns the ranges from start to end without stored rows, whether
+        they were never requested or requests returned no data for them.
+        Ranges that had no data when they were fetched again aren't gaps.
+
+        Arguments:
+            iso (str): ISO class name, e.g. "CAISO"
+            method (str): method name, e.g. "get_lmp"
+            params (dict, optional): method arguments identifying the dataset,
+                e.g. {"market": "DAY_AHEAD_HOURLY", "locations": "ALL"}
+            start (str, pd.Timestamp): start of the range. Like read, times
+                without a timezone are UTC.
+            end (str, pd.Timestamp): end of the range, exclusive
+
+        Returns:
+            list[tuple[pd.Timestamp, pd.Timestamp]]: (start, end) of each gap
+        """
+        covered = self.data_coverage(iso, method, params) + self.empty_coverage(
+            iso,
+            method,
+            params,
+        )
+        return _missing_ranges(
+            _merge_ranges(covered),
+            pd.Timestamp(start),
+            pd.Timestamp(end),
+        )
+
+    def covers(
+        self,
+        iso: str,
+        method: str,
+        params: dict | None,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> bool:
+        """Whether the whole range from start to end is stored"""
+        for covered_start, covered_end in self.coverage(iso, method, params):
+            if covered_start <= start and end <= covered_end:
+                return True
+        return False
+
+    def write(
+        self,
+        iso: str,
+        method: str,
+        params: dict | None,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        df: pd.DataFrame,
+        published: bool = False,
+    ) -> bool:
+        """Saves the result of a request for start to end and marks the range as
+        covered. Returns False if the data wasn't stored.
+
+        Ranges that end after now aren't stored unless published is True, e.g.
+        for day ahead data that is published in full the day before.
+        """
+        if not isinstance(df, pd.DataFrame):
+            return False
+
+        if not published and end > pd.Timestamp.now(tz=end.tz):
+            # data may still be published for this range
+            return False
+
+        dataset_path = self.dataset_path(iso, method, params)
+        os.makedirs(dataset_path, exist_ok=True)
+
+        file_path = os.path.join(dataset_path, _file_name(start, end))
+
+        try:
+            utils.write_atomic(
+                file_path,
+                lambda tmp_path: df.to_parquet(tmp_path, index=False),
+            )
+        except Exception as e:
+            logger.warning(f"Could not store {iso} {method} {start} to {end}: {e}")
+            return False
+
+        # other threads and processes may be updating the coverage too
+        with _dataset_lock(dataset_path):
+            self._update_coverage(iso, method, params, start, end, df)
+
+        return True
+
+    def _update_coverage(self, iso, method, params, start, end, df):
+        """Adds a stored request for start to end to the dataset's coverage"""
+        dataset_path = self.dataset_path(iso, method, params)
+
+        with open(os.path.join(dataset_path, PARAMS_FILE), "w") as f:
+            json.dump(params or {}, f, sort_keys=True, default=str)
+
+        new_data_ranges = _data_ranges(df, start, end)
+        data_ranges = _merge_ranges(
+            self.data_coverage(iso, method, params) + new_data_ranges,
+        )
+        _write_json(
+            os.path.join(dataset_path, DATA_COVERAGE_FILE),
+            [[s.isoformat(), e.isoformat()] for s, e in data_ranges],
+        )
+
+        # intervals that were requested before and still have no rows won't
+        # get any, e.g. hours a sparse dataset has no data for
+        coverage = self.coverage(iso, method, params)
+        empty_ranges = []
+        for covered_start, covered_end in coverage:
+            refetched_start = max(_in_tz(covered_start, start), start)
+            refetched_end = min(_in_tz(covered_end, end), end)
+            if refetched_start < refetched_end:
+                empty_ranges.extend(
+                    _missing_ranges(new_data_ranges, refetched_start, refetched_end),
+                )
+        if empty_ranges:
+            empty_ranges = _merge_ranges(
+                self.empty_coverage(iso, method, params) + empty_ranges,
+            )
+            _write_json(
+                os.path.join(dataset_path, EMPTY_COVERAGE_FILE),
+                [[s.isoformat(), e.isoformat()] for s, e in empty_ranges],
+            )
+
+        ranges = _merge_ranges(coverage + [(start, end)])
+        _write_json(
+            os.path.join(dataset_path, COVERAGE_FILE),
+            [[s.isoformat(), e.isoformat()] for s, e in ranges],
+        )
+
+    def read(
+        self,
+        iso: str,
+        method: str,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        filters: dict | None = None,
+        columns: list[str] | None = None,
+        **params,
+    ) -> pd.DataFrame:
+        """Reads stored data for a method.
+
+        Filters are applied while reading the Parquet files, so only matching
+        rows are loaded into memory.
+
+        Arguments:
+            iso (str): ISO class name, e.g. "CAISO"
+            method (str): method name, e.g. "get_lmp"
+            start (str, pd.Timestamp, optional): include rows starting at or
+                after this time
+            end (str, pd.Timestamp, optional): include rows starting before
+                this time
+            filters (dict, optional): column name to a value or list of values
+                to keep, e.g. {"Location": ["TH_NP15_GEN-APND"]}
+            columns (list, optional): columns to read. Defaults to all.
+            **params: method arguments identifying the dataset, e.g.
+                market="DAY_AHEAD_HOURLY". If not provided, reads every
+                dataset stored for the method.
+
+        Returns:
+            pandas.DataFrame: stored rows matching the filters
+        """
+        if params:
+            dataset_paths = [self.dataset_path(iso, method, params)]
+        else:
+            dataset_paths = sorted(glob.glob(os.path.join(self.path, iso, method, "*")))
+
+        files = []
+        for dataset_path in dataset_paths:
+            files.extend(_files_overlapping(dataset_path, start, end))
+
+        return _read_files(files, start, end, filters=filters, columns=columns)
+
+    def read_range(
+        self,
+        iso: str,
+        method: str,
+        params: dict | None,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+    ) -> pd.DataFrame:
+        """Reads stored data for a request from start to end"""
+        dataset_path = self.dataset_path(iso, method, params)
+        files = _files_overlapping(dataset_path, start, end)
+        return _read_files(files, start, end)
+
+    def datasets(self) -> pd.DataFrame:
+        """Lists stored datasets with their arguments and covered ranges"""
+        rows = []
+        for params_path in sorted(
+            glob.glob(os.path.join(self.path, "*", "*", "*", PARAMS_FILE)),
+        ):
+            dataset_path = os.path.dirname(params_path)
+            method_path = os.path.dirname(dataset_path)
+            iso = os.path.basename(os.path.dirname(method_path))
+            method = os.path.basename(method_path)
+
+            with open(params_path) as f:
+                params = json.load(f)
+
+            coverage = self.coverage(iso, method, params)
+            rows.append(
+                {
+                    "ISO": iso,
+                    "Method": method,
+                    "Params": params,
+                    "Start": coverage[0][0] if coverage else None,
+                    "End": coverage[-1][1] if coverage else None,
+                    "Coverage": coverage,
+                },
+            )
+
+        return pd.DataFrame(
+            rows,
+            columns=["ISO", "Method", "Params", "Start", "End", "Coverage"],
+        )
+
+    def query(self, sql: str) -> pd.DataFrame:
+        """Runs a SQL query over the store using duckdb.
+
+        Every stored method is available as a table named ``{iso}_{method}``
+        in lowercase, e.g. ``caiso_get_fuel_mix``, containing the rows of all of
+        its datasets. Filters in the query are pushed down into the Parquet
+        reads, so only the result is loaded into pandas.
+
+        Requires duckdb.
+        """
+        try:
+            import duckdb
+        except ImportError:
+            raise ImportError(
+                "Store.query requires duckdb. Install it with `pip install duckdb`",
+            )
+
+        con = duckdb.connect()
+        try:
+            for method_path in sorted(glob.glob(os.path.join(self.path, "*", "*"))):
+                files = sorted(glob.glob(os.path.join(method_path, "*", "*.parquet")))
+                if not files:
+                    continue
+
+                iso = os.path.basename(os.path.dirname(method_path))
+                method = os.path.basename(method_path)
+                table = f"{iso}_{method}".lower()
+                # views can't take prepared parameters, so quote the paths inline
+                file_list = ", ".join(
+                    "'{}'".format(f.replace("'", "''")) for f in files
+                )
+                con.execute(
+                    f'CREATE VIEW "{table}" AS '
+                    f"SELECT * FROM read_parquet([{file_list}], union_by_name = true)",
+                )
+
+            return con.execute(sql).df()
+        finally:
+            con.close()
+
+
+def _file_name(start: pd.Timestamp, end: pd.Timestamp) -> str:
+    return "{}_{}.parquet".format(
+        start.tz_convert("UTC").strftime("%Y%m%dT%H%M%S"),
+        end.tz_convert("UTC").strftime("%Y%m%dT%H%M%S"),
+    )
+
+
+def _file_bounds(file_path: str) -> tuple[pd.Timestamp, pd.Timestamp]:
+    start, end = os.path.basename(file_path).replace(".parquet", "").split("_")
+    return pd.Timestamp(start, tz="UTC"), pd.Timestamp(end, tz="UTC")
+
+
+def _files_overlapping(dataset_path, start=None, end=None):
+    files = sorted(glob.glob(os.path.join(dataset_path, "*.parquet")))
+
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+
+    overlapping = []
+    for file_path in files:
+        file_start, file_end = _file_bounds(file_path)
+        if start is not None and file_end <= _as_utc(start):
+            continue
+        if end is not None and file_start >= _as_utc(end):
+            continue
+        overlapping.append(file_path)
+
+    return overlapping
+
+
+def _read_files(files, start=None, end=None, filters=None, columns=None):
+    if not files:
+        return pd.DataFrame(columns=columns)
+
+    dfs = []
+    for file_path in files:
+        df = pd.read_parquet(
+            file_path,
+            columns=columns,
+            filters=_parquet_filters(file_path, start, end, filters),
+        )
+        dfs.append(df)
+
+    df = pd.concat(dfs, ignore_index=True)
+
+    # overlapping requests can store the same rows more than once
+    if _any_overlap([_file_bounds(f) for f in files]):
+        df = df.drop_duplicates(ignore_index=True)
+
+    return df
+
+
+def _parquet_filters(file_path, start=None, end=None, filters=None):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.types as pa_types
+
+    schema = pq.read_schema(file_path)
+
+    conditions = []
+    time_col = next((c for c in TIME_COLUMNS if c in schema.names), None)
+    # only filter on time columns that were stored as timestamps
+    if time_col is not None and pa_types.is_timestamp(schema.field(time_col).type):
+        time_type = schema.field(time_col).type
+        if start is not None:
+            start = pa.scalar(_as_utc(pd.Timestamp(start)), type=time_type)
+            conditions.append((time_col, ">=", start))
+        if end is not None:
+            end = pa.scalar(_as_utc(pd.Timestamp(end)), type=time_type)
+            conditions.append((time_col, "<", end))
+
+    for col, values in (filters or {}).items():
+        if isinstance(values, (list, tuple, set)):
+            conditions.append((col, "in", list(values)))
+        else:
+            conditions.append((col, "==", values))
+
+    return conditions or None
+
+
+def _as_utc(ts: pd.Timestamp) -> pd.Timestamp:
+    if ts.tzinfo is None:
+        return ts.tz_localize("UTC")
+    return ts.tz_convert("UTC")
+
+
+def _in_tz(ts: pd.Timestamp, like: pd.Timestamp) -> pd.Timestamp:
+    """ts in the timezone of like"""
+    if like.tzinfo is None:
+        return _as_utc(ts).tz_localize(None)
+    return ts.tz_convert(like.tz)
+
+
+def _data_ranges(df, start, end):
+    """Ranges from start to end with rows in df.
+
+    Rows cover Interval Start to Interval End. Without Interval End, rows cover
+    their time plus the median step between times, and times less than half a
+    step apart or from the edges of the request are treated as contiguous, since
+    timestamps like SCED's are a few seconds off their interval. If times can't
+    be read, a df with rows covers the whole request.
+    """
+    time_col = next((c for c in TIME_COLUMNS if c in df.columns), None)
+    if time_col is None or len(df) == 0:
+        return [(start, end)] if len(df) else []
+
+    tolerance = pd.Timedelta(0)
+    try:
+        starts = pd.to_datetime(df[time_col], utc=True)
+        if time_col == "Interval Start" and "Interval End" in df.columns:
+            ends = pd.to_datetime(df["Interval End"], utc=True)
+        else:
+            times = np.unique(starts.dropna().dt.tz_convert(None).to_numpy())
+            if len(times) < 2:
+                return [(start, end)]
+            step = pd.Timedelta(np.median(np.diff(times)))
+            ends = starts + step
+            tolerance = step / 2
+    except (TypeError, ValueError):
+        return [(start, end)]
+
+    # as UTC datetime64 values
+    valid = (starts.notna() & ends.notna()).to_numpy()
+    starts = starts.dt.tz_convert(None).to_numpy()[valid]
+    ends = ends.dt.tz_convert(None).to_numpy()[valid]
+    if len(starts) == 0:
+        return []
+
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    ends = np.maximum.accumulate(ends[order])
+
+    # a row starting after every earlier row has ended starts a new range
+    new_range = np.empty(len(starts), dtype=bool)
+    new_range[0] = True
+    new_range[1:] = starts[1:] > ends[:-1] + tolerance.to_timedelta64()
+    first = np.flatnonzero(new_range)
+    last = np.append(first[1:], len(starts)) - 1
+
+    ranges = []
+    for range_start, range_end in zip(starts[first], ends[last]):
+        range_start = _in_tz(pd.Timestamp(range_start, tz="UTC"), start)
+        range_end = _in_tz(pd.Timestamp(range_end, tz="UTC"), end)
+        range_start = start if range_start - start <= tolerance else range_start
+        range_end = end if end - range_end <= tolerance else range_end
+        if range_start < range_end:
+            ranges.append((range_start, range_end))
+    return ranges
+
+
+def _any_overlap(ranges):
+    ranges = sorted(ranges)
+    return any(ranges[i][1] > ranges[i + 1][0] for i in range(len(ranges) - 1))
+
+
+def _missing_ranges(ranges, start, end):
+    """Ranges from start to end not in the sorted, non-overlapping ranges"""
+    gaps = []
+    current = start
+    for covered_start, covered_end in ranges:
+        if _as_utc(covered_end) <= _as_utc(current):
+            continue
+        if _as_utc(covered_start) >= _as_utc(end):
+            break
+        if _as_utc(covered_start) > _as_utc(current):
+            gaps.append((current, _in_tz(covered_start, start)))
+        current = _in_tz(covered_end, start)
+
+    if _as_utc(current) < _as_utc(end):
+        gaps.append((current, end))
+
+    return gaps
+
+
+def _merge_ranges(ranges):
+    """Merges overlapping or adjacent (start, end) ranges"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+@contextlib.contextmanager
+def _dataset_lock(dataset_path):
+    """Serializes coverage updates of a dataset across threads and, where file
+    locks are available, processes"""
+    with _dataset_locks_lock:
+        lock = _dataset_locks.setdefault(dataset_path, threading.Lock())
+
+    with lock, open(os.path.join(dataset_path, LOCK_FILE), "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _write_json(path, data):
+    def write(tmp_path):
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+
+    utils.write_atomic(path, write)
@@ -0,0 +1,21 @@
+import timeit
+
+
+def best_time(f, number=1, repeat=3):
+    """Seconds a call of f takes, the best of repeat runs of number calls to
+    avoid noise from a busy machine"""
+    return min(timeit.repeat(f, number=number, repeat=repeat)) / number
+
+
+def assert_faster(baseline, candidate, min_speedup, number=1, label=""):
+    """Asserts candidate runs at least min_speedup times faster than baseline.
+    Only use it in tests marked slow, since timings are noisy on shared
+    machines."""
+    baseline_time = best_time(baseline, number=number)
+    candidate_time = best_time(candidate, number=number)
+
+    assert candidate_time * min_speedup < baseline_time, (
+        f"{label}: expected a {min_speedup}x speedup, got "
+        f"{baseline_time * 1000:.2f}ms -> {candidate_time * 1000:.2f}ms "
+        f"({baseline_time / candidate_time:.1f}x)"
+    )
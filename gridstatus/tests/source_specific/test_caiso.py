@@ -324,6 +324,152 @@ class TestCAISO(BaseTestISO):
             assert df.shape == (76, 8)
             self._check_curtailment(df)
 
+    @staticmethod
+    def _curtailment_report_json(date):
+        """Tables of a curtailment report as tabula-java writes them"""
+        rows = [
+            ["DATE", "HOUR", "CURT TYPE", "REASON", "FUEL TYPE"]
+            + ["CURTAILED MWH", "CURTAILED MW"],
+            [date, "1", "ECONOMIC", "SYSTEM", "SOLR", "10", "20"],
+            [date, "2", "ECONOMIC", "LOCAL", "WIND", "15", "25"],
+        ]
+        return [{"data": [[{"text": text} for text in row] for row in rows]}]
+
+    def test_get_curtailment_range_batches_pdfs(self, tmp_path, monkeypatch):
+        import json
+        import os
+
+        import requests
+        import tabula
+
+        pytest.importorskip("pyarrow")
+
+        downloads = []
+        batches = []
+
+        def _get(url, **kwargs):
+            downloads.append(url)
+            response = requests.Response()
+            response.status_code = 404 if "mar03" in url else 200
+            response._content = b"%PDF"
+            return response
+
+        def _convert_into_by_batch(pdf_dir, output_format, pages):
+            batches.append(sorted(os.listdir(pdf_dir)))
+            for name in os.listdir(pdf_dir):
+                date = name.removesuffix(".pdf")
+                with open(os.path.join(pdf_dir, date + ".json"), "w") as f:
+                    json.dump(self._curtailment_report_json(date), f)
+
+        monkeypatch.setattr(requests, "get", _get)
+        monkeypatch.setattr(tabula, "convert_into_by_batch", _convert_into_by_batch)
+
+        df = self.iso.get_curtailment(
+            start="2024-03-01",
+            end="2024-03-05",
+            cache_dir=tmp_path,
+        )
+
+        # the missing report for March 3rd is skipped
+        assert len(downloads) == 4
+        assert batches == [["2024-03-01.pdf", "2024-03-02.pdf", "2024-03-04.pdf"]]
+        assert df["Interval Start"].dt.strftime("%Y-%m-%d %H").tolist() == [
+            "2024-03-01 00",
+            "2024-03-01 01",
+            "2024-03-02 00",
+            "2024-03-02 01",
+            "2024-03-04 00",
+            "2024-03-04 01",
+        ]
+        assert df["Fuel Type"].tolist() == ["Solar", "Wind"] * 3
+
+        # parsed reports are read from the cache
+        cached = self.iso.get_curtailment(
+            start="2024-03-01",
+            end="2024-03-05",
+            cache_dir=tmp_path,
+        )
+
+        assert len(downloads) == 5
+        assert len(batches) == 1
+        pd.testing.assert_frame_equal(cached, df)
+
+        with pytest.raises(ValueError, match="Could not find curtailment PDF"):
+            self.iso.get_curtailment("2024-03-03")
+
+        with pytest.raises(ValueError, match="Could not find curtailment PDF"):
+            self.iso.get_curtailment(
+                start="2024-03-02",
+                end="2024-03-04",
+                error="raise",
+            )
+
+    def test_tables_from_tabula_json(self):
+        from gridstatus.caiso import _tables_from_tabula_json
+
+        raw_json = self._curtailment_report_json("2024-03-01")
+        raw_json[0]["data"][0][1]["text"] = ""
+        raw_json[0]["data"][0][3]["text"] = "CURT TYPE"
+
+        (df,) = _tables_from_tabula_json(raw_json + [{"data": []}])
+
+        assert df.columns.tolist() == [
+            "DATE",
+            "Unnamed: 0",
+            "CURT TYPE",
+            "CURT TYPE.1",
+            "FUEL TYPE",
+            "CURTAILED MWH",
+            "CURTAILED MW",
+        ]
+        assert df["Unnamed: 0"].tolist() == [1, 2]
+        assert df["CURTAILED MW"].tolist() == [20, 25]
+        assert df["DATE"].tolist() == ["2024-03-01"] * 2
+
+    def test_pdf_tables_have_the_same_columns_when_read_one_by_one(
+        self,
+        monkeypatch,
+        tmp_path,
+    ):
+        import tabula
+
+        from gridstatus.caiso import _read_pdf_tables, _tables_from_tabula_json
+
+        raw_json = self._curtailment_report_json("2024-03-01")
+        header = raw_json[0]["data"][0]
+        header[1]["text"] = ""
+        header[2]["text"] = "CURT TYPE"
+        header[3]["text"] = "CURT TYPE.1"
+        header[4]["text"] = "CURT TYPE"
+        (expected,) = _tables_from_tabula_json(raw_json)
+
+        def convert_into_by_batch(*args, **kwargs):
+            raise RuntimeError("Bad PDF")
+
+        def read_pdf(path, **kwargs):
+            # headers as parsed, before tabula names them
+            rows = [
+                [cell["text"] or None for cell in row] for row in raw_json[0]["data"]
+            ]
+            return [pd.DataFrame(rows[1:], columns=rows[0])]
+
+        monkeypatch.setattr(tabula, "convert_into_by_batch", convert_into_by_batch)
+        monkeypatch.setattr(tabula, "read_pdf", read_pdf)
+
+        path = str(tmp_path / "2024-03-01.pdf")
+        (df,) = _read_pdf_tables(str(tmp_path), [path])[path]
+
+        assert expected.columns.tolist() == [
+            "DATE",
+            "Unnamed: 0",
+            "CURT TYPE",
+            "CURT TYPE.1",
+            "CURT TYPE.1.1",
+            "CURTAILED MWH",
+            "CURTAILED MW",
+        ]
+        assert df.columns.tolist() == expected.columns.tolist()
+
     """get_gas_prices"""
 
     @pytest.mark.parametrize("date", ["2022-10-15"])
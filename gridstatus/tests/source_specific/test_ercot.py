@@ -1,14 +1,24 @@
-from io import StringIO
+import os
+from io import BytesIO, StringIO
 from typing import Dict
 
 import pandas as pd
 import pytest
+import requests
 
 from gridstatus import Markets, NoDataFoundException, NotSupported
 from gridstatus.ercot import (
     ELECTRICAL_BUS_LOCATION_TYPE,
+    ERCOT_API_CREDENTIAL_VARIABLES,
+    PUBLISH_CURSOR_ATTR,
+    SCED_SYSTEM_LAMBDA_RTID,
+    Document,
     Ercot,
     ERCOTSevenDayLoadForecastReport,
+    _parse_display_table,
+    _parse_display_table_lxml,
+    _parse_key_value_table_bs4,
+    _parse_key_value_table_lxml,
     parse_timestamp_from_friendly_name,
 )
 from gridstatus.ercot_60d_utils import (
@@ -49,6 +59,7 @@ from gridstatus.ercot_constants import (
     WIND_ACTUAL_AND_FORECAST_COLUMNS,
 )
 from gridstatus.tests.base_test_iso import BaseTestISO
+from gridstatus.tests.benchmark_utils import assert_faster
 from gridstatus.tests.vcr_utils import RECORD_MODE, setup_vcr
 
 api_vcr = setup_vcr(
@@ -58,6 +69,45 @@ api_vcr = setup_vcr(
 
 INTERVALS_PER_HOUR_AT_FIVE_MINUTE_RESOLUTION = 12
 
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "..", "fixtures", "ercot")
+
+DISPLAY_TABLE_FIXTURES = [
+    "actual_loads_of_weather_zones_20240115.html",
+    # DST end, with a repeated hour ending 0200*
+    "actual_loads_of_forecast_zones_20241103.html",
+]
+
+
+def _document_list(publish_times):
+    """Document list response of SCED system lambda files published at
+    publish_times"""
+    docs = []
+    for i, publish_time in enumerate(publish_times):
+        timestamp = pd.Timestamp(publish_time)
+        docs.append(
+            {
+                "Document": {
+                    "DocID": str(i),
+                    "FriendlyName": f"SCEDSYSLAMBDANP6322_{timestamp:%Y%m%d_%H%M%S}_csv",
+                    "ConstructedName": f"cdr.00013114.0000000000000000.{timestamp:%Y%m%d.%H%M%S}.SCEDSYSLAMBDANP6322_csv.zip",
+                    "PublishDate": timestamp.isoformat(),
+                },
+            },
+        )
+    return {"ListDocsByRptTypeRes": {"DocumentList": docs}}
+
+
+def _read_fixture(filename):
+    with open(os.path.join(FIXTURES_DIR, filename), "rb") as f:
+        return f.read()
+
+
+def _mock_html_response(filename):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = _read_fixture(filename)
+    return response
+
 
 class TestErcot(BaseTestISO):
     iso = Ercot()
@@ -234,6 +284,89 @@ class TestErcot(BaseTestISO):
         assert df.shape == (1, 15)
         assert df.columns[0] == "Time"
 
+    def test_get_real_time_system_conditions_from_fixture(self, monkeypatch):
+        monkeypatch.setattr(
+            "gridstatus.ercot.requests.get",
+            lambda url: _mock_html_response("real_time_system_conditions.html"),
+        )
+
+        df = self.iso.get_real_time_system_conditions()
+
+        assert df.shape == (1, 15)
+        assert df["Time"].iloc[0] == pd.Timestamp(
+            "2024-01-15 10:20:05",
+            tz=self.iso.default_timezone,
+        )
+        assert df["Actual System Demand"].iloc[0] == 52341
+        assert df["Current Frequency"].iloc[0] == 59.992
+        assert df["DC Tie Flows - DC_N (North) (MW)"].iloc[0] == -198
+
+    def test_parse_key_value_table_lxml_matches_bs4(self):
+        html = _read_fixture("real_time_system_conditions.html")
+
+        assert _parse_key_value_table_lxml(html) == _parse_key_value_table_bs4(html)
+
+    @pytest.mark.parametrize("filename", DISPLAY_TABLE_FIXTURES)
+    def test_parse_display_table_matches_read_html(self, filename):
+        html = _read_fixture(filename)
+
+        pd.testing.assert_frame_equal(
+            _parse_display_table_lxml(html),
+            pd.read_html(BytesIO(html), header=0)[0],
+        )
+
+    def test_parse_display_table_falls_back_to_read_html(self):
+        html = (
+            b"<table><tr><th>Oper Day</th><th>Hour Ending</th><th>TOTAL</th></tr>"
+            b"<tr><td>01/15/2024</td><td>0100</td><td>1,234.5</td></tr>"
+            b'<tr><td colspan="2">Total</td><td>1,234.5</td></tr></table>'
+        )
+
+        with pytest.raises(ValueError, match="merged cells"):
+            _parse_display_table_lxml(html)
+
+        pd.testing.assert_frame_equal(
+            _parse_display_table(html),
+            pd.read_html(BytesIO(html), header=0)[0],
+        )
+
+    def test_get_forecast_zone_load_html_dst_end(self, monkeypatch):
+        monkeypatch.setattr(
+            "gridstatus.ercot.requests.get",
+            lambda url: _mock_html_response(
+                "actual_loads_of_forecast_zones_20241103.html",
+            ),
+        )
+
+        df = self.iso._get_forecast_zone_load_html(pd.Timestamp("2024-11-03"))
+
+        assert len(df) == 25
+        assert df["Interval Start"].is_unique
+        assert (
+            df["Interval End"] - df["Interval Start"] == pd.Timedelta(hours=1)
+        ).all()
+
+    @pytest.mark.slow
+    def test_parse_html_tables_benchmark(self):
+        for filename in DISPLAY_TABLE_FIXTURES:
+            html = _read_fixture(filename)
+            assert_faster(
+                lambda: pd.read_html(BytesIO(html), header=0),
+                lambda: _parse_display_table_lxml(html),
+                min_speedup=1.5,
+                number=20,
+                label=filename,
+            )
+
+        html = _read_fixture("real_time_system_conditions.html")
+        assert_faster(
+            lambda: _parse_key_value_table_bs4(html),
+            lambda: _parse_key_value_table_lxml(html),
+            min_speedup=2,
+            number=20,
+            label="real_time_system_conditions",
+        )
+
     @pytest.mark.integration
     def test_get_energy_storage_resources(self):
         df = self.iso.get_energy_storage_resources()
@@ -658,6 +791,85 @@ class TestErcot(BaseTestISO):
         assert isinstance(rtm, pd.DataFrame)
         assert len(rtm) > 0
 
+    @staticmethod
+    def _dam_spp_workbook_zip():
+        import io
+        import zipfile
+
+        buffer = io.BytesIO()
+        with pd.ExcelWriter(buffer) as writer:
+            for month in ["01", "02"]:
+                pd.DataFrame(
+                    {
+                        "Delivery Date": [f"{month}/01/2023"] * 2,
+                        "Hour Ending": ["01:00", "02:00"],
+                        "Repeated Hour Flag": ["N", "N"],
+                        "Settlement Point": ["HB_HOUSTON", "LZ_NORTH"],
+                        "Settlement Point Price": [20.5, 21.5],
+                    },
+                ).to_excel(writer, sheet_name=month, index=False)
+
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w") as z:
+            z.writestr("rpt.00013060.2023.xlsx", buffer.getvalue())
+        return zip_buffer.getvalue()
+
+    def test_get_dam_spp_cache(self, tmp_path, monkeypatch):
+        import io
+
+        pytest.importorskip("pyarrow")
+
+        content = self._dam_spp_workbook_zip()
+        publish_date = pd.Timestamp("2024-01-02 03:00", tz="US/Central")
+
+        def _get_document(**kwargs):
+            return Document(
+                url="https://example.com/2023.zip",
+                publish_date=publish_date,
+                constructed_name="rpt.00013060.2023.zip",
+                friendly_name="DAMLZHBSPP_2023",
+                friendly_name_timestamp=None,
+            )
+
+        def _get(url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = io.BytesIO(content)
+            return response
+
+        read_excel_calls = []
+        read_excel = pd.read_excel
+
+        def _read_excel(*args, **kwargs):
+            read_excel_calls.append(kwargs)
+            return read_excel(*args, **kwargs)
+
+        monkeypatch.setattr(self.iso, "_get_document", _get_document)
+        monkeypatch.setattr(
+            self.iso,
+            "_get_settlement_point_mapping",
+            lambda verbose=False: pd.DataFrame({"RESOURCE_NODE": ["SOME_NODE"]}),
+        )
+        monkeypatch.setattr("gridstatus.utils.requests.get", _get)
+        monkeypatch.setattr("gridstatus.ercot.pd.read_excel", _read_excel)
+
+        df = self.iso.get_dam_spp(2023, cache_dir=tmp_path)
+        cached = self.iso.get_dam_spp(2023, cache_dir=tmp_path)
+
+        assert len(read_excel_calls) == 1
+        assert len(df) == 4
+        pd.testing.assert_frame_equal(cached, df)
+
+        # republishing replaces the cached data
+        publish_date = publish_date + pd.Timedelta(days=1)
+        self.iso.get_dam_spp(2023, cache_dir=tmp_path, excel_engine="openpyxl")
+
+        assert len(read_excel_calls) == 2
+        assert read_excel_calls[-1]["engine"] == "openpyxl"
+        assert [p.name for p in tmp_path.glob("ercot/*/*.parquet")] == [
+            "2023_20240103T090000.parquet",
+        ]
+
     @pytest.mark.slow
     @pytest.mark.integration
     def test_get_spp_today_real_time_15_minutes_zone(self):
@@ -1827,12 +2039,225 @@ class TestErcot(BaseTestISO):
             df["Interval End"] - df["Interval Start"] == pd.Timedelta(minutes=5)
         ).all()
 
+    def test_tail(self, monkeypatch):
+        publish_times = [
+            "2024-01-15T10:05:12-06:00",
+            "2024-01-15T10:15:12-06:00",
+            "2024-01-15T10:10:12-06:00",
+        ]
+        monkeypatch.setattr(
+            self.iso,
+            "_get_json",
+            lambda *args, **kwargs: _document_list(publish_times),
+        )
+
+        # without a cursor, only the latest document is returned
+        docs, cursor = self.iso.tail(SCED_SYSTEM_LAMBDA_RTID)
+        assert [doc.url[-1] for doc in docs] == ["1"]
+        assert cursor == pd.Timestamp("2024-01-15T10:15:12-06:00")
+
+        docs, cursor = self.iso.tail(
+            SCED_SYSTEM_LAMBDA_RTID,
+            since="2024-01-15 10:05:12",
+        )
+        # oldest first
+        assert [doc.url[-1] for doc in docs] == ["2", "1"]
+        assert cursor == pd.Timestamp("2024-01-15T10:15:12-06:00")
+
+        docs, new_cursor = self.iso.tail(SCED_SYSTEM_LAMBDA_RTID, since=cursor)
+        assert docs == []
+        assert new_cursor == cursor
+
+    def test_get_sced_system_lambda_published_after_cursor(self, monkeypatch):
+        publish_times = [
+            "2024-01-15T10:05:12-06:00",
+            "2024-01-15T10:10:12-06:00",
+            "2024-01-15T10:15:12-06:00",
+        ]
+        monkeypatch.setattr(
+            self.iso,
+            "_get_json",
+            lambda *args, **kwargs: _document_list(publish_times),
+        )
+        read_docs = []
+
+        def _handle_sced_system_lambda(docs, verbose=False):
+            read_docs.append([doc.url[-1] for doc in docs])
+            return pd.DataFrame({"System Lambda": [20.0] * len(docs)})
+
+        monkeypatch.setattr(
+            self.iso,
+            "_handle_sced_system_lambda",
+            _handle_sced_system_lambda,
+        )
+
+        df = self.iso.get_sced_system_lambda("2024-01-15")
+        cursor = df.attrs[PUBLISH_CURSOR_ATTR]
+        assert read_docs.pop() == ["0", "1", "2"]
+        assert cursor == pd.Timestamp("2024-01-15T10:15:12-06:00")
+
+        publish_times.append("2024-01-15T10:20:12-06:00")
+        df = self.iso.get_sced_system_lambda(
+            "2024-01-15",
+            published_after_cursor=cursor,
+        )
+        assert read_docs.pop() == ["3"]
+        assert df.attrs[PUBLISH_CURSOR_ATTR] == pd.Timestamp(
+            "2024-01-15T10:20:12-06:00",
+        )
+
+        # nothing new, so no rows and the same cursor
+        cursor = df.attrs[PUBLISH_CURSOR_ATTR]
+        for date in ["latest", "2024-01-15"]:
+            df = self.iso.get_sced_system_lambda(date, published_after_cursor=cursor)
+            assert df.empty
+            assert df.columns.tolist() == list(
+                Ercot.schema("get_sced_system_lambda").dtypes,
+            )
+            assert df.attrs[PUBLISH_CURSOR_ATTR] == cursor
+        assert read_docs == []
+
     def test_read_docs_return_empty_df(self):
         df = self.iso.read_docs(docs=[], empty_df=pd.DataFrame(columns=["test"]))
 
         assert df.shape[0] == 0
         assert df.columns.tolist() == ["test"]
 
+    def test_read_doc_filters_settlement_points(self, monkeypatch):
+        import io
+        import zipfile
+
+        csv = (
+            "DeliveryDate,DeliveryHour,DeliveryInterval,SettlementPointName,"
+            "SettlementPointType,SettlementPointPrice,DSTFlag\n"
+            "01/01/2024,1,1,HB_HOUSTON,HU,20.5,N\n"
+            "01/01/2024,1,1,LZ_NORTH,LZ,21.5,N\n"
+            "01/01/2024,1,1,LZ_NORTH,LZEW,22.5,N\n"
+            "01/01/2024,1,1,SOME_NODE,RN,23.5,N\n"
+        )
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as z:
+            z.writestr("spp.csv", csv)
+
+        def _get(url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = io.BytesIO(buffer.getvalue())
+            return response
+
+        monkeypatch.setattr("gridstatus.utils.requests.get", _get)
+        doc = Document(
+            url="https://example.com/spp.zip",
+            publish_date=None,
+            constructed_name="spp.csv.zip",
+            friendly_name="spp",
+            friendly_name_timestamp=None,
+        )
+
+        filters = self.iso._settlement_point_filters(["HB_HOUSTON", "LZ_NORTH_EW"])
+        df = self.iso.read_doc(doc, parse=False, filters=filters)
+
+        # the energy weighted zone is only named "LZ_NORTH_EW" after parsing
+        assert df["SettlementPointName"].tolist() == [
+            "HB_HOUSTON",
+            "LZ_NORTH",
+            "LZ_NORTH",
+        ]
+        assert self.iso._settlement_point_filters("ALL") is None
+
+    def test_read_docs_downloads_from_archive_in_bulk(self, monkeypatch):
+        import zipfile
+        from unittest.mock import Mock
+
+        publish_times = [f"2024-01-15T10:{m:02d}:12-06:00" for m in range(0, 20, 5)]
+        files = {}
+        for i, publish_time in enumerate(publish_times):
+            buffer = BytesIO()
+            with zipfile.ZipFile(buffer, "w") as z:
+                z.writestr(
+                    "lambda.csv",
+                    "SCEDTimeStamp,RepeatedHourFlag,SystemLambda\n"
+                    f"{pd.Timestamp(publish_time):%m/%d/%Y %H:%M:%S},N,{20 + i}\n",
+                )
+            files[str(i)] = buffer.getvalue()
+
+        iso = Ercot()
+        monkeypatch.setattr(
+            iso,
+            "_get_json",
+            lambda *args, **kwargs: _document_list(publish_times),
+        )
+        mis_downloads = []
+
+        def download_to_file(url, **kwargs):
+            doc_id = url.split("=")[-1]
+            mis_downloads.append(doc_id)
+            return BytesIO(files[doc_id])
+
+        monkeypatch.setattr("gridstatus.utils.download_to_file", download_to_file)
+
+        iso.archive_api = Mock(batch_size=2)
+        archive_downloads = []
+
+        def download_batch(doc_ids, emil_id):
+            assert emil_id == "np6-322-cd"
+            archive_downloads.append(doc_ids)
+            if "2" in doc_ids and failing_batch:
+                raise NoDataFoundException("Missing documents in bulk download")
+            return [BytesIO(files[i]) for i in doc_ids]
+
+        failing_batch = False
+        iso.archive_api._bulk_download_batch.side_effect = download_batch
+        iso.archive_document_threshold = 4
+
+        df = iso.get_sced_system_lambda("2024-01-15")
+
+        assert archive_downloads == [["0", "1"], ["2", "3"]]
+        assert mis_downloads == []
+        assert df["System Lambda"].tolist() == [20.0, 21.0, 22.0, 23.0]
+
+        # only the batch the archive doesn't have is downloaded from MIS
+        failing_batch = True
+        pd.testing.assert_frame_equal(iso.get_sced_system_lambda("2024-01-15"), df)
+        assert mis_downloads == ["2", "3"]
+
+        # as do batches that fail to connect
+        mis_downloads.clear()
+        iso.archive_api._bulk_download_batch.side_effect = [
+            [BytesIO(files["0"]), BytesIO(files["1"])],
+            requests.ConnectionError("Connection reset"),
+        ]
+        pd.testing.assert_frame_equal(iso.get_sced_system_lambda("2024-01-15"), df)
+        assert mis_downloads == ["2", "3"]
+
+        # authentication errors aren't hidden by downloading from MIS
+        response = requests.Response()
+        response.status_code = 401
+        iso.archive_api._bulk_download_batch.side_effect = requests.HTTPError(
+            response=response,
+        )
+        with pytest.raises(requests.HTTPError):
+            iso.get_sced_system_lambda("2024-01-15")
+
+        # recent files are downloaded from MIS
+        iso.archive_api.reset_mock()
+        iso.archive_document_min_age = pd.Timestamp.now(tz=iso.default_timezone) - (
+            pd.Timestamp("2024-01-01", tz=iso.default_timezone)
+        )
+        iso.get_sced_system_lambda("2024-01-15")
+        iso.archive_api._bulk_download_batch.assert_not_called()
+
+        # fewer files than the threshold are downloaded from MIS
+        del iso.archive_document_min_age
+        iso.archive_document_threshold = 5
+        iso.get_sced_system_lambda("2024-01-15")
+        iso.archive_api._bulk_download_batch.assert_not_called()
+
+        # without credentials, files are downloaded from MIS
+        for variable in ERCOT_API_CREDENTIAL_VARIABLES:
+            monkeypatch.delenv(variable, raising=False)
+        assert Ercot()._get_archive_api() is None
+
     @staticmethod
     def _check_ercot_spp(df, market, location_type):
         """Common checks for SPP data:
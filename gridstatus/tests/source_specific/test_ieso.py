@@ -1,7 +1,11 @@
 import datetime
+import io
+import os
+from unittest import mock
 
 import pandas as pd
 import pytest
+import requests
 from pandas.core.dtypes.common import is_numeric_dtype
 
 from gridstatus import IESO, utils
@@ -16,6 +20,8 @@ from gridstatus.tests.vcr_utils import RECORD_MODE, setup_vcr
 
 TIME_COLUMN = "Interval Start"
 
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "..", "fixtures", "ieso")
+
 file_vcr = setup_vcr(
     source="ieso",
     record_mode=RECORD_MODE,
@@ -959,3 +965,80 @@ class TestIESO(BaseTestISO):
         assert report_data[0]["Test Capacity"] == 100.0
         assert report_data[1]["DeliveryHour"] == 2
         assert report_data[1]["Test Capacity"] == 200.0
+
+    """xml parsing"""
+
+    @staticmethod
+    def _fixture_response(file_name):
+        with open(os.path.join(FIXTURES_DIR, file_name), "rb") as f:
+            content = f.read()
+
+        r = requests.Response()
+        r.status_code = 200
+        r.raw = io.BytesIO(content)
+        return r
+
+    def test_retrieve_fuel_mix_parses_generator_output_capability(self):
+        with mock.patch.object(
+            IESO,
+            "_request",
+            return_value=self._fixture_response(
+                "PUB_GenOutputCapability_20240101.xml",
+            ),
+        ) as request:
+            df = self.iso._retrieve_fuel_mix("2024-01-01")
+
+        assert request.call_args.kwargs["stream"] is True
+        assert df.columns.tolist() == [
+            "Generator Name",
+            "Fuel Type",
+            "Output MW",
+            "Capability MW",
+            "Available Capacity MW",
+            "Forecast MW",
+            "Interval Start",
+            "Interval End",
+        ]
+        assert len(df) == 4 * 24
+        assert df["Interval Start"].min() == pd.Timestamp(
+            "2024-01-01",
+            tz=self.default_timezone,
+        )
+
+        first_hour = df[df.index % 24 == 0].set_index("Fuel Type")
+        assert first_hour.loc["HYDRO", "Capability MW"] == 11.0
+        assert pd.isna(first_hour.loc["HYDRO", "Forecast MW"])
+        assert pd.isna(first_hour.loc["WIND", "Capability MW"])
+        assert first_hour.loc["WIND", "Forecast MW"] == 13.0
+        assert first_hour.loc["WIND", "Available Capacity MW"] == 14.0
+
+        # hours without an output yet still have a capability
+        hydro = df[df["Generator Name"] == "ABKENORA"]
+        assert hydro["Output MW"].isna().sum() == 4
+        assert hydro["Capability MW"].notna().all()
+
+    def test_retrieve_historical_fuel_mix_parses_yearly_report(self):
+        with mock.patch.object(
+            IESO,
+            "_request",
+            return_value=self._fixture_response("PUB_GenOutputbyFuelHourly_2023.xml"),
+        ):
+            df = self.iso._retrieve_historical_fuel_mix("2023-01-01")
+
+        assert df.columns.tolist() == [
+            "Interval Start",
+            "Interval End",
+            "Nuclear",
+            "Gas",
+            "Hydro",
+            "Wind",
+            "Solar",
+            "Biofuel",
+        ]
+        assert len(df) == 48
+        assert df["Interval Start"].is_monotonic_increasing
+        assert df.loc[0, "Nuclear"] == 1.0
+        assert df.loc[1, "Gas"] == 1002.0
+        # fuel types missing from an hour are 0
+        assert df.loc[0, "Biofuel"] == 0.0
+        assert df.loc[1, "Biofuel"] == 5002.0
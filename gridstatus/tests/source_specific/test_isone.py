@@ -1,9 +1,11 @@
+import io
 from unittest.mock import patch
 
 import pandas as pd
 import pytest
+import requests
 
-from gridstatus import ISONE
+from gridstatus import ISONE, isone
 from gridstatus.base import Markets
 from gridstatus.tests.base_test_iso import BaseTestISO
 from gridstatus.tests.decorators import with_markets
@@ -28,6 +30,43 @@ DST_BOUNDARIES = [
 # one hour longer.
 WIND_OR_SOLAR_FORECAST_LENGTH = pd.Timedelta(days=6, hours=22)
 
+# Location Id, Location, Location Type
+LOCATIONS = [
+    (4000, ".H.INTERNAL_HUB", "HUB"),
+    (4001, ".Z.MAINE", "LOAD ZONE"),
+]
+
+CSV_COMMENTS = '"C","Report"\n"C","Prices"\n"C","Preliminary"\n"C","Created"\n'
+
+
+def _day_ahead_lmp_csv():
+    lines = [
+        '"H","Date","Hour Ending","Location ID","Location Name","Location Type",'
+        '"Locational Marginal Price","Energy Component","Congestion Component",'
+        '"Marginal Loss Component"',
+        '"H","","","Number","Text","Text","$/MWh","$/MWh","$/MWh","$/MWh"',
+    ]
+    for location_id, location, location_type in LOCATIONS:
+        lines.append(
+            f'"D","01/01/2024","01",{location_id},"{location}","{location_type}",'
+            "30.5,30,0.25,0.25",
+        )
+    lines.append(f'"T",{len(LOCATIONS)}')
+    return CSV_COMMENTS + "\n".join(lines) + "\n"
+
+
+def _real_time_5_min_lmp_csv(interval):
+    lines = [
+        '"H","Local Time","Location ID","LMP","Energy Component",'
+        '"Congestion Component","Loss Component"',
+        '"H","(HH:MM:SS)","Number","$/MWh","$/MWh","$/MWh","$/MWh"',
+    ]
+    hour = interval.split("-")[0]
+    for location_id, _, _ in LOCATIONS:
+        lines.append(f'"D","{hour}:00:00",{location_id},40.5,40,0.25,0.25')
+    lines.append(f'"T",{len(LOCATIONS)}')
+    return CSV_COMMENTS + "\n".join(lines) + "\n"
+
 
 class TestISONE(BaseTestISO):
     iso = ISONE()
@@ -149,6 +188,88 @@ class TestISONE(BaseTestISO):
         assert df["Interval Start"].min() < self.local_now() - pd.DateOffset(hours=3)
         assert df["Interval Start"].max() > self.local_now() - pd.DateOffset(minutes=15)
 
+    def test_read_csv_matches_python_parser_with_skipfooter(self):
+        content = _day_ahead_lmp_csv().encode()
+
+        expected = pd.read_csv(
+            io.StringIO(content.decode("utf8")),
+            skiprows=[0, 1, 2, 3, 5],
+            skipfooter=1,
+            engine="python",
+        )
+
+        for csv in [content, content.rstrip(b"\n"), content.replace(b"\n", b"\r\n")]:
+            pd.testing.assert_frame_equal(
+                isone._read_csv(csv, skiprows=[0, 1, 2, 3, 5]),
+                expected,
+            )
+
+    def test_get_lmp_real_time_5_min_uses_cached_locations(self):
+        def _get(url):
+            response = requests.Response()
+            response.status_code = 200
+            interval = url.rsplit("_", 1)[1].removesuffix(".csv")
+            response._content = _real_time_5_min_lmp_csv(interval).encode()
+            return response
+
+        with (
+            patch.dict(
+                isone._location_table_cache,
+                {"table": None, "fetched_at": None, "dates": set()},
+            ),
+            patch.object(isone.requests, "get", side_effect=_get) as get,
+            patch.object(
+                isone,
+                "_make_request",
+                side_effect=lambda url, skiprows, verbose: isone._read_csv(
+                    _day_ahead_lmp_csv().encode(),
+                    skiprows=skiprows,
+                ),
+            ) as make_request,
+        ):
+            df = self.iso.get_lmp(
+                start="2024-01-01",
+                end="2024-01-03",
+                market=Markets.REAL_TIME_5_MIN,
+                include_id=True,
+            )
+
+        # one file per interval per day
+        assert get.call_count == 2 * len(self.iso.lmp_real_time_intervals)
+        # the day ahead locations are only fetched once
+        assert make_request.call_count == 1
+
+        assert len(df) == 2 * len(self.iso.lmp_real_time_intervals) * len(LOCATIONS)
+        assert df["Interval Start"].is_monotonic_increasing
+        assert df.drop_duplicates("Location Id")[
+            ["Location Id", "Location", "Location Type"]
+        ].values.tolist() == [list(location) for location in LOCATIONS]
+
+    def test_get_lmp_day_ahead_filters_locations_while_parsing(self):
+        def _make_request(url, skiprows, verbose, filters=None):
+            return isone._read_csv(
+                _day_ahead_lmp_csv().encode(),
+                skiprows=skiprows,
+                filters=filters,
+            )
+
+        with patch.object(
+            isone,
+            "_make_request",
+            side_effect=_make_request,
+        ) as make_request:
+            df = self.iso.get_lmp(
+                date="2024-01-01",
+                market=Markets.DAY_AHEAD_HOURLY,
+                locations=[".Z.MAINE"],
+            )
+
+        assert make_request.call_args.kwargs["filters"] == {
+            "Location Name": {".Z.MAINE"},
+        }
+        assert df["Location"].tolist() == [".Z.MAINE"]
+        assert df["Location Type"].tolist() == ["LOAD ZONE"]
+
     """get_load"""
 
     @pytest.mark.parametrize("date", DST_BOUNDARIES)
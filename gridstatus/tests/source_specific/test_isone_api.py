@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -686,3 +688,43 @@ class TestISONEAPI(TestHelperMixin):
             assert result["Energy"].dtype in [np.int64, np.float64]
             assert result["Congestion"].dtype in [np.int64, np.float64]
             assert result["Loss"].dtype in [np.int64, np.float64]
+
+    def test_get_lmp_real_time_hourly_normalizes_dst_end_offsets(self):
+        # The repeated 1am hour is published with both -04:00 and -05:00 offsets
+        records = [
+            {
+                "BeginDate": begin_date,
+                "Location": {"$": location, "@LocId": "4000", "@LocType": "HUB"},
+                "LmpTotal": 30.0,
+                "EnergyComponent": 29.0,
+                "CongestionComponent": 0.5,
+                "LossComponent": 0.5,
+            }
+            for begin_date in [
+                "2024-11-03T00:00:00.000-04:00",
+                "2024-11-03T01:00:00.000-04:00",
+                "2024-11-03T01:00:00.000-05:00",
+                "2024-11-03T02:00:00.000-05:00",
+            ]
+            for location in [".H.INTERNALHUB", ".Z.MAINE"]
+        ]
+
+        with patch.object(
+            self.iso,
+            "make_api_call",
+            return_value={"HourlyLmps": {"HourlyLmp": records}},
+        ):
+            result = self.iso.get_lmp_real_time_hourly_final(date="2024-11-03")
+
+        assert result["Interval Start"].dt.tz.zone == self.iso.default_timezone
+        assert result["Interval Start"].drop_duplicates().tolist() == [
+            pd.Timestamp(begin_date).tz_convert(self.iso.default_timezone)
+            for begin_date in [
+                "2024-11-03T00:00:00.000-04:00",
+                "2024-11-03T01:00:00.000-04:00",
+                "2024-11-03T01:00:00.000-05:00",
+                "2024-11-03T02:00:00.000-05:00",
+            ]
+        ]
+        assert result["Location"].tolist() == [".H.INTERNALHUB", ".Z.MAINE"] * 4
+        assert (result["Location Type"] == "HUB").all()
@@ -5,6 +5,7 @@ import pytest
 from gridstatus import MISO, NotSupported
 from gridstatus.base import Markets, NoDataFoundException
 from gridstatus.tests.base_test_iso import BaseTestISO
+from gridstatus.tests.benchmark_utils import assert_faster
 from gridstatus.tests.decorators import with_markets
 from gridstatus.tests.vcr_utils import RECORD_MODE, setup_vcr
 
@@ -14,6 +15,55 @@ miso_vcr = setup_vcr(
 )
 
 
+def _hourly_lmp_report(n_nodes, seed=0):
+    """Daily market report with a row per node and value and a column per hour"""
+    rng = np.random.default_rng(seed)
+    # reverse order so the report isn't already sorted
+    nodes = [f"NODE{i:05d}" for i in range(n_nodes)][::-1]
+    types = rng.choice(["Gennode", "Hub", "Interface", "Loadzone"], n_nodes)
+
+    report = pd.DataFrame(
+        {
+            "Node": np.repeat(nodes, 3),
+            "Type": np.repeat(types, 3),
+            "Value": ["LMP", "MCC", "MLC"] * n_nodes,
+        },
+    )
+    values = rng.normal(30, 10, (len(report), 24)).round(2)
+    # a value missing for a whole day and a node missing for an hour
+    values[1, :] = np.nan
+    values[3:6, 5] = np.nan
+    for hour in range(1, 25):
+        report[f"HE {hour}"] = values[:, hour - 1]
+
+    return report
+
+
+def _handle_hourly_lmp_with_pivot_table(date, raw_data, tz):
+    """Reshape used before MISO._handle_hourly_lmp was vectorized"""
+    data_melted = raw_data.melt(
+        id_vars=["Node", "Type", "Value"],
+        value_vars=[col for col in raw_data.columns if col.startswith("HE")],
+        var_name="HE",
+        value_name="value",
+    )
+
+    data = data_melted.pivot_table(
+        index=["Node", "Type", "HE"],
+        columns="Value",
+        values="value",
+        aggfunc="first",
+    ).reset_index()
+
+    data["Interval Start"] = (
+        data["HE"]
+        .apply(lambda x: date.replace(tzinfo=None, hour=int(x.split(" ")[1]) - 1))
+        .dt.tz_localize(tz)
+    )
+
+    return data.drop(columns=["HE"])
+
+
 class TestMISO(BaseTestISO):
     iso = MISO()
 
@@ -183,6 +233,62 @@ class TestMISO(BaseTestISO):
             )
             assert set(data["Location"].unique()) == set(self.iso.hubs)
 
+    def test_handle_hourly_lmp_matches_pivot_table(self):
+        date = pd.Timestamp("2024-01-02", tz=self.iso.default_timezone)
+        raw_data = _hourly_lmp_report(n_nodes=50)
+
+        expected = (
+            _handle_hourly_lmp_with_pivot_table(
+                date,
+                raw_data,
+                self.iso.default_timezone,
+            )
+            .sort_values(["Interval Start", "Node"])
+            .reset_index(drop=True)
+        )
+
+        data = self.iso._handle_hourly_lmp(date, raw_data)
+
+        pd.testing.assert_frame_equal(data, expected)
+        # the node and hour without any values is dropped
+        assert len(data) == 50 * 24 - 1
+
+    @pytest.mark.slow
+    def test_handle_hourly_lmp_benchmark(self):
+        date = pd.Timestamp("2024-01-02", tz=self.iso.default_timezone)
+        # about the number of pricing nodes in a daily report
+        raw_data = _hourly_lmp_report(n_nodes=2500)
+
+        assert_faster(
+            lambda: _handle_hourly_lmp_with_pivot_table(
+                date,
+                raw_data,
+                self.iso.default_timezone,
+            ).sort_values(["Interval Start", "Node"]),
+            lambda: self.iso._handle_hourly_lmp(date, raw_data),
+            min_speedup=2,
+            label="_handle_hourly_lmp",
+        )
+
+    def test_read_report_csv_raises_http_error(self, monkeypatch):
+        import urllib.error
+
+        import requests
+
+        from gridstatus import single_flight
+
+        def _get(url, **kwargs):
+            response = requests.Response()
+            response.status_code = 404
+            response.reason = "Not Found"
+            return response
+
+        monkeypatch.setattr(single_flight, "get", _get)
+
+        with pytest.raises(urllib.error.HTTPError) as e:
+            self.iso._read_report_csv("https://example.com/report.csv")
+        assert e.value.code == 404
+
     """get_load"""
 
     def test_get_load_historical(self):
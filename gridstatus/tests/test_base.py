@@ -1,9 +1,10 @@
 from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 import requests
 
-from gridstatus.base import ISOBase
+from gridstatus.base import CONDITIONAL_CACHE_SIZE, ISOBase, NotSupported
 
 
 class TestISOBase:
@@ -52,3 +53,167 @@ class TestISOBase:
             with pytest.raises(requests.RequestException):
                 iso._get_json("http://example.com", False, retries=None)
             mocked_get.assert_called_once()
+
+    def test_get_json_conditional_request_not_modified(self):
+        with patch("gridstatus.base.requests.get") as mocked_get:
+            mocked_get.side_effect = [
+                Mock(
+                    status_code=200,
+                    ok=True,
+                    headers={"ETag": '"abc"'},
+                    json=Mock(return_value={"key": "value"}),
+                    raise_for_status=Mock(),
+                ),
+                Mock(status_code=304, ok=False, headers={}),
+            ]
+
+            iso = ISOBase()
+            iso.conditional_requests = True
+            assert iso._get_json("http://example.com") == {"key": "value"}
+            assert iso._get_json("http://example.com") == {"key": "value"}
+
+            second_call_headers = mocked_get.call_args_list[1].kwargs["headers"]
+            assert second_call_headers == {"If-None-Match": '"abc"'}
+
+    def test_conditional_cache_is_bounded(self):
+        with patch("gridstatus.base.requests.get") as mocked_get:
+            mocked_get.return_value = Mock(
+                status_code=200,
+                ok=True,
+                headers={"ETag": '"abc"'},
+                json=Mock(return_value={}),
+                raise_for_status=Mock(),
+            )
+
+            iso = ISOBase()
+            iso.conditional_requests = True
+            for i in range(CONDITIONAL_CACHE_SIZE + 5):
+                iso._get_json(f"http://example.com/{i}")
+
+        assert len(iso._conditional_cache) == CONDITIONAL_CACHE_SIZE
+        # the least recently used responses are dropped
+        assert ("http://example.com/0", "None") not in iso._conditional_cache
+
+
+class WatchISO(ISOBase):
+    default_timezone = "US/Central"
+
+    def __init__(self, responses):
+        self.responses = iter(responses)
+        self.dates = []
+        self.conditional = []
+
+    def get_fuel_mix(self, date, verbose=False):
+        from gridstatus.base import _conditional_requests
+
+        self.dates.append(date)
+        self.conditional.append(_conditional_requests.get())
+        response = next(self.responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _fuel_mix(hours):
+    start = pd.Timestamp("2024-01-01", tz="US/Central")
+    interval_start = [start + pd.Timedelta(hours=h) for h in hours]
+    return pd.DataFrame(
+        {
+            "Interval Start": interval_start,
+            "Interval End": [t + pd.Timedelta(hours=1) for t in interval_start],
+            "Solar": [float(h) for h in hours],
+        },
+    )
+
+
+class TestWatch:
+    def test_watch_yields_only_new_rows(self):
+        iso = WatchISO(
+            [
+                _fuel_mix([0, 1]),
+                _fuel_mix([0, 1]),
+                ValueError("temporary failure"),
+                _fuel_mix([0, 1, 2, 3]),
+            ],
+        )
+
+        with patch("gridstatus.base.time.sleep") as mocked_sleep:
+            dfs = list(iso.watch("get_fuel_mix", max_polls=4))
+
+        assert [df["Solar"].tolist() for df in dfs] == [[0.0, 1.0], [2.0, 3.0]]
+
+        # hourly data: wait an hour after new data, a quarter of that otherwise
+        assert [c.args[0] for c in mocked_sleep.call_args_list] == [3600, 900, 900]
+        # only the first poll downloads the whole day
+        assert iso.dates == ["today", "latest", "latest", "latest"]
+        # requests are conditional only within the method calls of watch
+        assert iso.conditional == [True] * 4
+        assert iso.conditional_requests is False
+
+    def test_watch_requests_date_after_gap(self):
+        iso = WatchISO(
+            [
+                _fuel_mix([0, 1]),
+                # the 2:00 interval was missed
+                _fuel_mix([3]),
+                _fuel_mix([0, 1, 2, 3]),
+            ],
+        )
+
+        with patch("gridstatus.base.time.sleep"):
+            dfs = list(iso.watch("get_fuel_mix", max_polls=2))
+
+        assert [df["Solar"].tolist() for df in dfs] == [[0.0, 1.0], [2.0, 3.0]]
+        assert iso.dates == ["today", "latest", "today"]
+
+    def test_watch_without_latest(self):
+        iso = WatchISO(
+            [
+                _fuel_mix([0]),
+                NotSupported("latest not supported"),
+                _fuel_mix([0, 1]),
+                _fuel_mix([0, 1, 2]),
+            ],
+        )
+
+        with patch("gridstatus.base.time.sleep"):
+            dfs = list(iso.watch("get_fuel_mix", max_polls=3))
+
+        assert [df["Solar"].tolist() for df in dfs] == [[0.0], [1.0], [2.0]]
+        assert iso.dates == ["today", "latest", "today", "today"]
+
+    def test_watch_latest_errors_are_failed_polls(self):
+        iso = WatchISO(
+            [
+                _fuel_mix([0]),
+                KeyError("payload changed"),
+                _fuel_mix([0, 1]),
+            ],
+        )
+
+        with patch("gridstatus.base.time.sleep"):
+            with patch("gridstatus.base.logger.warning") as warning:
+                dfs = list(iso.watch("get_fuel_mix", max_polls=3))
+
+        assert "payload changed" in warning.call_args.args[0]
+        # latest is still used after the failure
+        assert iso.dates == ["today", "latest", "latest"]
+        assert [df["Solar"].tolist() for df in dfs] == [[0.0], [1.0]]
+
+        iso = WatchISO([_fuel_mix([0]), KeyError("payload changed")])
+        with patch("gridstatus.base.time.sleep"):
+            with pytest.raises(KeyError):
+                list(iso.watch("get_fuel_mix", error="raise"))
+
+    def test_watch_raise(self):
+        iso = WatchISO([ValueError("failure")])
+
+        with patch("gridstatus.base.time.sleep"):
+            with pytest.raises(ValueError):
+                list(iso.watch(iso.get_fuel_mix, error="raise"))
+
+    def test_watch_requires_dataframe(self):
+        iso = WatchISO([{"Solar": 1}])
+
+        with pytest.raises(NotSupported):
+            list(iso.watch("get_fuel_mix", max_polls=1))
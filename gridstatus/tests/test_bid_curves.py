@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from gridstatus.bid_curves import GroupedCurves
+
+
+def _offers():
+    return pd.DataFrame(
+        {
+            "Delivery Date": ["01/02/2024", "01/01/2024", "01/02/2024", "01/01/2024"]
+            * 2,
+            "Hour Ending": [1, 2, 1, 1, 2, 2, 1, 1],
+            "MW Offered": [10, 5, 20, 1, 2, 3, 30, 4],
+            "Offer Price": [1.5, 2.0, 3.5, 4.0, 5.0, 6.0, 7.5, np.nan],
+        },
+    )
+
+
+def test_to_frame_matches_groupby():
+    df = _offers()
+    by = ["Delivery Date", "Hour Ending"]
+    columns = ["MW Offered", "Offer Price"]
+
+    expected = (
+        df.groupby(by)
+        .apply(
+            lambda x: [tuple(p) for p in x[columns].values.tolist()],
+            include_groups=False,
+        )
+        .reset_index(name="Bid Curve")
+    )
+
+    result = GroupedCurves(df, by=by, columns=columns).to_frame("Bid Curve")
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["Bid Curve"].iloc[1] == [(5.0, 2.0), (3.0, 6.0)]
+    assert result["Bid Curve"].iloc[2] == [(10.0, 1.5), (20.0, 3.5), (30.0, 7.5)]
+
+
+def test_missing_keys():
+    df = pd.DataFrame(
+        {
+            "QSE": ["A", None, "A", None],
+            "Offered Price": [1.0, 2.0, 3.0, 4.0],
+            "Offered Quantity": [1, 2, 3, 4],
+        },
+    )
+
+    dropped = GroupedCurves(df, by=["QSE"], columns=["Offered Quantity"])
+    assert dropped.keys["QSE"].tolist() == ["A"]
+    assert dropped.to_lists() == [[1, 3]]
+
+    kept = GroupedCurves(
+        df,
+        by=["QSE"],
+        columns=["Offered Price", "Offered Quantity"],
+        dropna=False,
+    )
+    assert len(kept) == 2
+    assert kept.keys["QSE"].isna().tolist() == [False, True]
+    assert kept.first("Offered Price").tolist() == [1.0, 2.0]
+    assert kept.sum("Offered Quantity").tolist() == [4, 6]
+    assert kept.to_lists(["Offered Quantity"]) == [[1, 3], [2, 4]]
+
+
+def test_quantity_at_price():
+    curves = GroupedCurves(
+        _offers(),
+        by=["Delivery Date", "Hour Ending"],
+        columns=["MW Offered", "Offer Price"],
+    )
+
+    # curves are 01/01 HE1, 01/01 HE2, 01/02 HE1 and 01/02 HE2
+    assert curves.sum("MW Offered").tolist() == [5, 8, 60, 2]
+    assert curves.quantity_at_price(
+        4.0,
+        quantity="MW Offered",
+        price_column="Offer Price",
+    ).tolist() == [1, 5, 30, 0]
+    assert curves.quantity_at_price(
+        [0, 10, 2, 10],
+        quantity="MW Offered",
+        price_column="Offer Price",
+    ).tolist() == [0, 8, 10, 2]
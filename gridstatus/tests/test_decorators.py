@@ -1,6 +1,22 @@
+import types
+
 import pandas as pd
+import pytest
+import requests
 
-from gridstatus.decorators import FiveMinOffset
+from gridstatus.base import ISOBase, Markets
+from gridstatus.decorators import (
+    DayBeginOffset,
+    FiveMinOffset,
+    HourBeginOffset,
+    MonthBeginOffset,
+    YearBeginOffset,
+    date_range_boundaries,
+    support_date_range,
+)
+from gridstatus.ercot import PUBLISH_CURSOR_ATTR
+from gridstatus.lmp_config import lmp_config
+from gridstatus.tests.benchmark_utils import best_time
 
 # todo test other offsets
 
@@ -20,3 +36,433 @@ def test_five_min_offset():
         hours=1,
         minutes=5,
     )
+
+
+def _add_until(start, end, freq):
+    """Boundaries from repeatedly adding freq to start, as the planner did
+    before it was vectorized"""
+    if isinstance(freq, str):
+        freq = pd.tseries.frequencies.to_offset(freq)
+
+    dates = [start]
+    current_date = start + freq
+    while current_date < end:
+        dates.append(current_date)
+        current_date += freq
+    return dates + [end]
+
+
+@pytest.mark.parametrize(
+    "freq",
+    [
+        DayBeginOffset(),
+        MonthBeginOffset(),
+        YearBeginOffset(),
+        HourBeginOffset(),
+        FiveMinOffset(),
+        "1h",
+        "31D",
+        "365D",
+        "W-MON",
+    ],
+)
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        # spring forward
+        ("2024-03-09 00:00-06:00", "2024-03-12 00:00-05:00"),
+        ("2024-03-10 01:37-06:00", "2024-03-10 05:00-05:00"),
+        # fall back, starting in the repeated hour
+        ("2024-11-02 23:00-05:00", "2024-11-04 00:00-06:00"),
+        ("2024-11-03 01:30-05:00", "2024-11-03 01:30-06:00"),
+        # across a year
+        ("2023-12-31 22:10-06:00", "2025-02-01 00:00-06:00"),
+    ],
+)
+def test_date_range_boundaries_matches_adding_offsets(freq, start, end):
+    start = pd.Timestamp(start).tz_convert("US/Central")
+    end = pd.Timestamp(end).tz_convert("US/Central")
+    if isinstance(freq, FiveMinOffset) and end - start > pd.Timedelta(days=7):
+        end = start + pd.Timedelta(days=7)
+
+    assert list(date_range_boundaries(start, end, freq)) == _add_until(
+        start,
+        end,
+        freq,
+    )
+
+
+def test_date_range_boundaries_dst():
+    tz = "US/Central"
+
+    # hours are an hour apart across spring forward
+    assert list(
+        date_range_boundaries(
+            pd.Timestamp("2024-03-10 00:00", tz=tz),
+            pd.Timestamp("2024-03-10 05:00", tz=tz),
+            HourBeginOffset(),
+        ).strftime("%H:%M%z"),
+    ) == ["00:00-0600", "01:00-0600", "03:00-0500", "04:00-0500", "05:00-0500"]
+
+    # and the repeated hour is its own range when falling back
+    assert list(
+        date_range_boundaries(
+            pd.Timestamp("2024-11-03 00:00", tz=tz),
+            pd.Timestamp("2024-11-03 03:00", tz=tz),
+            HourBeginOffset(),
+        ).strftime("%H:%M%z"),
+    ) == [
+        "00:00-0500",
+        "01:00-0500",
+        "01:00-0600",
+        "02:00-0600",
+        "03:00-0600",
+    ]
+
+    # days start at local midnight
+    assert date_range_boundaries(
+        pd.Timestamp("2024-03-09 12:00", tz=tz),
+        pd.Timestamp("2024-03-12 00:00", tz=tz),
+        DayBeginOffset(),
+    ).equals(
+        pd.DatetimeIndex(
+            ["2024-03-09 12:00", "2024-03-10", "2024-03-11", "2024-03-12"],
+        ).tz_localize(tz),
+    )
+
+
+class DailyISO(ISOBase):
+    default_timezone = "US/Central"
+
+    @support_date_range(frequency="DAY_START")
+    def get_data(self, date, end=None, verbose=False):
+        if date.day == 3:
+            raise ValueError("No data")
+        return pd.DataFrame({"Time": [date], "Value": [date.day]})
+
+    @lmp_config(supports={Markets.DAY_AHEAD_HOURLY: ["today", "historical"]})
+    @support_date_range(frequency="DAY_START")
+    def get_lmp(self, date, market, end=None, verbose=False):
+        return pd.DataFrame({"Time": [date], "Market": [market.value]})
+
+
+class CursorISO(ISOBase):
+    default_timezone = "US/Central"
+
+    @support_date_range(frequency="DAY_START")
+    def get_data(self, date, end=None, verbose=False):
+        df = pd.DataFrame({"Time": [date], "Value": [date.day]})
+        df.attrs[PUBLISH_CURSOR_ATTR] = date + pd.Timedelta(hours=12)
+        df.attrs["source"] = f"day {date.day}"
+        return df
+
+
+def test_support_date_range_merges_attrs():
+    df = CursorISO().get_data(start="2024-01-01", end="2024-01-04")
+
+    # the newest cursor is kept, other attrs that differ are dropped
+    assert df.attrs == {
+        PUBLISH_CURSOR_ATTR: pd.Timestamp("2024-01-03 12:00", tz="US/Central"),
+    }
+
+
+class LatestISO(ISOBase):
+    default_timezone = "US/Central"
+
+    @support_date_range(frequency="DAY_START")
+    def get_data(self, date, end=None, verbose=False):
+        assert date == "latest"
+        return pd.DataFrame({"Time": [pd.Timestamp("2024-01-01")], "Value": [1]})
+
+
+def test_support_date_range_latest_ignores_date_range_kwargs(tmp_path):
+    pytest.importorskip("pyarrow")
+    from gridstatus.store import Store
+
+    store = Store(tmp_path)
+    iso = LatestISO()
+
+    df = iso.get_data(date="latest", store=store, error="raise")
+    assert df["Value"].tolist() == [1]
+    assert store.datasets().empty
+
+    (df,) = iso.get_data("latest", store=store, stream=True)
+    assert df["Value"].tolist() == [1]
+
+
+def test_support_date_range_stream():
+    iso = DailyISO()
+
+    chunks = iso.get_data(start="2024-01-01", end="2024-01-05", stream=True)
+
+    assert isinstance(chunks, types.GeneratorType)
+
+    # the failed chunk on the 3rd is skipped
+    dfs = list(chunks)
+    assert [df["Value"].item() for df in dfs] == [1, 2, 4]
+
+    df = iso.get_data(start="2024-01-01", end="2024-01-05")
+    pd.testing.assert_frame_equal(df, pd.concat(dfs).reset_index(drop=True))
+
+
+def test_support_date_range_stream_with_bounds():
+    iso = DailyISO()
+
+    chunks = list(
+        iso.get_data(start="2024-01-01", end="2024-01-03", stream="with_bounds"),
+    )
+
+    assert [(start, end) for start, end, _ in chunks] == [
+        (
+            pd.Timestamp("2024-01-01", tz="US/Central"),
+            pd.Timestamp("2024-01-02", tz="US/Central"),
+        ),
+        (
+            pd.Timestamp("2024-01-02", tz="US/Central"),
+            pd.Timestamp("2024-01-03", tz="US/Central"),
+        ),
+    ]
+
+    # single date requests are one chunk without an end
+    ((start, end, df),) = iso.get_data("2024-01-01", stream="with_bounds")
+    assert start == pd.Timestamp("2024-01-01", tz="US/Central")
+    assert end is None
+    assert df["Value"].item() == 1
+
+
+def test_support_date_range_stream_is_lazy():
+    iso = DailyISO()
+
+    chunks = iso.get_data(
+        start="2024-01-02",
+        end="2024-01-05",
+        stream=True,
+        error="raise",
+    )
+
+    # nothing is requested until the generator is consumed
+    assert next(chunks)["Value"].item() == 2
+
+    with pytest.raises(ValueError, match="No data"):
+        next(chunks)
+
+
+def test_support_date_range_stream_invalid():
+    with pytest.raises(ValueError, match="Invalid value for stream"):
+        DailyISO().get_data("2024-01-01", stream="all")
+
+
+def test_support_date_range_stream_through_lmp_config():
+    dfs = list(
+        DailyISO().get_lmp(
+            start="2024-01-01",
+            end="2024-01-03",
+            market="DAY_AHEAD_HOURLY",
+            stream=True,
+        ),
+    )
+
+    assert len(dfs) == 2
+    assert (pd.concat(dfs)["Market"] == "DAY_AHEAD_HOURLY").all()
+
+
+def _split_at_march(dates, args_dict):
+    """Ends ranges before March 1st and starts a new range on it"""
+    march = pd.Timestamp("2024-03-01", tz="US/Central")
+    new_dates = []
+    for date, next_date in zip(dates, dates[1:]):
+        new_dates.append(date)
+        if date < march < next_date:
+            new_dates += [march - pd.Timedelta(minutes=1), None, march]
+    return new_dates + [dates[-1]]
+
+
+class RangeISO(ISOBase):
+    default_timezone = "US/Central"
+
+    def __init__(self, max_request_days=None):
+        self.requests = []
+        self.max_request_days = max_request_days
+
+    @support_date_range(frequency="31D")
+    def get_data(self, date, end=None, verbose=False):
+        if self.max_request_days is not None and end - date > pd.Timedelta(
+            days=self.max_request_days
+        ):
+            raise requests.exceptions.ReadTimeout("Read timed out")
+
+        self.requests.append((date, end))
+        # one row per hour
+        return pd.DataFrame(
+            {"Interval Start": pd.date_range(date, end, freq="h", inclusive="left")},
+        )
+
+    @support_date_range(frequency="31D", update_dates=_split_at_march)
+    def get_split_data(self, date, end=None, verbose=False):
+        self.requests.append((date, end))
+        return pd.DataFrame({"Interval Start": [date]})
+
+
+def _assert_contiguous(ranges, start, end):
+    assert ranges[0][0] == pd.Timestamp(start, tz="US/Central")
+    assert ranges[-1][1] == pd.Timestamp(end, tz="US/Central")
+    for (_, previous_end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert previous_end == next_start
+
+
+def test_support_date_range_adaptive_shrinks_large_requests():
+    iso = RangeISO()
+
+    df = iso.get_data(
+        start="2024-01-01",
+        end="2024-04-01",
+        # about 5 days of hourly rows
+        adaptive={"target_rows": 24 * 5},
+    )
+
+    sizes = [end - start for start, end in iso.requests]
+    # starts from the frequency, then shrinks towards the target
+    assert sizes[0] == pd.Timedelta(days=31)
+    assert sizes[1] == pd.Timedelta(days=7)
+    assert sizes[-2] == pd.Timedelta(days=5)
+    assert all(size <= pd.Timedelta(days=31) for size in sizes)
+    _assert_contiguous(iso.requests, "2024-01-01", "2024-04-01")
+
+    # same data as fixed size requests, even across DST on March 10th
+    pd.testing.assert_frame_equal(
+        df,
+        RangeISO().get_data(start="2024-01-01", end="2024-04-01"),
+    )
+
+
+def test_support_date_range_adaptive_never_exceeds_frequency():
+    iso = RangeISO()
+
+    iso.get_data(start="2024-01-01", end="2024-04-01", adaptive=True)
+
+    assert [end - start for start, end in iso.requests] == [
+        pd.Timedelta(days=31),
+        pd.Timedelta(days=31),
+        # the remaining days, which include the start of DST
+        pd.Timedelta(days=28, hours=23),
+    ]
+
+
+def test_support_date_range_adaptive_never_exceeds_frequency_at_dst_end():
+    iso = RangeISO()
+
+    iso.get_data(start="2024-10-15", end="2024-12-31", adaptive=True)
+
+    sizes = [end - start for start, end in iso.requests]
+    # 31 calendar days across the end of DST would be 31 days and 1 hour
+    assert sizes[0] == pd.Timedelta(days=31)
+    assert all(size <= pd.Timedelta(days=31) for size in sizes)
+    _assert_contiguous(iso.requests, "2024-10-15", "2024-12-31")
+
+
+def test_support_date_range_adaptive_retries_smaller_after_timeout():
+    iso = RangeISO(max_request_days=10)
+
+    df = iso.get_data(start="2024-01-01", end="2024-02-01", adaptive=True)
+
+    assert all(end - start <= pd.Timedelta(days=10) for start, end in iso.requests)
+    _assert_contiguous(iso.requests, "2024-01-01", "2024-02-01")
+    assert len(df) == 31 * 24
+
+
+def test_support_date_range_adaptive_respects_update_dates():
+    iso = RangeISO()
+
+    iso.get_split_data(start="2024-02-20", end="2024-03-10", adaptive=True)
+
+    # requests never cross the split added by update_dates
+    assert iso.requests == [
+        (
+            pd.Timestamp("2024-02-20", tz="US/Central"),
+            pd.Timestamp("2024-02-29 23:59", tz="US/Central"),
+        ),
+        (
+            pd.Timestamp("2024-03-01", tz="US/Central"),
+            pd.Timestamp("2024-03-10", tz="US/Central"),
+        ),
+    ]
+
+
+def test_support_date_range_adaptive_ignored_for_calendar_frequencies():
+    iso = DailyISO()
+
+    df = iso.get_data(start="2024-01-01", end="2024-01-05", adaptive=True)
+
+    assert df["Value"].tolist() == [1, 2, 4]
+
+
+# Per call overhead of @lmp_config and @support_date_range for a method that
+# returns immediately. Budgets are generous so they only catch large regressions,
+# e.g. creating a progress bar or inspecting the signature on every call
+LATEST_CALL_BUDGET_SECONDS = 0.0005
+SINGLE_DATE_CALL_BUDGET_SECONDS = 0.001
+
+
+class FastISO(ISOBase):
+    default_timezone = "US/Central"
+
+    @lmp_config(
+        supports={Markets.REAL_TIME_5_MIN: ["latest", "today", "historical"]},
+    )
+    @support_date_range(frequency="DAY_START")
+    def get_lmp(self, date, market, locations=None, end=None, verbose=False):
+        return None
+
+
+@pytest.mark.slow
+def test_decorator_overhead_budget():
+    iso = FastISO()
+
+    latest = best_time(
+        lambda: iso.get_lmp("latest", market="REAL_TIME_5_MIN"),
+        number=200,
+        repeat=5,
+    )
+    single_date = best_time(
+        lambda: iso.get_lmp("2024-01-01", market=Markets.REAL_TIME_5_MIN),
+        number=200,
+        repeat=5,
+    )
+
+    assert latest < LATEST_CALL_BUDGET_SECONDS
+    assert single_date < SINGLE_DATE_CALL_BUDGET_SECONDS
+
+
+def test_decorators_inspect_signature_once(monkeypatch):
+    import inspect
+
+    iso = FastISO()
+    iso.get_lmp("latest", market="REAL_TIME_5_MIN")
+    iso.get_lmp("2024-01-01", market=Markets.REAL_TIME_5_MIN)
+
+    calls = []
+    signature = inspect.signature
+    monkeypatch.setattr(
+        inspect,
+        "signature",
+        lambda *args, **kwargs: calls.append(args) or signature(*args, **kwargs),
+    )
+
+    for _ in range(10):
+        iso.get_lmp("latest", market="REAL_TIME_5_MIN")
+        iso.get_lmp("2024-01-01", market=Markets.REAL_TIME_5_MIN)
+
+    assert calls == []
+
+
+def test_support_date_range_single_range_skips_progress_bar(monkeypatch):
+    import tqdm
+
+    def fail(*args, **kwargs):
+        raise AssertionError("progress bar created for a single request")
+
+    monkeypatch.setattr(tqdm, "tqdm", fail)
+
+    df = DailyISO().get_data(start="2024-01-01", end="2024-01-02")
+
+    assert df["Value"].tolist() == [1]
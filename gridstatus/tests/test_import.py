@@ -0,0 +1,81 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Time `import gridstatus` takes on top of its required dependencies (pandas,
+# requests), which are imported first so the budget only covers gridstatus itself
+IMPORT_TIME_BUDGET_SECONDS = 0.5
+
+HEAVY_MODULES = [
+    "bs4",
+    "plotly",
+    "tabula",
+    "tabulate",
+    "termcolor",
+    "xmltodict",
+    "gridstatus.caiso",
+    "gridstatus.ercot",
+    "gridstatus.pjm",
+    "gridstatus.tests",
+    "gridstatus.viz",
+]
+
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+import pandas
+import requests
+
+start = time.perf_counter()
+import gridstatus
+elapsed = time.perf_counter() - start
+
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _run_import():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules():
+    loaded = set(_run_import()["modules"])
+
+    assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+
+@pytest.mark.slow
+def test_import_time_budget():
+    # best of a few runs to avoid flakiness from a busy machine
+    elapsed = min(_run_import()["elapsed"] for _ in range(3))
+
+    assert elapsed < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_lazy_attributes():
+    import gridstatus
+    from gridstatus.caiso import CAISO
+
+    assert gridstatus.CAISO is CAISO
+    assert [iso.__name__ for iso in gridstatus.all_isos] == [
+        "NYISO",
+        "CAISO",
+        "Ercot",
+        "ISONE",
+        "MISO",
+        "SPP",
+        "PJM",
+        "IESO",
+    ]
+    assert gridstatus.get_iso("caiso") is CAISO
+    assert "PJM" in dir(gridstatus)
@@ -0,0 +1,199 @@
+import logging
+import threading
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from gridstatus.base import ISOBase
+from gridstatus.decorators import support_date_range
+from gridstatus.scheduler import PrefetchScheduler, PublishSchedule
+
+TZ = "US/Central"
+
+
+class ScheduledISO(ISOBase):
+    default_timezone = TZ
+
+    def __init__(self):
+        self.published = set()
+        self.calls = []
+        self.listings = []
+
+    @support_date_range("DAY_START")
+    def get_prices(self, date, market=None, end=None, verbose=False):
+        self.calls.append(date)
+        if date not in self.published:
+            raise ValueError("Not published yet")
+        return pd.DataFrame({"Interval Start": [date], "Price": [1.0]})
+
+    def tail(self, report_type_id, since=None):
+        self.listings.append(since)
+        # published the day before at 12:30
+        publish_dates = [
+            date - pd.DateOffset(days=1) + pd.Timedelta(hours=12, minutes=30)
+            for date in self.published
+        ]
+        docs = [SimpleNamespace(publish_date=d) for d in publish_dates if d > since]
+        return docs, since
+
+
+def _ts(value):
+    return pd.Timestamp(value, tz=TZ)
+
+
+def _scheduler(report_type_id=None, store=None):
+    schedule = PublishSchedule(
+        "prices",
+        ScheduledISO,
+        "get_prices",
+        publish_time="12:30",
+        publish_delay_days=-1,
+        kwargs={"market": "DAY_AHEAD_HOURLY"},
+        report_type_id=report_type_id,
+        lead="10min",
+        window="1h",
+        poll_interval="5min",
+    )
+    scheduler = PrefetchScheduler(schedules=[schedule], store=store)
+    return scheduler, scheduler._get_iso(schedule)
+
+
+def test_publish_schedule_dates():
+    schedule = PublishSchedule("prices", "Ercot", "get_prices", "12:30", -1)
+
+    assert schedule.expected_publish(_ts("2024-03-10"), TZ) == _ts("2024-03-09 12:30")
+    assert schedule.data_date(_ts("2024-03-09 13:00")) == _ts("2024-03-10")
+
+
+def test_prefetch_polls_method_near_publish_time():
+    scheduler, iso = _scheduler()
+    tomorrow = _ts("2024-01-02")
+    ready = []
+    scheduler.on_ready(lambda name, date, df: ready.append((name, date)))
+
+    # before the lead time, nothing is polled
+    assert scheduler.run_pending(_ts("2024-01-01 12:00")) == []
+    assert iso.calls == []
+
+    # polled but not published
+    assert scheduler.run_pending(_ts("2024-01-01 12:25")) == []
+    assert iso.calls == [tomorrow]
+
+    # not polled again until poll_interval has passed
+    iso.published.add(tomorrow)
+    assert scheduler.run_pending(_ts("2024-01-01 12:28")) == []
+    assert not scheduler.ready("prices", "2024-01-02").is_set()
+
+    assert scheduler.run_pending(_ts("2024-01-01 12:31")) == [("prices", tomorrow)]
+    assert scheduler.ready("prices", "2024-01-02").is_set()
+    assert ready == [("prices", tomorrow)]
+    assert scheduler.wait("prices", tomorrow, timeout=0)["Price"].tolist() == [1.0]
+
+    # fetched data isn't fetched again
+    scheduler.run_pending(_ts("2024-01-01 12:40"))
+    assert len(iso.calls) == 2
+
+
+def test_prefetch_polls_listing_before_fetching():
+    scheduler, iso = _scheduler(report_type_id=1)
+    tomorrow = _ts("2024-01-02")
+
+    scheduler.run_pending(_ts("2024-01-01 12:25"))
+    assert len(iso.listings) == 1
+    assert iso.calls == []
+
+    iso.published.add(tomorrow)
+    assert scheduler.run_pending(_ts("2024-01-01 12:31")) == [("prices", tomorrow)]
+    assert iso.calls == [tomorrow]
+
+
+def test_prefetch_checks_listing_for_date():
+    scheduler, iso = _scheduler(report_type_id=1)
+
+    # only the data of the day after is listed
+    iso.published.add(_ts("2024-01-03"))
+    assert scheduler.run_pending(_ts("2024-01-01 12:31")) == []
+    assert iso.calls == []
+
+
+def test_prefetch_saves_day_ahead_data_to_store(tmp_path):
+    pytest.importorskip("pyarrow")
+    from gridstatus.store import Store
+
+    store = Store(tmp_path)
+    scheduler, iso = _scheduler(store=store)
+    # tomorrow's data is published today, so its range ends in the future
+    tomorrow = pd.Timestamp.now(tz=TZ).normalize() + pd.DateOffset(days=1)
+    iso.published.add(tomorrow)
+    publish_time = scheduler.schedules["prices"].expected_publish(tomorrow, TZ)
+
+    assert scheduler.run_pending(publish_time) == [("prices", tomorrow)]
+
+    consumer = ScheduledISO()
+    df = consumer.get_prices(date=tomorrow, market="DAY_AHEAD_HOURLY", store=store)
+    assert consumer.calls == []
+    assert df["Price"].tolist() == [1.0]
+
+
+def test_prefetch_warns_only_for_polled_windows(caplog):
+    scheduler, iso = _scheduler()
+
+    # yesterday's window ended before the first run
+    with caplog.at_level(logging.WARNING, logger="gridstatus"):
+        scheduler.run_pending(_ts("2024-01-02 00:30"))
+    assert "wasn't published" not in caplog.text
+
+    scheduler.run_pending(_ts("2024-01-02 12:25"))
+    with caplog.at_level(logging.WARNING, logger="gridstatus"):
+        scheduler.run_pending(_ts("2024-01-02 14:00"))
+    assert "prices for 2024-01-03 wasn't published" in caplog.text
+
+
+def test_wait_raises_for_forgotten_data(monkeypatch):
+    scheduler, iso = _scheduler()
+    tomorrow = _ts("2024-01-02")
+    iso.published.add(tomorrow)
+    scheduler.run_pending(_ts("2024-01-01 12:31"))
+    event = scheduler.ready("prices", tomorrow)
+
+    # forgotten after wait saw the event set
+    scheduler._forget_old(_ts("2024-02-01"))
+    monkeypatch.setattr(scheduler, "ready", lambda name, date: event)
+
+    with pytest.raises(KeyError, match="forgotten"):
+        scheduler.wait("prices", tomorrow, timeout=0)
+
+
+def test_prefetch_gives_up_after_window():
+    scheduler, iso = _scheduler()
+
+    scheduler.run_pending(_ts("2024-01-01 14:00"))
+    iso.published.add(_ts("2024-01-02"))
+    scheduler.run_pending(_ts("2024-01-01 14:10"))
+
+    assert iso.calls == []
+    with pytest.raises(TimeoutError):
+        scheduler.wait("prices", "2024-01-02", timeout=0)
+
+
+def test_scheduler_thread():
+    scheduler, iso = _scheduler()
+    now = pd.Timestamp.now(tz=TZ)
+    schedule = scheduler.schedules["prices"]
+    # publishing now, for whichever date that is
+    schedule.publish_time = (now - pd.Timedelta(minutes=1)).time()
+    # in case a minute ago was yesterday
+    schedule.lead = pd.Timedelta(days=1)
+    date = schedule.data_date(now)
+    iso.published.add(date)
+
+    scheduler.tick = 0.01
+    scheduler.start()
+    try:
+        df = scheduler.wait("prices", date, timeout=5)
+    finally:
+        scheduler.stop(timeout=5)
+
+    assert df["Interval Start"].tolist() == [date]
+    assert not any(t.name == "gridstatus-prefetch" for t in threading.enumerate())
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gridstatus.base import ISOBase, NotSupported
+from gridstatus.decorators import support_date_range
+from gridstatus.schemas import DATETIME, Schema, output_schema
+
+PRICES_SCHEMA = {
+    "Interval Start": DATETIME,
+    "Location": "string",
+    "Location Type": "category",
+    "Price": "float64",
+}
+
+
+class PricesISO(ISOBase):
+    default_timezone = "US/Central"
+
+    @support_date_range(frequency="DAY_START")
+    @output_schema(PRICES_SCHEMA)
+    def get_prices(self, date, end=None, verbose=False):
+        if date.day == 2:
+            # placeholder for a day without data
+            return pd.DataFrame(columns=list(PRICES_SCHEMA))
+
+        return pd.DataFrame(
+            {
+                "Interval Start": [date, date + pd.Timedelta(hours=1)],
+                "Location": [f"HUB_{date.day}", "ZONE"],
+                "Location Type": pd.Categorical([f"Hub {date.day}", "Zone"]),
+                "Price": [date.day, 10],
+            },
+        )
+
+
+def test_cast_empty_placeholder():
+    schema = Schema(PRICES_SCHEMA, timezone="US/Central")
+
+    df = schema.cast(pd.DataFrame(columns=list(PRICES_SCHEMA)))
+
+    pd.testing.assert_series_equal(df.dtypes, schema.empty().dtypes)
+    assert isinstance(df["Location Type"].dtype, pd.CategoricalDtype)
+
+
+def test_cast_only_copies_cast_columns():
+    schema = Schema({"Time": DATETIME, "Value": "float64"}, timezone="US/Central")
+    df = pd.DataFrame(
+        {
+            "Time": pd.date_range("2024-11-03", periods=3, freq="h", tz="UTC"),
+            "Value": [1.0, 2.0, 3.0],
+            "Other": ["a", "b", "c"],
+        },
+    )
+    df.attrs["source"] = "test"
+
+    result = schema.cast(df)
+
+    assert str(result["Time"].dt.tz) == "US/Central"
+    assert np.shares_memory(result["Value"].values, df["Value"].values)
+    assert result.attrs == {"source": "test"}
+    # df isn't modified
+    assert str(df["Time"].dt.tz) == "UTC"
+    assert schema.cast(result) is result
+
+
+def test_cast_naive_timestamps_raises():
+    schema = Schema({"Time": DATETIME}, timezone="US/Central")
+
+    with pytest.raises(ValueError, match="without a timezone"):
+        schema.cast(pd.DataFrame({"Time": pd.date_range("2024-01-01", periods=2)}))
+
+
+def test_support_date_range_concatenates_with_schema():
+    df = PricesISO().get_prices(start="2024-01-01", end="2024-01-04")
+
+    pd.testing.assert_series_equal(
+        df.dtypes.astype(str),
+        PricesISO.schema("get_prices").empty().dtypes.astype(str),
+    )
+    assert df["Price"].tolist() == [1.0, 10.0, 3.0, 10.0]
+    # categories of each day are unioned rather than becoming objects
+    assert df["Location Type"].cat.categories.tolist() == ["Hub 1", "Zone", "Hub 3"]
+    assert df["Location Type"].tolist() == ["Hub 1", "Zone", "Hub 3", "Zone"]
+
+
+def test_schema_lookup():
+    schema = PricesISO.schema("get_prices")
+
+    assert schema == Schema(PRICES_SCHEMA, timezone="US/Central")
+    assert str(schema.to_arrow().field("Interval Start").type) == (
+        "timestamp[ns, tz=US/Central]"
+    )
+
+    with pytest.raises(NotSupported):
+        PricesISO.schema("get_load")
+
+
+def test_ercot_schemas():
+    import gridstatus
+
+    schema = gridstatus.Ercot.schema("get_spp")
+
+    assert list(schema.columns) == [
+        "Time",
+        "Interval Start",
+        "Interval End",
+        "Location",
+        "Location Type",
+        "Market",
+        "SPP",
+    ]
+    assert schema.timezone == gridstatus.Ercot.default_timezone
+    assert output_schema.schemas["Ercot.get_lmp"].columns["LMP"] == "float64"
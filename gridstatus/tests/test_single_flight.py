@@ -0,0 +1,110 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from gridstatus import single_flight
+from gridstatus.base import ISOBase
+from gridstatus.single_flight import SingleFlight
+
+
+def _slow(result, calls, seconds=0.2):
+    def fn():
+        calls.append(threading.get_ident())
+        time.sleep(seconds)
+        return result
+
+    return fn
+
+
+def test_concurrent_calls_share_one_result():
+    group = SingleFlight()
+    calls = []
+    result = object()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: group.do("key", _slow(result, calls)),
+                range(8),
+            ),
+        )
+
+    assert len(calls) == 1
+    assert all(r is result for r in results)
+    # nothing is kept once the call finishes
+    assert group.do("key", lambda: "new") == "new"
+
+
+def test_different_keys_are_not_shared():
+    group = SingleFlight()
+    calls = []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            executor.map(lambda k: group.do(k, _slow(k, calls)), ["a", "b"]),
+        )
+
+    assert results == ["a", "b"]
+    assert len(calls) == 2
+
+
+def test_errors_are_shared_but_not_memoized():
+    group = SingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ValueError("Broken")
+
+    def call():
+        with pytest.raises(ValueError, match="Broken"):
+            group.do("key", fail, memo_seconds=60)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: call(), range(4)))
+
+    assert len(calls) == 1
+    assert group.do("key", lambda: "ok", memo_seconds=60) == "ok"
+
+
+def test_memo_seconds():
+    group = SingleFlight()
+
+    assert group.do("key", lambda: 1, memo_seconds=0.2) == 1
+    assert group.do("key", lambda: 2, memo_seconds=0.2) == 1
+
+    time.sleep(0.3)
+
+    assert group.do("key", lambda: 3, memo_seconds=0.2) == 3
+
+
+def test_get_json_shares_concurrent_requests():
+    def get(url, **kwargs):
+        time.sleep(0.2)
+        return Mock(json=Mock(return_value={"url": url}), raise_for_status=Mock())
+
+    with patch("gridstatus.base.requests.get", side_effect=get) as mocked_get:
+        iso = ISOBase()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda _: iso._get_json("http://example.com", params={"a": 1}),
+                    range(8),
+                ),
+            )
+
+    assert mocked_get.call_count == 1
+    assert results == [{"url": "http://example.com"}] * 8
+
+
+def test_get_doesnt_share_streamed_requests():
+    with patch.object(requests, "get") as mocked_get:
+        single_flight.get("http://example.com", stream=True, memo_seconds=60)
+        single_flight.get("http://example.com", stream=True, memo_seconds=60)
+
+    assert mocked_get.call_count == 2
@@ -0,0 +1,364 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from gridstatus.base import ISOBase
+from gridstatus.decorators import support_date_range
+
+pytest.importorskip("pyarrow")
+
+from gridstatus.store import Store  # noqa: E402
+
+
+class StoreISO(ISOBase):
+    default_timezone = "US/Central"
+
+    def __init__(self):
+        self.requests = []
+
+    @support_date_range(frequency="DAY_START")
+    def get_lmp(self, date, market, locations=None, end=None, verbose=False):
+        self.requests.append(date)
+        interval_start = pd.date_range(date, periods=24, freq="h")
+        df = pd.DataFrame(
+            {
+                "Interval Start": interval_start.repeat(2),
+                "Location": ["A", "B"] * 24,
+                "Market": market,
+                "LMP": range(48),
+            },
+        )
+        return df
+
+
+def test_store_serves_covered_ranges_from_disk(tmp_path):
+    store = Store(tmp_path)
+    iso = StoreISO()
+
+    df = iso.get_lmp(
+        start="2024-01-01",
+        end="2024-01-03",
+        market="DAY_AHEAD_HOURLY",
+        store=store,
+    )
+    assert len(iso.requests) == 2
+
+    # fully covered, nothing is requested
+    df_2 = iso.get_lmp(
+        start="2024-01-01",
+        end="2024-01-03",
+        market="DAY_AHEAD_HOURLY",
+        store=store,
+    )
+    assert len(iso.requests) == 2
+    pd.testing.assert_frame_equal(df, df_2)
+
+    # only the day that isn't stored is requested
+    iso.get_lmp(
+        start="2024-01-02",
+        end="2024-01-04",
+        market="DAY_AHEAD_HOURLY",
+        store=store,
+    )
+    assert iso.requests[2:] == [pd.Timestamp("2024-01-03", tz="US/Central")]
+
+    # different arguments are a different dataset
+    iso.get_lmp("2024-01-01", market="REAL_TIME_HOURLY", store=store)
+    assert len(iso.requests) == 4
+
+    assert store.coverage(
+        "StoreISO",
+        "get_lmp",
+        {"market": "DAY_AHEAD_HOURLY", "locations": None},
+    ) == [
+        (
+            pd.Timestamp("2024-01-01", tz="US/Central"),
+            pd.Timestamp("2024-01-04", tz="US/Central"),
+        ),
+    ]
+
+
+def test_store_does_not_store_incomplete_ranges(tmp_path):
+    store = Store(tmp_path)
+    iso = StoreISO()
+
+    today = pd.Timestamp.now(tz="US/Central").normalize()
+    iso.get_lmp(today, market="DAY_AHEAD_HOURLY", store=store)
+    iso.get_lmp(today, market="DAY_AHEAD_HOURLY", store=store)
+
+    assert len(iso.requests) == 2
+    assert store.datasets().empty
+
+
+class CursorStoreISO(StoreISO):
+    @support_date_range(frequency="DAY_START")
+    def get_load(self, date, end=None, published_after_cursor=None, verbose=False):
+        self.requests.append(date)
+        hours = 24 if published_after_cursor is None else 1
+        return pd.DataFrame(
+            {
+                "Interval Start": pd.date_range(date, periods=hours, freq="h"),
+                "Load": 1.0,
+            },
+        )
+
+
+def test_store_does_not_store_requests_after_a_cursor(tmp_path):
+    store = Store(tmp_path)
+    iso = CursorStoreISO()
+    cursor = pd.Timestamp("2024-01-01 12:00", tz="US/Central")
+
+    # only files published after the cursor are returned
+    df = iso.get_load("2024-01-01", published_after_cursor=cursor, store=store)
+    assert len(df) == 1
+    assert store.datasets().empty
+
+    # the cursor isn't part of the dataset, and the full day is stored
+    iso.get_load("2024-01-01", store=store)
+    df = iso.get_load("2024-01-01", published_after_cursor=cursor, store=store)
+    assert len(df) == 1
+    assert len(iso.requests) == 3
+    assert store.dataset_params({"published_after_cursor": cursor}) == {}
+    assert store.datasets()["Params"].tolist() == [{}]
+
+
+def test_store_read_with_filters(tmp_path):
+    store = Store(tmp_path)
+    iso = StoreISO()
+
+    iso.get_lmp(
+        start="2024-01-01",
+        end="2024-01-03",
+        market="DAY_AHEAD_HOURLY",
+        store=store,
+    )
+
+    df = store.read(
+        "StoreISO",
+        "get_lmp",
+        start=pd.Timestamp("2024-01-01 12:00", tz="US/Central"),
+        end=pd.Timestamp("2024-01-02 12:00", tz="US/Central"),
+        filters={"Location": ["A"]},
+        columns=["Interval Start", "LMP"],
+    )
+
+    assert df.columns.tolist() == ["Interval Start", "LMP"]
+    assert len(df) == 24
+    assert df["Interval Start"].min() == pd.Timestamp(
+        "2024-01-01 12:00",
+        tz="US/Central",
+    )
+
+    datasets = store.datasets()
+    assert datasets["ISO"].tolist() == ["StoreISO"]
+    assert datasets["Params"].tolist() == [
+        {"locations": None, "market": "DAY_AHEAD_HOURLY"},
+    ]
+
+
+def test_store_query(tmp_path):
+    pytest.importorskip("duckdb")
+
+    store = Store(tmp_path)
+    StoreISO().get_lmp(
+        start="2024-01-01",
+        end="2024-01-03",
+        market="DAY_AHEAD_HOURLY",
+        store=store,
+    )
+
+    df = store.query(
+        "SELECT Location, COUNT(*) AS n FROM storeiso_get_lmp "
+        "GROUP BY Location ORDER BY Location",
+    )
+
+    assert df["Location"].tolist() == ["A", "B"]
+    assert df["n"].tolist() == [48, 48]
+
+
+class GappyISO(StoreISO):
+    """Returns hourly data missing hours in missing_hours of days in
+    missing_days"""
+
+    def __init__(self, missing_days=(), missing_hours=range(5, 9)):
+        super().__init__()
+        self.missing_days = set(missing_days)
+        self.missing_hours = set(missing_hours)
+
+    @support_date_range(frequency="DAY_START")
+    def get_load(self, date, end=None, verbose=False):
+        self.requests.append(date)
+        interval_start = pd.date_range(date, periods=24, freq="h")
+        if date.day in self.missing_days:
+            interval_start = interval_start[
+                ~interval_start.hour.isin(self.missing_hours)
+            ]
+        return pd.DataFrame(
+            {
+                "Interval Start": interval_start,
+                "Interval End": interval_start + pd.Timedelta(hours=1),
+                "Load": 1.0,
+            },
+        )
+
+
+def _ts(value):
+    return pd.Timestamp(value, tz="US/Central")
+
+
+def test_store_find_gaps(tmp_path):
+    store = Store(tmp_path)
+    GappyISO(missing_days={2}).get_load(
+        start="2024-01-01",
+        end="2024-01-04",
+        store=store,
+    )
+
+    assert store.coverage("GappyISO", "get_load", {}) == [
+        (_ts("2024-01-01"), _ts("2024-01-04")),
+    ]
+    assert store.find_gaps(
+        "GappyISO",
+        "get_load",
+        {},
+        _ts("2023-12-31"),
+        _ts("2024-01-05"),
+    ) == [
+        (_ts("2023-12-31"), _ts("2024-01-01")),
+        (_ts("2024-01-02 05:00"), _ts("2024-01-02 09:00")),
+        (_ts("2024-01-04"), _ts("2024-01-05")),
+    ]
+    assert (
+        store.find_gaps(
+            "GappyISO",
+            "get_load",
+            {},
+            _ts("2024-01-02 10:00"),
+            _ts("2024-01-04"),
+        )
+        == []
+    )
+
+
+def test_store_fill_gaps(tmp_path):
+    store = Store(tmp_path)
+    GappyISO(missing_days={2}).get_load(
+        start="2024-01-01",
+        end="2024-01-04",
+        store=store,
+    )
+
+    # the day with missing hours is covered, so it isn't requested again
+    iso = GappyISO()
+    iso.get_load(start="2024-01-01", end="2024-01-04", store=store)
+    assert iso.requests == []
+
+    df = iso.get_load(
+        start="2024-01-01",
+        end="2024-01-05",
+        store=store,
+        fill_gaps=True,
+    )
+
+    # only days with gaps are requested
+    assert iso.requests == [_ts("2024-01-02"), _ts("2024-01-04")]
+    assert len(df) == 4 * 24
+    assert (
+        store.find_gaps(
+            "GappyISO",
+            "get_load",
+            {},
+            _ts("2024-01-01"),
+            _ts("2024-01-05"),
+        )
+        == []
+    )
+
+    with pytest.raises(ValueError, match="requires a store"):
+        iso.get_load("2024-01-01", fill_gaps=True)
+
+
+class JitteredISO(StoreISO):
+    """Returns 5 minute data with times a few seconds off the interval, like
+    SCED timestamps"""
+
+    @support_date_range(frequency="DAY_START")
+    def get_sced(self, date, end=None, verbose=False):
+        self.requests.append(date)
+        times = pd.date_range(date, periods=288, freq="5min")
+        jitter = pd.to_timedelta([(i * 7) % 11 - 5 for i in range(288)], unit="s")
+        return pd.DataFrame({"Time": times + jitter, "Value": 1.0})
+
+
+def test_store_find_gaps_with_jittered_times(tmp_path):
+    store = Store(tmp_path)
+    JitteredISO().get_sced(start="2024-01-01", end="2024-01-03", store=store)
+
+    assert (
+        store.find_gaps(
+            "JitteredISO",
+            "get_sced",
+            {},
+            _ts("2024-01-01"),
+            _ts("2024-01-03"),
+        )
+        == []
+    )
+
+    iso = JitteredISO()
+    iso.get_sced(start="2024-01-01", end="2024-01-03", store=store, fill_gaps=True)
+    assert iso.requests == []
+
+
+def test_store_fill_gaps_stops_for_ranges_without_data(tmp_path):
+    store = Store(tmp_path)
+    # hours 5 to 8 of every day never have data
+    iso = GappyISO(missing_days={1, 2})
+    iso.get_load(start="2024-01-01", end="2024-01-03", store=store)
+
+    # refetched once, since the data may have been published late
+    iso.get_load(start="2024-01-01", end="2024-01-03", store=store, fill_gaps=True)
+    assert len(iso.requests) == 4
+    assert store.empty_coverage("GappyISO", "get_load", {}) == [
+        (_ts("2024-01-01 05:00"), _ts("2024-01-01 09:00")),
+        (_ts("2024-01-02 05:00"), _ts("2024-01-02 09:00")),
+    ]
+
+    # still empty after the refetch, so they aren't gaps anymore
+    df = iso.get_load(
+        start="2024-01-01",
+        end="2024-01-03",
+        store=store,
+        fill_gaps=True,
+    )
+    assert len(iso.requests) == 4
+    assert len(df) == 2 * 20
+
+
+def test_store_concurrent_writes_keep_every_range(tmp_path):
+    store = Store(tmp_path)
+    days = pd.date_range("2024-01-01", periods=30, freq="D", tz="US/Central")
+    barrier = threading.Barrier(len(days))
+
+    def write(day):
+        df = pd.DataFrame(
+            {
+                "Interval Start": [day],
+                "Interval End": [day + pd.DateOffset(days=1)],
+                "Load": 1.0,
+            },
+        )
+        barrier.wait()
+        store.write("StoreISO", "get_load", {}, day, day + pd.DateOffset(days=1), df)
+
+    threads = [threading.Thread(target=write, args=(day,)) for day in days]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.coverage("StoreISO", "get_load", {}) == [
+        (days[0], days[-1] + pd.DateOffset(days=1)),
+    ]
+    assert store.find_gaps("StoreISO", "get_load", {}, days[0], days[-1]) == []
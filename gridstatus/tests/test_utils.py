@@ -1,8 +1,31 @@
+import io
+import os
+import time
+import warnings
+import zipfile
+from unittest.mock import patch
+
 import pandas as pd
+import pytest
+import requests
 import time_machine
 
 import gridstatus
-from gridstatus.utils import is_dst_end, is_today, is_yesterday
+from gridstatus.base import ISOBase, NotSupported
+from gridstatus.utils import (
+    download_to_file,
+    fetch_all,
+    filter_rows,
+    get_zip_folder,
+    is_dst_end,
+    is_today,
+    is_yesterday,
+    location_filters,
+    read_csv_filtered,
+    read_zip_csvs,
+    spool_response,
+    write_atomic,
+)
 
 
 def test_is_dst_end():
@@ -154,3 +177,284 @@ def test_is_yesterday():
             start_of_utc_yesterday + pd.DateOffset(days=1) + pd.Timedelta(hours=6),
             tz=central_timezone,
         )
+
+
+class FastISO(ISOBase):
+    name = "Fast ISO"
+
+    def get_fuel_mix(self, date, verbose=False):
+        return pd.DataFrame({"Time": [pd.Timestamp(date)], "Solar": [1.0]})
+
+
+class SlowISO(ISOBase):
+    name = "Slow ISO"
+
+    def get_fuel_mix(self, date, verbose=False):
+        time.sleep(1)
+        return pd.DataFrame({"Time": [pd.Timestamp(date)], "Solar": [2.0]})
+
+
+class BrokenISO(ISOBase):
+    name = "Broken ISO"
+
+    def get_fuel_mix(self, date, verbose=False):
+        raise ValueError("Broken")
+
+
+class NoFuelMixISO(ISOBase):
+    name = "No Fuel Mix ISO"
+
+
+class MisconfiguredISO(FastISO):
+    name = "Misconfigured ISO"
+
+    def __init__(self):
+        raise ValueError("api_key must be provided")
+
+
+def test_fetch_all():
+    isos = [FastISO, SlowISO, BrokenISO, NoFuelMixISO]
+
+    results = fetch_all("get_fuel_mix", "2024-01-01", isos=isos)
+    assert list(results) == ["FastISO", "SlowISO"]
+
+    df = fetch_all("get_fuel_mix", date="2024-01-01", isos=isos, concat=True)
+    assert df["ISO"].tolist() == ["Fast ISO", "Slow ISO"]
+    assert df["Solar"].tolist() == [1.0, 2.0]
+
+    with pytest.raises(ValueError, match="Broken"):
+        fetch_all("get_fuel_mix", "2024-01-01", isos=isos, errors="raise")
+
+    with pytest.raises(NotSupported):
+        fetch_all("get_fuel_mix", "2024-01-01", isos=[NoFuelMixISO])
+
+
+def test_fetch_all_iso_that_cannot_be_created():
+    results = fetch_all(
+        "get_fuel_mix",
+        "2024-01-01",
+        isos=[MisconfiguredISO, FastISO],
+    )
+    assert list(results) == ["FastISO"]
+
+    with pytest.raises(ValueError, match="api_key"):
+        fetch_all(
+            "get_fuel_mix",
+            "2024-01-01",
+            isos=[MisconfiguredISO],
+            errors="raise",
+        )
+
+
+def test_fetch_all_timeout():
+    start = time.monotonic()
+    results = fetch_all(
+        "get_fuel_mix",
+        "2024-01-01",
+        isos=[FastISO, SlowISO],
+        timeout=0.1,
+    )
+
+    assert list(results) == ["FastISO"]
+    assert time.monotonic() - start < 1
+
+    with pytest.raises(TimeoutError):
+        fetch_all(
+            "get_fuel_mix",
+            "2024-01-01",
+            isos=[SlowISO],
+            timeout=0.1,
+            errors="raise",
+        )
+
+
+def test_fetch_all_timeout_is_per_iso():
+    # with one worker, FastISO is queued behind SlowISO but still gets the
+    # whole timeout once it starts
+    results = fetch_all(
+        "get_fuel_mix",
+        "2024-01-01",
+        isos=[SlowISO, FastISO],
+        timeout=0.3,
+        n_workers=1,
+    )
+
+    assert list(results) == ["FastISO"]
+
+
+def test_fetch_all_concat_every_iso_failed():
+    df = fetch_all("get_fuel_mix", "2024-01-01", isos=[BrokenISO], concat=True)
+
+    assert df.empty
+    assert df.columns.tolist() == ["ISO"]
+
+
+def test_write_atomic(tmp_path):
+    path = str(tmp_path / "data.json")
+
+    def write(tmp):
+        with open(tmp, "w") as f:
+            f.write("1")
+
+    def fail(tmp):
+        write(tmp)
+        raise ValueError("failed")
+
+    write_atomic(path, write)
+
+    with pytest.raises(ValueError):
+        write_atomic(path, fail)
+
+    # the previous file is kept and the partial file removed
+    assert open(path).read() == "1"
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def _locations_csv(n_rows):
+    rows = [f"LOC{i % 7},{i % 3},{i}" for i in range(n_rows)]
+    return "Location,Type,Value\n" + "\n".join(rows) + "\n"
+
+
+def test_read_csv_filtered():
+    csv = _locations_csv(1000)
+    full = pd.read_csv(io.StringIO(csv))
+
+    df = read_csv_filtered(
+        io.StringIO(csv),
+        filters={"Location": {"LOC1", "LOC5"}, "Type": [0, 2]},
+        chunksize=64,
+    )
+
+    expected = full[full["Location"].isin(["LOC1", "LOC5"]) & full["Type"].isin([0, 2])]
+    pd.testing.assert_frame_equal(df, expected.reset_index(drop=True))
+
+    # filters on columns the file doesn't have are ignored
+    df = read_csv_filtered(
+        io.StringIO(csv),
+        filters={"Location": ["LOC1"], "Location Name": ["LOC2"]},
+        chunksize=64,
+    )
+    assert df["Location"].unique().tolist() == ["LOC1"]
+
+    pd.testing.assert_frame_equal(read_csv_filtered(io.StringIO(csv)), full)
+
+
+def test_read_csv_filtered_no_matches():
+    df = read_csv_filtered(
+        io.StringIO(_locations_csv(100)),
+        filters={"Location": ["MISSING"]},
+        chunksize=10,
+    )
+
+    assert df.empty
+    assert df.columns.tolist() == ["Location", "Type", "Value"]
+
+
+def test_location_filters():
+    assert location_filters("ALL") is None
+    assert location_filters(None) is None
+    assert location_filters(["A", "B"], "Node") == {"Node": {"A", "B"}}
+
+    df = pd.DataFrame({"Node": ["A", "B", "C"]})
+    assert filter_rows(df, location_filters(["A", "C"], "Node"))["Node"].tolist() == [
+        "A",
+        "C",
+    ]
+    assert filter_rows(df, None) is df
+
+
+def _streamed_response(content, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    return response
+
+
+def test_spool_response():
+    content = b"x" * 1000
+
+    small = spool_response(_streamed_response(content), max_memory=2000)
+    large = spool_response(_streamed_response(content), max_memory=500)
+
+    assert not small._rolled
+    # moved to a file on disk once larger than max_memory
+    assert large._rolled
+    assert small.read() == large.read() == content
+
+
+def test_get_zip_folder_streams_to_file():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as z:
+        z.writestr("a.csv", _locations_csv(100))
+
+    with patch.object(
+        requests,
+        "get",
+        return_value=_streamed_response(buffer.getvalue()),
+    ) as get:
+        z = get_zip_folder("https://example.com/a.zip")
+
+    assert get.call_args.kwargs["stream"] is True
+    assert z.namelist() == ["a.csv"]
+    pd.testing.assert_frame_equal(
+        pd.read_csv(z.open("a.csv")),
+        pd.read_csv(io.StringIO(_locations_csv(100))),
+    )
+
+
+def test_download_to_file_raises_for_status():
+    with patch.object(
+        requests,
+        "get",
+        return_value=_streamed_response(b"Not Found", status_code=404),
+    ):
+        with pytest.raises(requests.HTTPError):
+            download_to_file("https://example.com/a.zip")
+
+
+def _zip_of_csvs(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as z:
+        for name, content in files.items():
+            z.writestr(name, content)
+    buffer.seek(0)
+    return zipfile.ZipFile(buffer)
+
+
+def test_read_zip_csvs_keeps_member_order():
+    files = {f"{i:02d}.csv": f"Time,MW\n{i},{i}.5\n" for i in range(20)}
+    files["readme.txt"] = "not a csv"
+    z = _zip_of_csvs(files)
+
+    dfs = read_zip_csvs(
+        z,
+        process_csv=lambda df, name: df.assign(File=name),
+        max_workers=4,
+    )
+
+    assert [df["File"].item() for df in dfs] == [f"{i:02d}.csv" for i in range(20)]
+    assert [df["Time"].item() for df in dfs] == list(range(20))
+
+
+def test_read_zip_csvs_dtype_prevents_upcast():
+    z = _zip_of_csvs(
+        {
+            "a.csv": "Time,MW\n2024-01-01,1\n",
+            "b.csv": "Time,MW\n",
+            "c.csv": "Time,MW\n2024-01-02,2.5\n",
+        },
+    )
+
+    inferred = read_zip_csvs(z)
+    declared = read_zip_csvs(z, dtype={"MW": "float64", "Other": "float64"})
+
+    # a file without rows has object columns, which concat upcasts to
+    assert inferred[1]["MW"].dtype == object
+    assert [df["MW"].dtype for df in declared] == ["float64"] * 3
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        df = pd.concat(declared, ignore_index=True)
+
+    assert df["MW"].dtype == "float64"
+    assert df["MW"].tolist() == [1.0, 2.5]
@@ -1,6 +1,11 @@
+import concurrent.futures
+import functools
 import glob
 import io
 import os
+import tempfile
+import threading
+import time
 from zipfile import ZipFile
 
 import pandas as pd
@@ -8,35 +13,48 @@ import requests
 import tqdm
 
 import gridstatus
-from gridstatus.base import Markets, NotSupported, _interconnection_columns
-from gridstatus.caiso import CAISO
-from gridstatus.ercot import Ercot
-from gridstatus.gs_logging import log
-from gridstatus.ieso import IESO
-from gridstatus.isone import ISONE
+from gridstatus.base import ISOBase, Markets, NotSupported, _interconnection_columns
+from gridstatus.gs_logging import log, logger
 from gridstatus.lmp_config import lmp_config
-from gridstatus.miso import MISO
-from gridstatus.nyiso import NYISO
-from gridstatus.pjm import PJM
-from gridstatus.spp import SPP
 
 GREEN_CHECKMARK_HTML_ENTITY = "&#x2705;"
 
 RED_X_HTML_ENTITY = "&#10060;"
-all_isos = [MISO, CAISO, PJM, Ercot, SPP, NYISO, ISONE, IESO]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_all_isos():
+    """Import the ISO classes on first use rather than when utils is imported,
+    since every ISO module itself depends on utils"""
+    from gridstatus.caiso import CAISO
+    from gridstatus.ercot import Ercot
+    from gridstatus.ieso import IESO
+    from gridstatus.isone import ISONE
+    from gridstatus.miso import MISO
+    from gridstatus.nyiso import NYISO
+    from gridstatus.pjm import PJM
+    from gridstatus.spp import SPP
+
+    return (MISO, CAISO, PJM, Ercot, SPP, NYISO, ISONE, IESO)
+
+
+def __getattr__(name):
+    if name == "all_isos":
+        return list(_get_all_isos())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def list_isos():
     """List available ISOs"""
 
-    isos = [[i.name, i.iso_id, i.__name__] for i in all_isos]
+    isos = [[i.name, i.iso_id, i.__name__] for i in _get_all_isos()]
 
     return pd.DataFrame(isos, columns=["Name", "Id", "Class"])
 
 
 def get_iso(iso_id):
     """Get an ISO by its id"""
-    for i in all_isos:
+    for i in _get_all_isos():
         if i.iso_id == iso_id:
             return i
 
@@ -79,7 +97,7 @@ def make_availability_df():
                 availability[i.__name__][method][date] = is_defined
 
     availability_dfs = {}
-    for i in all_isos:
+    for i in _get_all_isos():
         availability_dfs[i.__name__] = pd.DataFrame(availability[i.__name__])
 
     return availability_dfs
@@ -108,7 +126,8 @@ def _handle_date(
         date = pd.Timestamp.now(tz=tz).normalize()
 
     if not isinstance(date, pd.Timestamp):
-        date = pd.to_datetime(date)
+        # much faster than pd.to_datetime for a single date
+        date = pd.Timestamp(date).as_unit("ns")
 
     if tz:
         if date.tzinfo is None:
@@ -199,17 +218,124 @@ def filter_lmp_locations(df, locations=None, location_type=None):
     return df
 
 
+# Rows parsed at a time by read_csv_filtered
+FILTER_CHUNK_SIZE = 100_000
+
+
+def location_filters(locations, column="Location"):
+    """Filters for read_csv_filtered that keep rows for locations, which can be a
+    list, "ALL" or None
+
+    Arguments:
+        locations: "ALL" or list of locations to keep
+        column (str): name of the column with the location in the raw file
+    """
+    if locations == "ALL" or locations is None:
+        return None
+
+    return {column: set(locations)}
+
+
+def read_csv_filtered(
+    filepath_or_buffer,
+    filters=None,
+    chunksize=FILTER_CHUNK_SIZE,
+    **kwargs,
+):
+    """Reads a csv, keeping only rows where each column in filters has one of its
+    values.
+
+    The file is parsed in chunks and each chunk is filtered before the next one
+    is read, so memory scales with the rows kept rather than the whole file.
+    Columns in filters that aren't in the file are ignored.
+
+    Arguments:
+        filepath_or_buffer: anything accepted by pandas.read_csv
+        filters (dict, optional): column name to values to keep. If None,
+            the whole file is read.
+        chunksize (int): rows parsed at a time
+        **kwargs: passed to pandas.read_csv
+    """
+    if not filters:
+        return pd.read_csv(filepath_or_buffer, **kwargs)
+
+    chunks = []
+    with pd.read_csv(filepath_or_buffer, chunksize=chunksize, **kwargs) as reader:
+        for chunk in reader:
+            chunks.append(filter_rows(chunk, filters))
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+def filter_rows(df, filters=None):
+    """Keeps rows of df where each column in filters has one of its values.
+    Columns in filters that aren't in df are ignored.
+
+    Arguments:
+        df (pandas.DataFrame): DataFrame to filter
+        filters (dict, optional): column name to values to keep
+    """
+    mask = None
+    for column, values in (filters or {}).items():
+        if column not in df.columns:
+            continue
+        column_mask = df[column].isin(values)
+        mask = column_mask if mask is None else mask & column_mask
+
+    return df if mask is None else df[mask]
+
+
+# Downloads larger than this are spooled to a temporary file on disk
+SPOOL_MAX_MEMORY_BYTES = 32 * 1024 * 1024
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def spool_response(
+    r: requests.Response,
+    max_memory: int = SPOOL_MAX_MEMORY_BYTES,
+) -> tempfile.SpooledTemporaryFile:
+    """Writes the body of a response to a file that is kept in memory until it
+    is larger than max_memory bytes and moved to a temporary file on disk after
+    that. The body is read in chunks, so it's never held in memory as a whole if
+    the request was made with stream=True. The file is positioned at its start.
+    """
+    f = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    with r:
+        for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+    f.seek(0)
+    return f
+
+
+def download_to_file(url, verbose=False, **kwargs) -> tempfile.SpooledTemporaryFile:
+    """Downloads url with spool_response. Raises for HTTP error codes.
+
+    Arguments:
+        url (str): url to download
+        verbose (bool): print the url
+        **kwargs: passed to requests.get
+    """
+    msg = f"Requesting {url}"
+    log(msg, verbose)
+    r = requests.get(url, stream=True, **kwargs)
+    try:
+        r.raise_for_status()
+    except requests.HTTPError:
+        r.close()
+        raise
+    return spool_response(r)
+
+
 def get_zip_file(url, verbose=False):
     z = get_zip_folder(url, verbose=verbose)
     return z.open(z.namelist()[0])
 
 
 def get_zip_folder(url, verbose=False, **kwargs):
-    msg = f"Requesting {url}"
-    log(msg, verbose)
-    r = requests.get(url, **kwargs)
-    z = ZipFile(io.BytesIO(r.content))
-    return z
+    """Downloads a zip file. Members are decompressed as they are read, e.g.
+    with ``z.open(name)``, rather than all at once."""
+    return ZipFile(download_to_file(url, verbose=verbose, **kwargs))
 
 
 def get_response_blob(resp: requests.Response) -> io.BytesIO:
@@ -218,33 +344,113 @@ def get_response_blob(resp: requests.Response) -> io.BytesIO:
     return io.BytesIO(resp.content)
 
 
+# Zip members parsed at once by read_zip_csvs
+ZIP_PARSE_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def read_zip_csvs(
+    z: ZipFile,
+    names: list[str] | None = None,
+    dtype: dict | None = None,
+    process_csv=None,
+    max_workers: int = ZIP_PARSE_MAX_WORKERS,
+    **kwargs,
+) -> list[pd.DataFrame]:
+    """Reads CSV members of a zip file in a thread pool.
+
+    Members are decompressed and parsed concurrently, which pandas does mostly
+    without holding the GIL. Declaring dtype keeps each column's type the same
+    in every file, so concatenating them doesn't upcast, e.g. to object when a
+    file has no rows.
+
+    Arguments:
+        z (ZipFile): zip file to read
+        names (list[str], optional): members to read. Defaults to every
+            ".csv" member.
+        dtype (dict, optional): column types passed to pandas.read_csv. Columns
+            that aren't in a file are ignored.
+        process_csv (callable, optional): called with each DataFrame and its
+            member name, returning the DataFrame to use
+        max_workers (int): number of members read at once
+        **kwargs: passed to pandas.read_csv
+
+    Returns:
+        list[pandas.DataFrame]: one DataFrame per member, in the order of names
+    """
+    if names is None:
+        names = [name for name in z.namelist() if name.endswith(".csv")]
+
+    # ZipFile.open isn't thread safe, but reading opened members is
+    open_lock = threading.Lock()
+
+    def _read(name):
+        with open_lock:
+            f = z.open(name)
+        with f:
+            df = pd.read_csv(f, dtype=dtype, **kwargs)
+        if process_csv:
+            df = process_csv(df, name)
+        return df
+
+    if max_workers <= 1 or len(names) <= 1:
+        return [_read(name) for name in names]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_read, names))
+
+
 def download_csvs_from_zip_url(
     url,
     process_csv=None,
     verbose=False,
     strip_whitespace_from_cols=False,
+    dtype=None,
 ):
     z = get_zip_folder(url, verbose=verbose)
 
-    all_dfs = []
-
-    for f in z.filelist:
-        if f.filename.endswith(".csv"):
-            df = pd.read_csv(z.open(f.filename))
-            if process_csv:
-                df = process_csv(df, f.filename)
+    all_dfs = read_zip_csvs(z, dtype=dtype, process_csv=process_csv)
 
-            if strip_whitespace_from_cols:
-                # Some data files have leading whitespace in header - remove it
-                df = df.rename(columns=lambda x: x.strip())
-
-            all_dfs.append(df)
+    if strip_whitespace_from_cols:
+        # Some data files have leading whitespace in header - remove it
+        all_dfs = [df.rename(columns=lambda x: x.strip()) for df in all_dfs]
 
     df = pd.concat(all_dfs, ignore_index=True)
 
     return df
 
 
+def require_pyarrow(feature: str) -> None:
+    """Raises an ImportError naming feature if pyarrow isn't installed"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            f"{feature} requires pyarrow. Install it with `pip install pyarrow`",
+        )
+
+
+def write_atomic(path: str, write) -> None:
+    """Writes a file by calling write with a temporary path in the same folder
+    and renaming it to path, so readers never see a partially written file.
+
+    Example:
+        write_atomic(path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=os.path.basename(path) + ".",
+        suffix=".tmp",
+    )
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def is_today(date: str | pd.Timestamp, tz: str) -> bool:
     return _handle_date(date, tz=tz).date() == pd.Timestamp.now(tz=tz).date()
 
@@ -323,20 +529,259 @@ def load_folder(path, time_zone=None, verbose=True):
     return data
 
 
-def get_interconnection_queues():
-    """Get interconnection queue data for all ISOs"""
-    all_queues = []
-    for iso in tqdm.tqdm(all_isos):
-        iso = iso()
-        # only shared columns
-        queue = iso.get_interconnection_queue()[_interconnection_columns]
-        queue.insert(0, "ISO", iso.name)
-        queue.reset_index(drop=True, inplace=True)
-        all_queues.append(queue)
-        pd.concat(all_queues)
-
-    all_queues = pd.concat(all_queues).reset_index(drop=True)
-    return all_queues
+def supports_method(iso, method_name):
+    """Whether an ISO class or instance implements a method"""
+    method = getattr(iso, method_name, None)
+    if method is None:
+        return False
+
+    # methods only defined on ISOBase raise NotImplementedError
+    base_method = getattr(ISOBase, method_name, None)
+    return getattr(method, "__func__", method) is not base_method
+
+
+def fetch_all(
+    method_name,
+    *args,
+    isos=None,
+    timeout=None,
+    n_workers=None,
+    concat=False,
+    errors="ignore",
+    verbose=False,
+    **kwargs,
+):
+    """Call the same method on every ISO that supports it concurrently
+
+    Example:
+        # today's fuel mix from every ISO, one DataFrame per ISO
+        fuel_mix = gridstatus.fetch_all("get_fuel_mix", date="today")
+
+    Arguments:
+        method_name (str): name of the method to call, e.g. "get_fuel_mix"
+        *args: positional arguments passed to the method
+        isos (list, optional): ISO classes or instances to call.
+            Defaults to all ISOs.
+        timeout (float, optional): seconds to wait for each ISO, counted
+            from when its request starts, so ISOs queued behind n_workers
+            get the full timeout. ISOs that take longer are treated as errors.
+            The request isn't cancelled and keeps running in the background.
+            Defaults to no timeout.
+        n_workers (int, optional): number of ISOs to fetch at the same time.
+            Defaults to all of them.
+        concat (bool, optional): if True, return one DataFrame with an "ISO"
+            column containing the ISO name instead of a dictionary.
+            Defaults to False.
+        errors (str, optional): "ignore" to log ISOs that fail and return the
+            others, or "raise" to raise the first error. Defaults to "ignore".
+        verbose (bool, optional): show a progress bar. Defaults to False.
+        **kwargs: keyword arguments passed to the method
+
+    Returns:
+        dict or pandas.DataFrame: dictionary of ISO class name to result for
+        every ISO that succeeded, or a DataFrame if concat is True. The
+        DataFrame only has an "ISO" column if every ISO failed.
+    """
+    if errors not in ["ignore", "raise"]:
+        raise ValueError(f"Invalid value for errors: {errors}")
+
+    if isos is None:
+        isos = _get_all_isos()
+
+    # classes are created in their ISO's task, so an ISO that can't be created,
+    # e.g. without an API key, only fails its own call
+    isos = [iso for iso in isos if supports_method(iso, method_name)]
+
+    if not isos:
+        raise NotSupported(f"No ISO supports {method_name}")
+
+    outcomes = _call_concurrently(
+        isos,
+        method_name,
+        args,
+        kwargs,
+        timeout=timeout,
+        n_workers=n_workers or len(isos),
+        errors=errors,
+        verbose=verbose,
+    )
+
+    # in the order of isos so results are deterministic
+    results = {}
+    for iso in isos:
+        name = _iso_class_name(iso)
+        outcome = outcomes[iso]
+        if not isinstance(outcome, Exception):
+            results[name] = outcome
+        elif isinstance(outcome, TimeoutError):
+            logger.warning(str(outcome))
+        else:
+            logger.warning(f"{name}.{method_name} failed: {outcome!r}")
+
+    if not concat:
+        return results
+
+    if not results:
+        logger.warning(f"No ISO returned data for {method_name}")
+        return pd.DataFrame(columns=["ISO"])
+
+    names = {_iso_class_name(iso): iso.name for iso in isos}
+    dfs = []
+    for class_name, df in results.items():
+        df = df.reset_index(drop=True)
+        df.insert(0, "ISO", names[class_name])
+        dfs.append(df)
+
+    return pd.concat(dfs).reset_index(drop=True)
+
+
+def _iso_class_name(iso):
+    """Class name of an ISO class or instance"""
+    return iso.__name__ if isinstance(iso, type) else iso.__class__.__name__
+
+
+# How often _call_concurrently checks for calls that started, so their timeouts
+# begin when they start rather than when they are queued
+_START_POLL_SECONDS = 0.05
+
+
+def _call_concurrently(
+    isos,
+    method_name,
+    args,
+    kwargs,
+    timeout,
+    n_workers,
+    errors,
+    verbose,
+):
+    """Calls method_name on every ISO with at most n_workers at the same time.
+    ISO classes are created in the call, so errors creating them are the
+    ISO's outcome.
+
+    Each call's timeout starts when it starts running. Calls that time out
+    aren't cancelled and keep running in the background, but stop counting
+    against n_workers so the ISOs queued behind them still start.
+
+    Returns:
+        dict: ISO to its result, or to the exception it raised
+    """
+    slots = threading.Semaphore(n_workers)
+    lock = threading.Lock()
+    started = {}
+    released = set()
+    finished = threading.Event()
+
+    def release(iso):
+        with lock:
+            if iso in released:
+                return
+            released.add(iso)
+        slots.release()
+
+    def call(iso):
+        slots.acquire()
+        if finished.is_set():
+            # e.g. another ISO raised with errors="raise"
+            release(iso)
+            return None
+        with lock:
+            started[iso] = time.monotonic()
+        try:
+            instance = iso if isinstance(iso, ISOBase) else iso()
+            return getattr(instance, method_name)(*args, **kwargs)
+        finally:
+            release(iso)
+
+    outcomes = {}
+    # every call has its own thread so slots, not the pool, limit concurrency
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(isos))
+    progress = tqdm.tqdm(total=len(isos), disable=not verbose)
+    try:
+        futures = {executor.submit(call, iso): iso for iso in isos}
+        pending = set(futures)
+
+        while pending:
+            wait = None
+            if timeout is not None:
+                with lock:
+                    deadlines = [
+                        started[futures[f]] + timeout
+                        for f in pending
+                        if futures[f] in started
+                    ]
+                if deadlines:
+                    wait = max(0, min(deadlines) - time.monotonic())
+                if len(deadlines) < len(pending):
+                    wait = min(
+                        _START_POLL_SECONDS if wait is None else wait,
+                        _START_POLL_SECONDS,
+                    )
+
+            done, pending = concurrent.futures.wait(
+                pending,
+                timeout=wait,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+            for future in done:
+                iso = futures[future]
+                error = future.exception()
+                if error is not None and errors == "raise":
+                    raise error
+                outcomes[iso] = error if error is not None else future.result()
+                progress.update()
+
+            if timeout is None:
+                continue
+
+            now = time.monotonic()
+            for future in list(pending):
+                iso = futures[future]
+                with lock:
+                    expired = iso in started and now >= started[iso] + timeout
+                if not expired:
+                    continue
+
+                error = TimeoutError(
+                    f"{_iso_class_name(iso)}.{method_name} timed out",
+                )
+                if errors == "raise":
+                    raise error
+                pending.discard(future)
+                release(iso)
+                outcomes[iso] = error
+                progress.update()
+    finally:
+        finished.set()
+        progress.close()
+        # don't wait for requests that timed out
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return outcomes
+
+
+def get_interconnection_queues(errors="raise", timeout=None, verbose=True):
+    """Get interconnection queue data for all ISOs
+
+    Arguments:
+        errors (str, optional): "raise" to raise if any ISO fails or "ignore"
+            to return the queues of the ISOs that succeeded.
+            Defaults to "raise".
+        timeout (float, optional): seconds to wait for each ISO.
+            Defaults to no timeout.
+        verbose (bool, optional): show a progress bar. Defaults to True.
+    """
+    all_queues = fetch_all(
+        "get_interconnection_queue",
+        concat=True,
+        errors=errors,
+        timeout=timeout,
+        verbose=verbose,
+    )
+
+    # only shared columns
+    return all_queues.reindex(columns=["ISO"] + _interconnection_columns)
 
 
 def move_cols_to_front(df, cols_to_move):